@@ -24,6 +24,7 @@ sys.path.insert(0, str(ROOT_DIR / "models" / "utils"))
 import numpy as np
 import pandas as pd
 from exposure_calculation import calculate_importance_weighted_exposure
+from model_config import DEFAULT_CONFIG
 
 # --- CONFIGURATION ---
 DATA_DIR = ROOT_DIR / "data"
@@ -31,8 +32,8 @@ CROSSWALK_FILE = DATA_DIR / "processed" / "master_task_crosswalk_with_importance
 OUTPUT_DIR = Path(__file__).parent / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-# Model parameter
-SIGMA = 1.5  # Elasticity of substitution between tasks
+# Model parameter (σ=1.5, elasticity of substitution between tasks)
+CONFIG = DEFAULT_CONFIG
 
 
 def load_crosswalk():
@@ -40,7 +41,7 @@ def load_crosswalk():
     return pd.read_csv(CROSSWALK_FILE)
 
 
-def acemoglu_restrepo_model(occ):
+def acemoglu_restrepo_model(occ, config=CONFIG):
     """
     Estimate Acemoglu-Restrepo task displacement model.
 
@@ -78,13 +79,14 @@ def acemoglu_restrepo_model(occ):
     emp_weighted = (occ['emp_share'] * occ['ai_exposure']).sum()
 
     # Wage effect using A-R formula
-    wage_effect = -((SIGMA - 1) / SIGMA) * task_displacement
+    sigma = config.sigma
+    wage_effect = -((sigma - 1) / sigma) * task_displacement
 
     return {
         'task_displacement_share': task_displacement,
         'emp_weighted_exposure': emp_weighted,
         'wage_effect': wage_effect,
-        'sigma': SIGMA,
+        'sigma': sigma,
         'total_wage_bill': total_wage_bill,
         'exposure_max': exposure_max,
         'exposure_mean': exposure_mean
@@ -100,7 +102,7 @@ def save_results(results, occ):
     summary = pd.DataFrame({
         'Metric': [
             'Wage-weighted task displacement',
-            f'Implied wage effect (σ={SIGMA}, index-scaled)',
+            f"Implied wage effect (σ={results['sigma']}, index-scaled)",
             'Employment-weighted exposure',
             'Exposure max (sanity check)',
             'Exposure mean',
@@ -135,11 +137,11 @@ def save_results(results, occ):
     return summary
 
 
-def main():
+def main(config=CONFIG):
     """Run Acemoglu-Restrepo model."""
     df = load_crosswalk()
     occ = calculate_importance_weighted_exposure(df)
-    results, occ = acemoglu_restrepo_model(occ)
+    results, occ = acemoglu_restrepo_model(occ, config)
     summary = save_results(results, occ)
     return results, summary
 
@@ -0,0 +1,149 @@
+"""
+Acemoglu-Restrepo Empirical Validation: EVENT STUDY
+===================================================
+
+Addresses the DiD design's main limitation (one pre-period, so parallel
+trends cannot be tested) by estimating leads and lags of exposure × year
+on a multi-year OES wage panel:
+
+    ln(w_it) = α_i + λ_t + Σ_{k ≠ 2022} β_k · Exposure_i · 1[t = k] + ε_it
+
+- α_i, λ_t: occupation and year fixed effects (absorbed, not dummies)
+- β_k, k < 2022: leads. Jointly zero under parallel pre-trends (Wald test)
+- β_k, k ≥ 2023: lags. Effect of exposure after LLM release, relative to 2022
+- Standard errors clustered by SOC
+
+Exposure is the importance-weighted measure (continuous) and its
+above-median indicator. The default panel (wage_panel_2022_2024.csv) has
+no pre-2022 years, so only lags are estimated; pass a longer OES panel in
+the same long format (soc_code, year, wage_annual_mean, employment,
+occ_title) with --wage-panel to test pre-trends.
+
+Usage:
+    python empirical_validation_event_study.py
+    python empirical_validation_event_study.py --wage-panel ../../data/processed/wage_panel_2015_2024.csv
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add models/utils to path
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "models" / "utils"))
+
+from event_study import EVENT_YEAR, coefficient_table, event_study, render_event_study_figure
+from run_store import record_run
+from wage_validation import CROSSWALK_FILE, WAGE_PANEL_FILE, load_exposure, load_wage_panel, merge_exposure, \
+    wage_long
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+EXPOSURES = ['ai_exposure', 'high_exposure']
+OUTCOMES = ['ln_wage', 'ln_employment']
+
+
+def build_event_panel(wage_panel, occ_exposure):
+    """Balanced SOC × year panel (leaf occupations) with continuous and binary exposure."""
+    panel = merge_exposure(wage_long(wage_panel), occ_exposure)
+    by_soc = panel.drop_duplicates('soc_code')
+    median_exposure = by_soc['ai_exposure'].median()
+    panel['high_exposure'] = (panel['ai_exposure'] > median_exposure).astype(int)
+    return panel
+
+
+def print_result(result):
+    stat, df, pvalue = result.pretrend_test()
+    print(f"\n{result.outcome} on {result.exposure} × year "
+          f"(N = {result.nobs:,}, {result.n_clusters:,} SOC clusters)")
+    print(result.coefficients.to_string(index=False, float_format=lambda v: f"{v:.5f}"))
+    if df:
+        verdict = "no evidence against parallel pre-trends" if pvalue >= 0.05 else "PRE-TRENDS DETECTED"
+        print(f"  Pre-trend test (all {df} leads = 0): χ² = {stat:.3f}, p = {pvalue:.4f} → {verdict}")
+    else:
+        print("  No lead years in the panel: pre-trends cannot be tested")
+
+
+def main(wage_panel_path=WAGE_PANEL_FILE, event_year=EVENT_YEAR, reference_year=None,
+         output_dir=OUTPUT_DIR, figures=True):
+    """Estimate the event studies, print them and save coefficients, figure and run record."""
+    start = time.perf_counter()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(exist_ok=True)
+
+    print("=" * 80)
+    print("EVENT STUDY: AI EXPOSURE × YEAR → WAGES")
+    print("Leads/lags with absorbed occupation and year fixed effects")
+    print("=" * 80)
+
+    print("\nSTEP 1: Loading data...")
+    wage_panel = load_wage_panel(wage_panel_path)
+    panel = build_event_panel(wage_panel, load_exposure())
+    years = sorted(panel['year'].unique())
+    print(f"  Panel: {panel['soc_code'].nunique():,} occupations × {len(years)} years ({years[0]}-{years[-1]})")
+    print(f"  Exposure matched at: {panel.drop_duplicates('soc_code')['soc_match_level'].value_counts().to_dict()}")
+
+    print("\n" + "=" * 80)
+    print(f"STEP 2: Event-study estimates (event {event_year}, "
+          f"reference {reference_year or event_year - 1})")
+    print("=" * 80)
+    results = {}
+    for outcome in OUTCOMES:
+        # Each outcome on its own complete-case sample (employment has gaps)
+        results.update(event_study(panel, EXPOSURES, outcomes=[outcome],
+                                   event_year=event_year, reference_year=reference_year))
+    for result in results.values():
+        print_result(result)
+
+    print("\n" + "=" * 80)
+    print("STEP 3: Saving results...")
+    print("=" * 80)
+    table = coefficient_table(results)
+    table.to_csv(output_dir / 'event_study_coefficients.csv', index=False)
+    print(f"✓ Saved: {output_dir / 'event_study_coefficients.csv'}")
+
+    if figures:
+        fig_path = render_event_study_figure(
+            [results['ln_wage', exposure] for exposure in EXPOSURES],
+            output_dir / 'event_study_plots.png',
+        )
+        print(f"✓ Saved plots to: {fig_path}")
+
+    estimated = table.dropna(subset=['se'])
+    metrics = {
+        f"{row.outcome}.{row.exposure}": {}
+        for row in estimated[['outcome', 'exposure']].drop_duplicates().itertuples()
+    }
+    for row in estimated.itertuples():
+        group = metrics[f"{row.outcome}.{row.exposure}"]
+        group[f"beta_{row.year}"] = row.beta
+        group[f"se_{row.year}"] = row.se
+        group['pretrend_pvalue'] = row.pretrend_pvalue
+    run_id = record_run(
+        'empirical_validation_event_study',
+        metrics,
+        config={'event_year': event_year, 'reference_year': reference_year or event_year - 1},
+        inputs=[Path(wage_panel_path), CROSSWALK_FILE],
+        timings={'total': time.perf_counter() - start},
+    )
+    if run_id is not None:
+        print(f"✓ Recorded run {run_id}")
+
+    print("\n" + "=" * 80)
+    print("EVENT STUDY COMPLETE")
+    print("=" * 80)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--wage-panel', type=Path, default=WAGE_PANEL_FILE,
+                        help='Long OES panel (soc_code, year, wage_annual_mean, employment, occ_title)')
+    parser.add_argument('--event-year', type=int, default=EVENT_YEAR, help='First post-LLM year')
+    parser.add_argument('--reference-year', type=int, default=None, help='Omitted year (default event-1)')
+    parser.add_argument('--no-figures', action='store_true', help='Skip the coefficient plot')
+    args = parser.parse_args()
+    main(args.wage_panel, args.event_year, args.reference_year, figures=not args.no_figures)
@@ -0,0 +1,124 @@
+"""
+Acemoglu-Restrepo Empirical Validation: PLACEBO (Permuted Exposure)
+===================================================================
+
+Both validation designs report one β on AI exposure. This script asks how
+unusual that β is when exposure carries no information: ai_exposure is
+randomly reassigned across occupations thousands of times and every
+specification is refit on each reassignment.
+
+    Cross-section:  Δln(w_i) = β₀ + β₁·Exposure_π(i) + β₂·ln(emp_i) + ε_i
+    DiD:            Δln(w_it) = ... + β₃·(Exposure_π(i) × Post_t) + ...
+
+The placebo p-value is (1 + #{permuted |β| ≥ observed |β|}) / (reps + 1):
+the observed assignment counts as one draw, so p is never 0 and its floor
+is 1/(reps + 1) (0.0001 at the default 9,999 replicates).
+
+With --within major, exposure only moves between occupations in the same
+SOC major group, so the placebo keeps broad occupational composition fixed
+and asks whether exposure matters *within* groups.
+
+All replicates of a specification are one stacked solve (only the exposure
+columns of the design change); see models/utils/resampling.py.
+
+Usage:
+    python empirical_validation_placebo.py
+    python empirical_validation_placebo.py --within major --reps 19999
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add models/utils to path
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "models" / "utils"))
+
+from resampling import DEFAULT_REPS
+from run_store import record_run, table_metrics
+from wage_validation import CROSSWALK_FILE, PLACEBO_SCHEMES, WAGE_PANEL_FILE, load_validation_panel, \
+    render_placebo_figure, run_placebo, run_validation
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+
+
+def print_placebo(result):
+    summary = result.summary_table()
+    print(f"\n  {'Specification':<16} {'β':>10} {'placebo mean':>13} {'placebo 95%':>23} {'p':>8}")
+    for row in summary.itertuples():
+        interval = f"[{row.Placebo_p2_5:.5f}, {row.Placebo_p97_5:.5f}]"
+        print(f"  {row.Specification:<16} {row.Estimate:>10.6f} {row.Placebo_mean:>13.6f} "
+              f"{interval:>23} {row.P_value_placebo:>8.4f}")
+    floor = 1 / (summary['Reps'].iloc[0] + 1)
+    if (summary['P_value_placebo'] <= floor).any():
+        print(f"  p = {floor:.4f} is the floor 1/(reps + 1): no placebo β as large as the observed one")
+
+
+def main(panel=None, output_dir=OUTPUT_DIR, figures=True, reps=DEFAULT_REPS, within='all'):
+    """Run the placebo permutations, print the report and save tables, figure and run record."""
+    start = time.perf_counter()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(exist_ok=True)
+
+    print("=" * 80)
+    print("PLACEBO: PERMUTED AI EXPOSURE")
+    print(f"ai_exposure permuted {PLACEBO_SCHEMES[within]}, {reps:,} replicates")
+    print("=" * 80)
+
+    print("\nSTEP 1: Observed specifications...")
+    if panel is None:
+        panel = load_validation_panel()
+    results = run_validation(panel)
+    print(f"  Cross-section: {results.cross_section.main.nobs:,} occupations")
+    print(f"  DiD: {results.did.binary.nobs:,} occupation × period observations")
+
+    print("\n" + "=" * 80)
+    print("STEP 2: Placebo distributions")
+    print("=" * 80)
+    placebo_start = time.perf_counter()
+    placebo = run_placebo(results.cross_section, results.did, reps=reps, within=within)
+    placebo_seconds = time.perf_counter() - placebo_start
+    print_placebo(placebo)
+    print(f"\n  {len(placebo.tests) * reps:,} placebo regressions in {placebo_seconds:.2f}s")
+
+    print("\n" + "=" * 80)
+    print("STEP 3: Saving results...")
+    print("=" * 80)
+    summary = placebo.summary_table()
+    summary.to_csv(output_dir / 'placebo_summary.csv', index=False)
+    print(f"✓ Saved: {output_dir / 'placebo_summary.csv'}")
+    placebo.distribution_table().to_csv(output_dir / 'placebo_distribution.csv', index=False)
+    print(f"✓ Saved: {output_dir / 'placebo_distribution.csv'}")
+
+    if figures:
+        fig_path = render_placebo_figure(placebo, output_dir / 'placebo_distributions.png')
+        print(f"✓ Saved plots to: {fig_path}")
+
+    run_id = record_run(
+        'empirical_validation_placebo',
+        table_metrics(summary, 'Specification', ['Estimate', 'Placebo_sd', 'P_value_placebo']),
+        config={'reps': reps, 'within': within},
+        inputs=[WAGE_PANEL_FILE, CROSSWALK_FILE],
+        timings={'total': time.perf_counter() - start, 'placebo': placebo_seconds},
+    )
+    if run_id is not None:
+        print(f"✓ Recorded run {run_id}")
+
+    print("\n" + "=" * 80)
+    print("PLACEBO COMPLETE")
+    print("=" * 80)
+    return placebo
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--reps', type=int, default=DEFAULT_REPS, help='Placebo permutations')
+    parser.add_argument('--within', choices=list(PLACEBO_SCHEMES), default='all',
+                        help='Permute across all occupations or within SOC major groups')
+    parser.add_argument('--no-figures', action='store_true', help='Skip the placebo histograms')
+    args = parser.parse_args()
+    main(figures=not args.no_figures, reps=args.reps, within=args.within)
@@ -0,0 +1,145 @@
+"""
+Acemoglu-Restrepo Empirical Validation: SYNTHETIC CONTROL
+=========================================================
+
+The DiD compares high- and low-exposure occupations on average, which
+needs parallel trends across the two groups. Synthetic control instead
+builds, for each high-exposure occupation, a weighted average of
+low-exposure occupations that tracks its wage path before LLMs:
+
+    ln(w)_1t − Σ_j w_j · ln(w)_jt,   w ≥ 0,  Σ w_j = 1
+
+fit on years before the event (2023) and read off as the effect after.
+
+- Treated: SOCs above median exposure (--unit soc) or the mean of each
+  upper exposure quartile (--unit quartile)
+- Donors: bottom-quartile exposure SOCs
+- Inference: placebo in space (every donor refit from the other donors);
+  p-values rank post/pre RMSPE ratios, and the average effect is compared
+  with averages of random placebo sets
+
+Needs at least two pre-event years. The default panel
+(wage_panel_2022_2024.csv) has one, so pass a longer OES panel in the same
+long format with --wage-panel.
+
+Estimation lives in models/utils/synthetic_control.py.
+
+Usage:
+    python empirical_validation_synthetic_control.py --wage-panel ../../data/processed/wage_panel_2015_2024.csv
+    python empirical_validation_synthetic_control.py --wage-panel ... --unit quartile --workers 4
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add models/utils to path
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "models" / "utils"))
+
+from event_study import EVENT_YEAR
+from run_store import record_run
+from synthetic_control import build_units, render_synthetic_control_figure, synthetic_control
+from wage_validation import CROSSWALK_FILE, WAGE_PANEL_FILE, load_exposure, load_wage_panel, merge_exposure, \
+    wage_long
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+
+
+def print_result(result, effect, effect_pvalue):
+    summary = result.summary_table()
+    print(f"\n  {len(result.treated):,} treated units, {len(result.donors):,} donors, "
+          f"{result.pre.sum()} pre-event years")
+    print(f"  Median pre-period RMSPE: {summary['pre_rmspe'].median():.5f}")
+    print(f"\n  Average post-event gap: {effect:.5f} (placebo p = {effect_pvalue:.4f})")
+    print(f"  Treated units with placebo p < 0.10: {(summary['pvalue'] < 0.10).sum()} of {len(summary)}")
+
+    print("\n  Most significant treated units:")
+    columns = ['unit', 'pre_rmspe', 'effect', 'rmspe_ratio', 'pvalue', 'n_donors_used', 'top_donor', 'top_weight']
+    print(summary.sort_values('pvalue')[columns].head(10).to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+
+
+def main(wage_panel_path=WAGE_PANEL_FILE, event_year=EVENT_YEAR, unit='soc', output_dir=OUTPUT_DIR, figures=True,
+         workers=None):
+    """Fit the synthetic controls, print them and save tables, figure and run record."""
+    start = time.perf_counter()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(exist_ok=True)
+
+    print("=" * 80)
+    print("SYNTHETIC CONTROL: HIGH-EXPOSURE OCCUPATIONS VS LOW-EXPOSURE DONORS")
+    print("=" * 80)
+
+    print("\nSTEP 1: Loading data...")
+    panel = merge_exposure(wage_long(load_wage_panel(wage_panel_path)), load_exposure())
+    wide, treated, donors = build_units(panel, unit=unit)
+    years = wide.columns.tolist()
+    print(f"  Panel: {len(years)} years ({years[0]}-{years[-1]}), {len(treated):,} treated ({unit}), "
+          f"{len(donors):,} donors")
+    n_pre = sum(year < event_year for year in years)
+    if n_pre < 2:
+        print(f"\n  Only {n_pre} pre-event year(s) before {event_year}: synthetic control needs at least two.")
+        print("  Pass a longer OES panel with --wage-panel.")
+        return None
+
+    print("\n" + "=" * 80)
+    print(f"STEP 2: Synthetic controls (event {event_year}, pre-period demeaned)")
+    print("=" * 80)
+    fit_start = time.perf_counter()
+    result = synthetic_control(wide, treated, donors, event_year=event_year, workers=workers)
+    fit_seconds = time.perf_counter() - fit_start
+    effect, effect_pvalue = result.average_effect_test()
+    print(f"  {len(treated) + len(donors):,} weight problems (treated + placebos) in {fit_seconds:.2f}s")
+    print_result(result, effect, effect_pvalue)
+
+    print("\n" + "=" * 80)
+    print("STEP 3: Saving results...")
+    print("=" * 80)
+    summary = result.summary_table()
+    summary.to_csv(output_dir / 'synthetic_control_summary.csv', index=False)
+    print(f"✓ Saved: {output_dir / 'synthetic_control_summary.csv'}")
+    result.paths_table().to_csv(output_dir / 'synthetic_control_paths.csv', index=False)
+    print(f"✓ Saved: {output_dir / 'synthetic_control_paths.csv'}")
+    if figures:
+        fig_path = render_synthetic_control_figure(result, output_dir / 'synthetic_control_plots.png')
+        print(f"✓ Saved plots to: {fig_path}")
+
+    run_id = record_run(
+        'empirical_validation_synthetic_control',
+        {
+            'average': {'effect': effect, 'pvalue': effect_pvalue},
+            'units': {
+                'n_treated': len(treated),
+                'n_donors': len(donors),
+                'share_p10': (summary['pvalue'] < 0.10).mean(),
+                'median_pre_rmspe': summary['pre_rmspe'].median(),
+            },
+        },
+        config={'event_year': event_year, 'unit': unit},
+        inputs=[Path(wage_panel_path), CROSSWALK_FILE],
+        timings={'total': time.perf_counter() - start, 'fit': fit_seconds},
+    )
+    if run_id is not None:
+        print(f"✓ Recorded run {run_id}")
+
+    print("\n" + "=" * 80)
+    print("SYNTHETIC CONTROL COMPLETE")
+    print("=" * 80)
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--wage-panel', type=Path, default=WAGE_PANEL_FILE,
+                        help='Long OES panel (soc_code, year, wage_annual_mean, employment, occ_title)')
+    parser.add_argument('--event-year', type=int, default=EVENT_YEAR, help='First post-LLM year')
+    parser.add_argument('--unit', choices=['soc', 'quartile'], default='soc',
+                        help='Treated units: high-exposure SOCs or exposure-quartile aggregates')
+    parser.add_argument('--workers', type=int, default=None, help='Threads for the weight solves')
+    parser.add_argument('--no-figures', action='store_true', help='Skip the paths/gaps figure')
+    args = parser.parse_args()
+    main(args.wage_panel, args.event_year, args.unit, figures=not args.no_figures, workers=args.workers)
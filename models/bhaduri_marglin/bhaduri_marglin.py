@@ -26,6 +26,7 @@ sys.path.insert(0, str(ROOT_DIR / "models" / "utils"))
 import numpy as np
 import pandas as pd
 from exposure_calculation import calculate_importance_weighted_exposure
+from model_config import ModelConfig
 
 # --- CONFIGURATION ---
 DATA_DIR = ROOT_DIR / "data"
@@ -34,11 +35,9 @@ OUTPUT_DIR = Path(__file__).parent / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 # Model parameters (from literature: Stockhammer 2017, Onaran & Galanis 2014)
-S_PI = 0.45  # Propensity to save out of profits (s_π)
-G_U = 0.10   # Investment sensitivity to capacity utilization (g_u)
-G_PI = 0.05  # Investment sensitivity to profit share (g_π)
-U_BASELINE = 0.80  # Baseline capacity utilization (80%)
-WAGE_SHARE_BASELINE = 0.55  # Approximate US wage share
+# s_π=0.45, g_u=0.10, g_π=0.05, u_baseline=0.80, ω₀=0.55.
+# This reduced model has no saving out of wages (s_w=0).
+CONFIG = ModelConfig(s_w=0.0)
 
 
 def load_crosswalk():
@@ -46,16 +45,19 @@ def load_crosswalk():
     return pd.read_csv(CROSSWALK_FILE)
 
 
-def bhaduri_marglin_model(occ):
+def bhaduri_marglin_model(occ, config=CONFIG):
     """
     Calibrate Bhaduri-Marglin endogenous regime model.
 
     Investment: I = g₀ + g_u×u + g_π×π
-    Savings: S = s_π × π × u
-    Equilibrium: u* = (g₀ + g_π×π) / (s_π×π - g_u)
+    Savings: S = σ(π) × u,  σ(π) = s_w×(1-π) + s_π×π  (= s_π×π with the default s_w=0)
+    Equilibrium: u* = (g₀ + g_π×π) / (σ(π) - g_u)
 
-    FIX: Calibrate g₀ so u_star_before == U_BASELINE (not hardcoded G_0).
+    FIX: Calibrate g₀ so u_star_before == u_baseline (not hardcoded G_0).
     """
+    s_pi, g_u, g_pi = config.s_pi, config.g_u, config.g_pi
+    u_baseline = config.u_baseline
+
     # Calculate wage bill
     occ['wage_bill'] = occ['TOT_EMP'] * occ['A_MEAN']
     total_wage_bill = occ['wage_bill'].sum()
@@ -64,28 +66,29 @@ def bhaduri_marglin_model(occ):
     occ['wage_at_risk'] = occ['wage_bill'] * occ['ai_exposure']
 
     # Profit share calculations
-    profit_share_baseline = 1 - WAGE_SHARE_BASELINE
+    profit_share_baseline = config.profit_share_baseline
     delta_profit_share = occ['wage_at_risk'].sum() / total_wage_bill if total_wage_bill > 0 else 0.0
 
     # FIX: Bound profit share to [0, 1]
     profit_share_new = np.clip(profit_share_baseline + delta_profit_share, 0.0, 1.0)
 
-    # FIX: Calibrate g₀ so that u_star_before == U_BASELINE
-    denom_before = (S_PI * profit_share_baseline) - G_U
+    # FIX: Calibrate g₀ so that u_star_before == u_baseline
+    # Denominators use the aggregate saving rate σ(π), the same one config.g_0 is calibrated with
+    denom_before = config.saving_rate(profit_share_baseline) - g_u
     if denom_before <= 0:
         raise ValueError(f"Baseline denominator {denom_before:.4f} <= 0; cannot calibrate g₀ with these params.")
 
-    G_0_calibrated = U_BASELINE * denom_before - (G_PI * profit_share_baseline)
+    G_0_calibrated = config.g_0
 
-    # Equilibrium utilization BEFORE AI shock (should equal U_BASELINE by construction)
-    u_star_before = U_BASELINE
+    # Equilibrium utilization BEFORE AI shock (should equal u_baseline by construction)
+    u_star_before = u_baseline
 
     # Equilibrium utilization AFTER AI shock
-    denominator_after = (S_PI * profit_share_new) - G_U
+    denominator_after = config.saving_rate(profit_share_new) - g_u
     if denominator_after <= 0:
-        u_star_after = U_BASELINE  # Fallback
+        u_star_after = u_baseline  # Fallback
     else:
-        u_star_after = (G_0_calibrated + G_PI * profit_share_new) / denominator_after
+        u_star_after = (G_0_calibrated + g_pi * profit_share_new) / denominator_after
 
     # FIX: Bound utilization to [0, 1]
     u_star_after = float(np.clip(u_star_after, 0.0, 1.0))
@@ -93,16 +96,17 @@ def bhaduri_marglin_model(occ):
     # Change in utilization
     delta_u = u_star_after - u_star_before
 
-    # Regime determination: ∂u*/∂π
-    # With positive params, this is always negative → always wage-led in this reduced model
-    regime_numerator = -(G_PI * G_U + G_0_calibrated * S_PI)
+    # Regime determination: ∂u*/∂π = [g_π×(σ-g_u) - (g₀+g_π×π)×(s_π-s_w)] / (σ-g_u)²
+    # With s_w=0 this is -(g_π×g_u + g₀×s_π) < 0 → always wage-led in this reduced model
+    regime_numerator = (g_pi * denom_before
+                        - (G_0_calibrated + g_pi * profit_share_baseline) * (s_pi - config.s_w))
     regime_denominator = denom_before ** 2 if denom_before > 0 else 1
     partial_u_partial_pi = regime_numerator / regime_denominator
 
     regime = "profit-led" if partial_u_partial_pi > 0 else "wage-led"
 
     # Output effect
-    output_effect = delta_u / U_BASELINE if U_BASELINE > 0 else 0
+    output_effect = delta_u / u_baseline if u_baseline > 0 else 0
 
     return {
         'g0_calibrated': G_0_calibrated,
@@ -116,10 +120,11 @@ def bhaduri_marglin_model(occ):
         'regime': regime,
         'output_effect': output_effect,
         'total_wage_bill': total_wage_bill,
-        's_pi': S_PI,
-        'g_u': G_U,
-        'g_pi': G_PI,
-        'u_baseline': U_BASELINE
+        's_pi': s_pi,
+        'g_u': g_u,
+        'g_pi': g_pi,
+        'u_baseline': u_baseline,
+        'wage_share_baseline': config.wage_share_baseline
     }, occ
 
 
@@ -172,7 +177,8 @@ def save_results(results, occ):
     # Parameters used
     params = pd.DataFrame({
         'Parameter': ['s_π', 'g_u', 'g_π', 'g₀ (calibrated)', 'u_baseline', 'wage_share_baseline'],
-        'Value': [S_PI, G_U, G_PI, results['g0_calibrated'], U_BASELINE, WAGE_SHARE_BASELINE],
+        'Value': [results['s_pi'], results['g_u'], results['g_pi'], results['g0_calibrated'],
+                  results['u_baseline'], results['wage_share_baseline']],
         'Description': [
             'Propensity to save out of profits',
             'Investment sensitivity to utilization',
@@ -195,11 +201,11 @@ def save_results(results, occ):
     return summary
 
 
-def main():
+def main(config=CONFIG):
     """Run Bhaduri-Marglin model."""
     df = load_crosswalk()
     occ = calculate_importance_weighted_exposure(df)
-    results, occ = bhaduri_marglin_model(occ)
+    results, occ = bhaduri_marglin_model(occ, config)
     summary = save_results(results, occ)
     return results, summary
 
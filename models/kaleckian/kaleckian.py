@@ -26,6 +26,7 @@ sys.path.insert(0, str(ROOT_DIR / "models" / "utils"))
 import numpy as np
 import pandas as pd
 from exposure_calculation import calculate_importance_weighted_exposure
+from model_config import ModelConfig
 
 # --- CONFIGURATION ---
 DATA_DIR = ROOT_DIR / "data"
@@ -34,9 +35,9 @@ OUTPUT_DIR = Path(__file__).parent / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 # Model parameters (from literature: Stockhammer 2011, Onaran & Galanis 2014)
-C_W = 0.80   # Marginal propensity to consume out of wages
-C_PI = 0.40  # Marginal propensity to consume out of profits
-AVG_C = 0.70 # Aggregate consumption propensity (for multiplier)
+# c_w=0.80, c_π=0.40; this reduced model fixes the aggregate consumption
+# propensity for the multiplier at c=0.70 instead of deriving it
+CONFIG = ModelConfig(avg_c=0.70)
 
 
 def load_crosswalk():
@@ -44,7 +45,7 @@ def load_crosswalk():
     return pd.read_csv(CROSSWALK_FILE)
 
 
-def kaleckian_model(occ):
+def kaleckian_model(occ, config=CONFIG):
     """
     Estimate Kaleckian wage share / aggregate demand model.
 
@@ -65,10 +66,10 @@ def kaleckian_model(occ):
     wage_share_effect = wage_at_risk / total_wage_bill if total_wage_bill > 0 else 0.0
 
     # Consumption effect: ΔC = (c_w - c_π) × Δω
-    consumption_effect = (C_W - C_PI) * wage_share_effect
+    consumption_effect = (config.c_w - config.c_pi) * wage_share_effect
 
     # Keynesian multiplier: κ = 1/(1-c)
-    multiplier = 1 / (1 - AVG_C)
+    multiplier = config.multiplier
 
     # Total AD effect with multiplier
     ad_effect = consumption_effect * multiplier
@@ -87,8 +88,9 @@ def kaleckian_model(occ):
         'emp_at_risk': emp_at_risk,
         'emp_share_at_risk': emp_at_risk / total_emp if total_emp > 0 else 0.0,
         'total_wage_bill': total_wage_bill,
-        'c_w': C_W,
-        'c_pi': C_PI
+        'c_w': config.c_w,
+        'c_pi': config.c_pi,
+        'aggregate_mpc': config.aggregate_mpc
     }, occ
 
 
@@ -102,7 +104,7 @@ def save_results(results, occ):
         'Metric': [
             'Wage share reduction',
             'Consumption effect',
-            f'Keynesian multiplier (c={AVG_C})',
+            f"Keynesian multiplier (c={results['aggregate_mpc']})",
             'AD effect (with multiplier)',
             'Employment share at risk',
             'Wage bill at risk ($)'
@@ -136,11 +138,11 @@ def save_results(results, occ):
     return summary
 
 
-def main():
+def main(config=CONFIG):
     """Run Kaleckian model."""
     df = load_crosswalk()
     occ = calculate_importance_weighted_exposure(df)
-    results, occ = kaleckian_model(occ)
+    results, occ = kaleckian_model(occ, config)
     summary = save_results(results, occ)
     return results, summary
 
@@ -0,0 +1,397 @@
+"""
+Multi-Sector Kaleckian Model with a Leontief Input-Output Multiplier
+====================================================================
+
+kaleckian_model collapses the economy into one sector with multiplier
+κ = 1/(1-c). This extension keeps the same distributional mechanism
+(wages → profits lowers consumption because c_w > c_π) but propagates the
+demand shock through an input-output table:
+
+    x = A x + f + p × h'x          (Kaleckian household closure)
+    h_j = c_w × v_j + c_π × π_j    (consumption per $ of sector j output)
+
+where A is the direct requirements matrix, p the PCE composition of
+household spending, v_j the labor compensation and π_j the residual profit
+per $ of output. With one sector and A = 0 this reduces exactly to the
+aggregate multiplier 1/(1 - [c_w×ω + c_π×(1-ω)]).
+
+Occupation wage-at-risk is mapped into industries through the OES
+industry-by-occupation staffing pattern, and NAICS industries into IO
+sectors through a concordance. The consumption shock of each SOC major
+group is one column of the final-demand matrix F; (I - A*) is factorized
+once (sparse LU) and all columns are solved together.
+
+Inputs (not distributed with the repo):
+- OES national industry-specific estimates, 4-digit NAICS (nat4d_M2024_dl.xlsx)
+  https://www.bls.gov/oes/tables.htm
+- BEA industry-by-industry direct requirements table (square CSV, sector
+  codes in the first column and the header)
+- IO sector table: io_code, gross_output, pce (PCE purchases, $)
+- NAICS → IO concordance: naics, io_code[, weight]
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import sys
+from pathlib import Path
+
+# Add models/utils to path for shared utilities
+ROOT_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT_DIR / "models" / "utils"))
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+from exposure_calculation import calculate_importance_weighted_exposure
+from model_config import DEFAULT_CONFIG
+
+# --- CONFIGURATION ---
+DATA_DIR = ROOT_DIR / "data"
+CROSSWALK_FILE = DATA_DIR / "processed" / "master_task_crosswalk_with_importance.csv"
+STAFFING_FILE = DATA_DIR / "bls_oes" / "nat4d_M2024_dl.xlsx"
+IO_DIR = DATA_DIR / "bea"
+DIRECT_REQUIREMENTS_FILE = IO_DIR / "direct_requirements.csv"
+IO_SECTORS_FILE = IO_DIR / "io_sectors.csv"
+CONCORDANCE_FILE = IO_DIR / "naics_io_concordance.csv"
+OUTPUT_DIR = Path(__file__).parent / "output"
+OUTPUT_DIR.mkdir(exist_ok=True)
+
+# Class MPCs and the derived aggregate MPC (the one-sector benchmark)
+CONFIG = DEFAULT_CONFIG
+
+# Direct requirements below this are dropped from the sparse matrix
+A_TOLERANCE = 1e-9
+
+
+def load_crosswalk():
+    """Load crosswalk with BLS wage data and O*NET task importance."""
+    return pd.read_csv(CROSSWALK_FILE)
+
+
+def load_staffing_pattern(path=STAFFING_FILE):
+    """
+    Load the OES industry-by-occupation staffing pattern.
+
+    Returns long DataFrame [naics, soc_code, emp, wage_bill] for detailed
+    occupations. Suppressed wages ('*', '#') fall back to the occupation's
+    employment-weighted mean across the industries where it is published.
+    """
+    raw = pd.read_excel(path, dtype={'NAICS': str, 'OCC_CODE': str})
+    raw.columns = raw.columns.str.upper()
+    raw = raw[raw['O_GROUP'].str.lower() == 'detailed']
+
+    staffing = pd.DataFrame({
+        'naics': raw['NAICS'].str.strip(),
+        'soc_code': raw['OCC_CODE'].str.strip(),
+        'emp': pd.to_numeric(raw['TOT_EMP'], errors='coerce'),
+        'wage': pd.to_numeric(raw['A_MEAN'], errors='coerce'),
+    }).dropna(subset=['emp'])
+
+    published = staffing.dropna(subset=['wage'])
+    mean_wage = (published['wage'] * published['emp']).groupby(published['soc_code']).sum() \
+        / published.groupby('soc_code')['emp'].sum()
+    staffing['wage'] = staffing['wage'].fillna(staffing['soc_code'].map(mean_wage))
+    staffing['wage_bill'] = staffing['emp'] * staffing['wage']
+
+    return staffing.dropna(subset=['wage_bill'])[['naics', 'soc_code', 'emp', 'wage_bill']]
+
+
+def load_io_table(direct_requirements_path=DIRECT_REQUIREMENTS_FILE,
+                  sectors_path=IO_SECTORS_FILE):
+    """
+    Load the IO direct requirements matrix and sector totals.
+
+    Returns
+    -------
+    A : scipy.sparse.csc_matrix, shape (n, n)
+        A[i, j] = input from sector i per $ of sector j output
+    sectors : pd.DataFrame
+        io_code, gross_output, pce in the row/column order of A
+    """
+    dr = pd.read_csv(direct_requirements_path, index_col=0)
+    dr.index = dr.index.astype(str).str.strip()
+    dr.columns = dr.columns.astype(str).str.strip()
+    codes = dr.index.tolist()
+    if dr.columns.tolist() != codes:
+        dr = dr.reindex(columns=codes)
+
+    values = dr.fillna(0.0).to_numpy(dtype=np.float64)
+    values[np.abs(values) < A_TOLERANCE] = 0.0
+    A = sp.csc_matrix(values)
+
+    sectors = pd.read_csv(sectors_path, dtype={'io_code': str})
+    sectors['io_code'] = sectors['io_code'].str.strip()
+    sectors = sectors.set_index('io_code').reindex(codes).fillna(0.0).reset_index()
+
+    return A, sectors
+
+
+def load_concordance(path=CONCORDANCE_FILE):
+    """Load the NAICS → IO sector concordance (equal weights if none given)."""
+    concordance = pd.read_csv(path, dtype={'naics': str, 'io_code': str})
+    if 'weight' not in concordance.columns:
+        concordance['weight'] = 1.0
+    return concordance
+
+
+def _index(codes):
+    """Index of unique codes in order of first appearance."""
+    return pd.Index(pd.unique(np.asarray(codes)))
+
+
+def staffing_matrix(staffing, soc_codes, naics_codes, value='wage_bill'):
+    """
+    Sparse occupation × industry share matrix from the staffing pattern.
+
+    S[o, n] = share of occupation o's `value` (wage_bill or emp) located in
+    industry n; rows sum to 1 for occupations present in the staffing pattern
+    and are empty otherwise.
+    """
+    rows = soc_codes.get_indexer(staffing['soc_code'])
+    cols = naics_codes.get_indexer(staffing['naics'])
+    keep = (rows >= 0) & (cols >= 0)
+    S = sp.csr_matrix(
+        (staffing[value].to_numpy()[keep], (rows[keep], cols[keep])),
+        shape=(len(soc_codes), len(naics_codes))
+    )
+    totals = np.asarray(S.sum(axis=1)).ravel()
+    inv = np.divide(1.0, totals, out=np.zeros_like(totals), where=totals > 0)
+    return sp.diags(inv) @ S
+
+
+def concordance_matrix(concordance, naics_codes, io_codes):
+    """Sparse NAICS × IO sector matrix with rows normalized to sum to 1."""
+    rows = naics_codes.get_indexer(concordance['naics'])
+    cols = io_codes.get_indexer(concordance['io_code'])
+    keep = (rows >= 0) & (cols >= 0)
+    C = sp.csr_matrix(
+        (concordance['weight'].to_numpy(dtype=np.float64)[keep], (rows[keep], cols[keep])),
+        shape=(len(naics_codes), len(io_codes))
+    )
+    totals = np.asarray(C.sum(axis=1)).ravel()
+    inv = np.divide(1.0, totals, out=np.zeros_like(totals), where=totals > 0)
+    return sp.diags(inv) @ C
+
+
+class LeontiefSolver:
+    """
+    Sparse LU factorization of (I - A), reused for any number of shocks.
+
+    Parameters
+    ----------
+    A : scipy.sparse matrix, shape (n, n)
+        (Augmented) direct requirements matrix
+    """
+
+    def __init__(self, A):
+        n = A.shape[0]
+        self.n = n
+        self._lu = splu((sp.identity(n, format='csc') - sp.csc_matrix(A)).tocsc())
+
+    def solve(self, F):
+        """Total output x = (I - A)⁻¹ F for a vector or (n, k) matrix of final-demand shocks."""
+        F = np.asarray(F, dtype=np.float64)
+        return self._lu.solve(F if F.ndim == 1 else np.ascontiguousarray(F))
+
+    def output_multipliers(self):
+        """Column sums of (I - A)⁻¹: total output per $ of final demand in each sector."""
+        return self._lu.solve(np.ones(self.n), trans='T')
+
+
+def kaleckian_closure(A, labor_coef, profit_coef, pce_shares, config=CONFIG):
+    """
+    Augment A with the Kaleckian household row and column.
+
+    Household row: h_j = c_w × v_j + c_π × π_j (consumption generated per $
+    of sector j output); household column: PCE composition p (sums to 1).
+    """
+    n = A.shape[0]
+    h = config.c_w * labor_coef + config.c_pi * profit_coef
+    return sp.bmat([
+        [sp.csc_matrix(A), sp.csc_matrix(pce_shares.reshape(n, 1))],
+        [sp.csc_matrix(h.reshape(1, n)), None],
+    ], format='csc')
+
+
+def multisector_kaleckian_model(occ, staffing, A, sectors, concordance, config=CONFIG):
+    """
+    Estimate the multi-sector Kaleckian model.
+
+    For each SOC major group g, the redistribution of its wage-at-risk W_g to
+    profits changes consumption by ΔC_g = -(c_w - c_π) × W_g, spread over
+    sectors by PCE shares. All group shocks (plus their total) are solved
+    against one factorization of the closed (I - A*).
+
+    Returns
+    -------
+    results : dict
+        Aggregate effects and the implied aggregate multiplier
+    sector_effects : pd.DataFrame
+        Sector-level wage at risk, employment at risk, output and employment effects
+    group_effects : pd.DataFrame
+        Total output / employment effect by originating SOC major group
+    """
+    occ = occ.copy()
+    occ['soc_code'] = occ['onet_soc_code'].astype(str).str[:7]
+    occ['wage_at_risk'] = occ['TOT_EMP'] * occ['A_MEAN'] * occ['ai_exposure']
+    occ['emp_at_risk'] = occ['TOT_EMP'] * occ['ai_exposure']
+    by_soc = occ.groupby('soc_code')[['wage_at_risk', 'emp_at_risk']].sum()
+
+    soc_codes = pd.Index(by_soc.index)
+    naics_codes = _index(staffing['naics'])
+    io_codes = pd.Index(sectors['io_code'])
+    n = len(io_codes)
+
+    # Occupation → industry → IO sector
+    C = concordance_matrix(concordance, naics_codes, io_codes)
+    to_sector_wage = (staffing_matrix(staffing, soc_codes, naics_codes, 'wage_bill') @ C).tocsr()
+    to_sector_emp = (staffing_matrix(staffing, soc_codes, naics_codes, 'emp') @ C).tocsr()
+    wage_at_risk = by_soc['wage_at_risk'].to_numpy()
+    emp_at_risk = by_soc['emp_at_risk'].to_numpy()
+    sector_wage_at_risk = to_sector_wage.T @ wage_at_risk
+    sector_emp_at_risk = to_sector_emp.T @ emp_at_risk
+    allocated = sector_wage_at_risk.sum() / wage_at_risk.sum() if wage_at_risk.sum() > 0 else 0.0
+
+    # Sector wage bills and employment from the staffing pattern
+    industry = staffing.groupby('naics')[['wage_bill', 'emp']].sum().reindex(naics_codes).fillna(0.0)
+    sector_wage_bill = C.T @ industry['wage_bill'].to_numpy()
+    sector_emp = C.T @ industry['emp'].to_numpy()
+
+    gross_output = sectors['gross_output'].to_numpy(dtype=np.float64)
+    safe_output = np.where(gross_output > 0, gross_output, np.inf)
+    labor_coef = sector_wage_bill / safe_output
+    value_added_coef = np.clip(1 - np.asarray(A.sum(axis=0)).ravel(), 0.0, None)
+    profit_coef = np.clip(value_added_coef - labor_coef, 0.0, None)
+    emp_per_output = sector_emp / safe_output
+
+    pce = sectors['pce'].to_numpy(dtype=np.float64)
+    pce_shares = pce / pce.sum()
+
+    # Consumption shocks: one column per SOC major group, plus the total
+    groups = soc_codes.str[:2]
+    group_codes = pd.Index(sorted(groups.unique()))
+    G = sp.csr_matrix(
+        (np.ones(len(soc_codes)), (np.arange(len(soc_codes)), group_codes.get_indexer(groups))),
+        shape=(len(soc_codes), len(group_codes))
+    )
+    delta_c = -(config.c_w - config.c_pi) * (G.T @ wage_at_risk)
+    delta_c = np.append(delta_c, delta_c.sum())
+    F = np.zeros((n + 1, len(delta_c)))
+    F[:n] = np.outer(pce_shares, delta_c)
+
+    solver = LeontiefSolver(kaleckian_closure(A, labor_coef, profit_coef, pce_shares, config))
+    X = solver.solve(F)
+    delta_x = X[:n]
+    delta_emp = emp_per_output[:, None] * delta_x
+
+    total_output = gross_output.sum()
+    total_delta_x = delta_x[:, -1].sum()
+    total_shock = delta_c[-1]
+
+    sector_effects = pd.DataFrame({
+        'io_code': io_codes,
+        'gross_output': gross_output,
+        'wage_bill': sector_wage_bill,
+        'employment': sector_emp,
+        'wage_at_risk': sector_wage_at_risk,
+        'emp_at_risk': sector_emp_at_risk,
+        'consumption_shock': F[:n, -1],
+        'output_effect': delta_x[:, -1],
+        'output_effect_pct': delta_x[:, -1] / safe_output,
+        'employment_effect': delta_emp[:, -1],
+    })
+
+    group_effects = pd.DataFrame({
+        'soc_major_group': list(group_codes) + ['total'],
+        'wage_at_risk': np.append(G.T @ wage_at_risk, wage_at_risk.sum()),
+        'consumption_shock': delta_c,
+        'output_effect': delta_x.sum(axis=0),
+        'employment_effect': delta_emp.sum(axis=0),
+    })
+
+    results = {
+        'wage_at_risk': wage_at_risk.sum(),
+        'wage_at_risk_allocated': allocated,
+        'consumption_shock': total_shock,
+        'output_effect': total_delta_x,
+        'output_effect_share': total_delta_x / total_output if total_output > 0 else 0.0,
+        'employment_effect': delta_emp[:, -1].sum(),
+        'io_multiplier': total_delta_x / total_shock if total_shock != 0 else np.nan,
+        'aggregate_multiplier': config.multiplier,
+        'n_sectors': n,
+        'n_shocks': F.shape[1],
+        'c_w': config.c_w,
+        'c_pi': config.c_pi,
+    }
+    return results, sector_effects, group_effects
+
+
+def save_results(results, sector_effects, group_effects):
+    """Save model results."""
+    sector_effects.to_csv(OUTPUT_DIR / "multisector_sector_effects.csv", index=False)
+    group_effects.to_csv(OUTPUT_DIR / "multisector_group_effects.csv", index=False)
+
+    summary = pd.DataFrame({
+        'Metric': [
+            'Wage bill at risk ($)',
+            'Share of wage-at-risk mapped to IO sectors',
+            'Consumption shock ($)',
+            'Output effect ($)',
+            'Output effect (share of gross output)',
+            'Employment effect (jobs)',
+            'IO multiplier (output / consumption shock)',
+            'Aggregate multiplier 1/(1-c)',
+        ],
+        'Value': [
+            results['wage_at_risk'],
+            results['wage_at_risk_allocated'],
+            results['consumption_shock'],
+            results['output_effect'],
+            results['output_effect_share'],
+            results['employment_effect'],
+            results['io_multiplier'],
+            results['aggregate_multiplier'],
+        ],
+        'Formatted': [
+            f"${results['wage_at_risk']:,.0f}",
+            f"{results['wage_at_risk_allocated']*100:.1f}%",
+            f"${results['consumption_shock']:,.0f}",
+            f"${results['output_effect']:,.0f}",
+            f"{results['output_effect_share']*100:.2f}%",
+            f"{results['employment_effect']:,.0f}",
+            f"{results['io_multiplier']:.2f}",
+            f"{results['aggregate_multiplier']:.2f}",
+        ]
+    })
+    summary.to_csv(OUTPUT_DIR / "multisector_results.csv", index=False)
+
+    print("\n" + "="*80)
+    print("MULTI-SECTOR KALECKIAN MODEL RESULTS")
+    print("="*80)
+    print(summary.to_string(index=False))
+    print("\nLargest sector output losses:")
+    print(sector_effects.nsmallest(10, 'output_effect')[
+        ['io_code', 'output_effect', 'output_effect_pct', 'employment_effect']
+    ].to_string(index=False))
+
+    return summary
+
+
+def main(config=CONFIG):
+    """Run multi-sector Kaleckian model."""
+    df = load_crosswalk()
+    occ = calculate_importance_weighted_exposure(df)
+    staffing = load_staffing_pattern()
+    A, sectors = load_io_table()
+    concordance = load_concordance()
+    results, sector_effects, group_effects = multisector_kaleckian_model(
+        occ, staffing, A, sectors, concordance, config
+    )
+    summary = save_results(results, sector_effects, group_effects)
+    return results, summary
+
+
+if __name__ == '__main__':
+    main()
@@ -20,8 +20,16 @@ Following ChatGPT feedback corrections:
 - Fix split-weight verification logic
 - Add data quality guardrails (employment>0, wage>0)
 - Clarify task-level model interpretation
+
+Poisson models are fit with models/utils/glm_kernel.py: one batched IRLS
+call covers every task-exclusion rule × match-score cutoff × regressor
+set (the A1 full and non-ambiguous models are two of its cells), and a
+second call fits the SOC bootstrap replicates. Standard errors are HC3
+with the leverage correction; statsmodels' GLM 'HC3' is HC0.
 """
 
+import sys
+import time
 import pandas as pd
 import numpy as np
 import statsmodels.api as sm
@@ -29,12 +37,29 @@ from statsmodels.regression.linear_model import OLS
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
+from scipy import sparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+from glm_kernel import fit_poisson_batch
+from resampling import SEED
+from run_store import record_run, table_metrics
+
+RUN_START = time.perf_counter()
 
 # Set up paths
 DATA_PATH = Path.home() / "anthropic-onet-crosswalk" / "data" / "processed" / "master_task_crosswalk_with_wages.csv"
 OUTPUT_DIR = Path.home() / "anthropic-onet-crosswalk" / "models" / "oring_automation"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Poisson sensitivity grid: task rows kept before aggregating to SOCs
+EXCLUSION_RULES = ['all', 'no_ambiguous', 'max_2_candidates']
+MATCH_CUTOFFS = [None, 90, 95, 99]          # Minimum task match_score (None: keep all)
+POISSON_SPECS = {
+    'controls': ['log_wage', 'share_core', 'avg_match_score'],
+    'wage_only': ['log_wage'],
+}
+BOOTSTRAP_REPS = 1999                        # SOC-resampled replicates of the main Poisson model
+
 # Configure display
 pd.set_option('display.max_columns', None)
 pd.set_option('display.width', 1000)
@@ -177,15 +202,78 @@ print(f"\nPoisson dataset: {len(poisson_data):,} SOCs")
 print(f"Usage range: {poisson_data['usage_total'].min():.2f} to {poisson_data['usage_total'].max():.2f}")
 print(f"Note: Many are fractional due to split weights (no rounding applied)")
 
-# GLM Poisson with offset (quasi-likelihood)
-glm_poisson = sm.GLM(
-    endog=poisson_data['usage_total'],
-    exog=sm.add_constant(poisson_data[['log_wage', 'share_core', 'avg_match_score']]),
-    family=sm.families.Poisson(),
-    offset=poisson_data['log_employment']
-).fit(cov_type='HC3')
-
-print("\n" + glm_poisson.summary().as_text())
+# One SOC-level sample per (exclusion rule, match cutoff): task rows are kept by
+# a mask per cell and summed to SOCs with a single sparse product
+cells = pd.DataFrame([(rule, cutoff) for rule in EXCLUSION_RULES for cutoff in MATCH_CUTOFFS],
+                     columns=['rule', 'match_cutoff'])
+rule_masks = {
+    'all': np.ones(len(df_clean), dtype=bool),
+    'no_ambiguous': ~df_clean['is_ambiguous'].to_numpy(dtype=bool),
+    'max_2_candidates': (df_clean['n_candidate_socs'] <= 2).to_numpy(),
+}
+match_score = df_clean['match_score'].to_numpy()
+keep = np.stack([rule_masks[rule] & (match_score >= (cutoff if pd.notna(cutoff) else -np.inf))
+                 for rule, cutoff in cells.itertuples(index=False)]).astype(float)     # (cells, task rows)
+
+soc_codes, soc_index = np.unique(df_clean['soc_6digit'], return_inverse=True)
+to_soc = sparse.csr_matrix((np.ones(len(df_clean)), (np.arange(len(df_clean)), soc_index)),
+                           shape=(len(df_clean), len(soc_codes)))
+n_tasks = (to_soc.T @ keep.T).T                                                      # (cells, SOCs)
+with np.errstate(invalid='ignore', divide='ignore'):
+    cell_usage = (to_soc.T @ (keep * df_clean['api_usage_count'].to_numpy()).T).T
+    cell_core = (to_soc.T @ (keep * df_clean['is_core_task'].to_numpy()).T).T / n_tasks
+    cell_match = (to_soc.T @ (keep * match_score).T).T / n_tasks
+soc_level = soc_agg.set_index('soc_6digit').loc[soc_codes]
+cell_regressors = {
+    'log_wage': np.broadcast_to(soc_level['log_wage'].to_numpy(), n_tasks.shape),
+    'share_core': cell_core,
+    'avg_match_score': cell_match,
+}
+cell_offset = soc_level['log_employment'].to_numpy()
+
+# All cells of each specification in one batched IRLS call
+grid_fits, grid_rows = {}, []
+for spec, regressors in POISSON_SPECS.items():
+    X_cells = np.stack([np.ones(n_tasks.shape)] + [cell_regressors[r] for r in regressors], axis=-1)
+    in_sample = (n_tasks > 0).astype(float)
+    # A regressor without variation in a cell's sample is collinear with the constant
+    varies = np.array([all(np.ptp(X_cells[i, in_sample[i] > 0, j]) > 0 for j in range(1, X_cells.shape[-1]))
+                       for i in range(len(cells))])
+    fit = fit_poisson_batch(cell_usage, X_cells, offset=cell_offset, weights=in_sample * varies[:, None],
+                            cov_type='HC3', names=['const'] + regressors)
+    grid_fits[spec] = fit
+    j = fit.index('log_wage')
+    for i, (rule, cutoff) in enumerate(cells.itertuples(index=False)):
+        grid_rows.append({
+            'spec': spec,
+            'rule': rule,
+            'match_cutoff': cutoff,
+            'beta_log_wage': fit.params[i, j] if varies[i] else np.nan,
+            'se_hc3': fit.bse[i, j] if varies[i] else np.nan,
+            'p_value': fit.pvalues[i, j] if varies[i] else np.nan,
+            'n_socs': int(in_sample[i].sum()),
+            'iterations': fit.iterations[i],
+        })
+poisson_grid = pd.DataFrame(grid_rows)
+main_cell = cells.index[(cells['rule'] == 'all') & cells['match_cutoff'].isna()][0]
+no_amb_cell = cells.index[(cells['rule'] == 'no_ambiguous') & cells['match_cutoff'].isna()][0]
+
+
+def print_poisson(fit, i, label):
+    """Coefficient table for fit i of a batch (z-tests, HC3)."""
+    table = pd.DataFrame({
+        'coef': fit.params[i],
+        'std err (HC3)': fit.bse[i],
+        'z': fit.tvalues[i],
+        'P>|z|': fit.pvalues[i],
+    }, index=list(fit.names))
+    print(f"\n{label}: N = {int(fit.nobs[i]):,} SOCs, deviance = {fit.deviance[i]:,.1f}, "
+          f"{fit.iterations[i]} IRLS iterations")
+    print(table.to_string(float_format=lambda v: f"{v:.4f}"))
+
+
+glm_poisson = grid_fits['controls']
+print_poisson(glm_poisson, main_cell, "GLM Poisson (quasi-likelihood), offset log(employment)")
 
 # ================================
 # MODEL A2: LOG-LINEAR OLS (PRIMARY)
@@ -246,29 +334,9 @@ print("\n" + "="*80)
 print("SENSITIVITY ANALYSIS: Excluding ambiguous mappings")
 print("="*80)
 
-# SOC-level without ambiguous
-soc_agg_no_amb = df_clean[~df_clean['is_ambiguous']].groupby('soc_6digit').agg({
-    'api_usage_count': 'sum',
-    'TOT_EMP': 'first',
-    'wage_annual': 'first',
-    'is_core_task': 'mean',
-    'match_score': 'mean'
-}).reset_index()
-
-soc_agg_no_amb['log_wage'] = np.log(soc_agg_no_amb['wage_annual'])
-soc_agg_no_amb['log_employment'] = np.log(soc_agg_no_amb['TOT_EMP'])
-
-print(f"\nSOCs in non-ambiguous sample: {len(soc_agg_no_amb):,}")
-
-glm_poisson_no_amb = sm.GLM(
-    endog=soc_agg_no_amb['api_usage_count'],
-    exog=sm.add_constant(soc_agg_no_amb[['log_wage', 'is_core_task', 'match_score']].fillna(0)),
-    family=sm.families.Poisson(),
-    offset=soc_agg_no_amb['log_employment']
-).fit(cov_type='HC3')
-
-print("\nGLM Poisson (excluding ambiguous):")
-print(glm_poisson_no_amb.summary().as_text())
+# SOC-level without ambiguous: a cell of the Poisson grid fit above
+print(f"\nSOCs in non-ambiguous sample: {int(glm_poisson.nobs[no_amb_cell]):,}")
+print_poisson(glm_poisson, no_amb_cell, "GLM Poisson (excluding ambiguous)")
 
 # Task-level without ambiguous
 task_no_amb = task_reg_data[task_reg_data['is_ambiguous_num'] == 0]
@@ -282,6 +350,37 @@ task_model_no_amb = OLS(
 print("\nTask-level OLS (excluding ambiguous):")
 print(task_model_no_amb.summary().as_text())
 
+# ================================
+# SENSITIVITY: POISSON GRID AND SOC BOOTSTRAP
+# ================================
+print("\n" + "="*80)
+print("SENSITIVITY ANALYSIS: Poisson β(log_wage) across sample rules and specifications")
+print("="*80)
+print(f"\n{len(poisson_grid)} Poisson fits ({len(cells)} task-sample cells × {len(POISSON_SPECS)} specifications), "
+      f"two batched calls")
+grid_view = poisson_grid.fillna({'match_cutoff': 'none'}).pivot_table(index=['rule', 'match_cutoff'], columns='spec', values='beta_log_wage',
+                                     dropna=False, sort=False)
+print(grid_view.to_string(float_format=lambda v: f"{v:.4f}"))
+
+main_data_weights = (n_tasks[main_cell] > 0)
+boot_rng = np.random.default_rng(SEED)
+boot_counts = np.zeros((BOOTSTRAP_REPS, len(soc_codes)))
+boot_counts[:, main_data_weights] = boot_rng.multinomial(
+    main_data_weights.sum(), np.full(main_data_weights.sum(), 1 / main_data_weights.sum()), size=BOOTSTRAP_REPS)
+X_main = np.column_stack([np.ones(len(soc_codes))] + [cell_regressors[r][main_cell] for r in POISSON_SPECS['controls']])
+boot_start = time.perf_counter()
+boot = fit_poisson_batch(cell_usage[main_cell], X_main, offset=cell_offset, weights=boot_counts,
+                         cov_type='nonrobust', start_params=glm_poisson.params[main_cell])
+boot_seconds = time.perf_counter() - boot_start
+boot_beta = boot.params[:, glm_poisson.index('log_wage')]
+boot_se = boot_beta.std(ddof=1)
+boot_ci = np.quantile(boot_beta, [0.025, 0.975])
+print(f"\nSOC bootstrap of the main Poisson model ({BOOTSTRAP_REPS:,} replicates in {boot_seconds:.2f}s, "
+      f"warm-started; mean {boot.iterations.mean():.1f} IRLS iterations):")
+print(f"  β(log_wage) = {glm_poisson.params[main_cell, glm_poisson.index('log_wage')]:.4f}, "
+      f"HC3 SE {glm_poisson.bse[main_cell, glm_poisson.index('log_wage')]:.4f}, bootstrap SE {boot_se:.4f}, "
+      f"95% percentile CI [{boot_ci[0]:.4f}, {boot_ci[1]:.4f}]")
+
 # ================================
 # RESULTS SUMMARY
 # ================================
@@ -298,29 +397,29 @@ summary_results = pd.DataFrame({
         'B1: Task-level OLS (no amb)'
     ],
     'Beta_log_wage': [
-        glm_poisson.params['log_wage'],
-        glm_poisson_no_amb.params['log_wage'],
+        glm_poisson.params[main_cell, glm_poisson.index('log_wage')],
+        glm_poisson.params[no_amb_cell, glm_poisson.index('log_wage')],
         ols_model.params['log_wage'],
         task_model.params['log_wage'],
         task_model_no_amb.params['log_wage']
     ],
     'SE': [
-        glm_poisson.bse['log_wage'],
-        glm_poisson_no_amb.bse['log_wage'],
+        glm_poisson.bse[main_cell, glm_poisson.index('log_wage')],
+        glm_poisson.bse[no_amb_cell, glm_poisson.index('log_wage')],
         ols_model.bse['log_wage'],
         task_model.bse['log_wage'],
         task_model_no_amb.bse['log_wage']
     ],
     'P_value': [
-        glm_poisson.pvalues['log_wage'],
-        glm_poisson_no_amb.pvalues['log_wage'],
+        glm_poisson.pvalues[main_cell, glm_poisson.index('log_wage')],
+        glm_poisson.pvalues[no_amb_cell, glm_poisson.index('log_wage')],
         ols_model.pvalues['log_wage'],
         task_model.pvalues['log_wage'],
         task_model_no_amb.pvalues['log_wage']
     ],
     'N': [
-        len(poisson_data),
-        len(soc_agg_no_amb),
+        int(glm_poisson.nobs[main_cell]),
+        int(glm_poisson.nobs[no_amb_cell]),
         len(ols_data),
         len(task_reg_data),
         len(task_no_amb)
@@ -347,6 +446,27 @@ print("See INTERPRETATION.md for full theoretical discussion.")
 # Save results
 summary_results.to_csv(OUTPUT_DIR / 'model_summary.csv', index=False)
 soc_agg.to_csv(OUTPUT_DIR / 'soc_level_data.csv', index=False)
+poisson_grid.to_csv(OUTPUT_DIR / 'poisson_sensitivity.csv', index=False)
+
+metrics = table_metrics(summary_results, 'Model', ['Beta_log_wage', 'SE', 'P_value', 'N'])
+metrics['A1: GLM Poisson (full)'].update({'SE_bootstrap': boot_se, 'CI_low_bootstrap': boot_ci[0],
+                                          'CI_high_bootstrap': boot_ci[1]})
+metrics['poisson_grid'] = {
+    'n_fits': len(poisson_grid),
+    'share_positive': (poisson_grid['beta_log_wage'] > 0).mean(),
+    'share_significant': (poisson_grid['p_value'] < 0.05).mean(),
+}
+
+# Append to run history (data/runs/)
+run_id = record_run(
+    'oring_usage_wage',
+    metrics,
+    config={'exclusion_rules': EXCLUSION_RULES, 'match_cutoffs': MATCH_CUTOFFS, 'bootstrap_reps': BOOTSTRAP_REPS},
+    inputs=[DATA_PATH],
+    timings={'total': time.perf_counter() - RUN_START, 'poisson_bootstrap': boot_seconds},
+)
+if run_id is not None:
+    print(f"✓ Recorded run {run_id}")
 
 print(f"\n✓ Results saved to: {OUTPUT_DIR}")
 print("\n" + "="*80)
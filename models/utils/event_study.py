@@ -0,0 +1,286 @@
+"""
+Event-Study Estimator
+=====================
+
+Leads and lags of exposure × year on an occupation × year wage panel:
+
+    y_it = α_i + λ_t + Σ_{k ≠ ref} β_k · exposure_i · 1[t = k] + ε_it
+
+Occupation (α_i) and year (λ_t) fixed effects are absorbed by alternating
+projections (iterative demeaning within each fixed effect until the means
+vanish) rather than dummy matrices, and standard errors are clustered by
+occupation. β_k for years before the event are leads: jointly zero under
+parallel pre-trends (EventStudyResult.pretrend_test). The reference
+year (default: the year before the event) is normalized to zero.
+
+Demeaning is linear, so every outcome and every exposure × year column of
+a batch is absorbed in one sparse pass; the specifications are then solved
+together by the batched OLS kernel (ols_kernel.fit_batch: one QR per
+exposure, shared by all outcomes; CR1 covariance with the absorbed
+parameters counted). Batches of thousands of
+exposure definitions (alternative measures, placebo draws) are processed
+in chunks of CHUNK_SIZE exposures.
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import sparse, stats
+
+from ols_kernel import fit_batch
+
+# --- CONFIGURATION ---
+EVENT_YEAR = 2023         # First year with LLMs available (released March 2023)
+ABSORB_TOL = 1e-12        # Max absolute group mean left after demeaning
+ABSORB_MAX_ITER = 1000
+CHUNK_SIZE = 64           # Exposures absorbed per pass in event_study() (bounds memory)
+
+
+@dataclass(frozen=True, eq=False)
+class EventStudyResult:
+    """One outcome × exposure event study (tables are built on access)."""
+
+    outcome: str
+    exposure: str
+    years: np.ndarray             # Estimated years (reference year omitted)
+    reference_year: int
+    event_year: int
+    beta: np.ndarray              # β_k for each of years
+    vcov: np.ndarray              # Clustered covariance of beta
+    nobs: int
+    n_clusters: int
+    iterations: int               # Alternating-projection sweeps to convergence
+
+    @property
+    def se(self):
+        return np.sqrt(np.diag(self.vcov))
+
+    @property
+    def coefficients(self):
+        """year, relative_year, beta, se, pvalue, ci_low, ci_high; reference year row is (0, NaN)."""
+        se = self.se
+        z = stats.norm.ppf(0.975)
+        table = pd.DataFrame({
+            'year': self.years,
+            'relative_year': self.years - self.event_year,
+            'beta': self.beta,
+            'se': se,
+            'pvalue': 2 * stats.norm.sf(np.abs(self.beta / se)),
+            'ci_low': self.beta - z * se,
+            'ci_high': self.beta + z * se,
+        })
+        reference = pd.DataFrame({'year': [self.reference_year],
+                                  'relative_year': [self.reference_year - self.event_year],
+                                  'beta': [0.0], 'se': [np.nan], 'pvalue': [np.nan],
+                                  'ci_low': [0.0], 'ci_high': [0.0]})
+        return pd.concat([table, reference], ignore_index=True).sort_values('year', ignore_index=True)
+
+    @property
+    def lead_index(self):
+        """Positions in years of pre-event years other than the reference."""
+        return np.flatnonzero(self.years < self.event_year)
+
+    def pretrend_test(self):
+        """(Wald χ², df, p-value) that all leads are zero; NaN without leads."""
+        leads = self.lead_index
+        if not len(leads):
+            return np.nan, 0, np.nan
+        b, V = self.beta[leads], self.vcov[np.ix_(leads, leads)]
+        stat = float(b @ np.linalg.solve(V, b))
+        return stat, len(leads), stats.chi2.sf(stat, len(leads))
+
+
+def _indicator(codes, n_groups):
+    """Sparse (n_groups × n) group-membership matrix."""
+    n = len(codes)
+    return sparse.csr_matrix((np.ones(n), (codes, np.arange(n))), shape=(n_groups, n))
+
+
+def absorb(values, groups, tol=ABSORB_TOL, max_iter=ABSORB_MAX_ITER):
+    """
+    Residualize columns on one or more sets of fixed effects (alternating projections).
+
+    Parameters
+    ----------
+    values : array-like, shape (n,) or (n, k)
+    groups : list of array-like
+        One length-n label array per fixed effect (e.g. [soc_code, year])
+    tol : float
+        Stop when no group mean exceeds tol in absolute value
+    max_iter : int
+
+    Returns
+    -------
+    (np.ndarray, int)
+        Demeaned values (same shape as input) and sweeps used. A balanced
+        two-way panel converges in one sweep (the second confirms it).
+    """
+    X = np.array(values, dtype=np.float64)
+    squeeze = X.ndim == 1
+    X = X.reshape(len(X), -1)
+
+    projections = []
+    for labels in groups:
+        codes, uniques = pd.factorize(np.asarray(labels))
+        indicator = _indicator(codes, len(uniques))
+        projections.append((indicator, indicator.T.tocsr(), np.bincount(codes)[:, None]))
+
+    for iteration in range(1, max_iter + 1):
+        largest = 0.0
+        for indicator, scatter, counts in projections:
+            means = (indicator @ X) / counts
+            X -= scatter @ means
+            largest = max(largest, np.abs(means).max(initial=0.0))
+        if largest <= tol or len(projections) == 1:
+            break
+    else:
+        warnings.warn(f"Fixed effects not absorbed to tol={tol} after {max_iter} sweeps")
+    return (X[:, 0] if squeeze else X), iteration
+
+
+def _nested(inner, outer):
+    """True if every level of inner lies within a single level of outer."""
+    pairs = pd.DataFrame({'inner': np.asarray(inner), 'outer': np.asarray(outer)}).drop_duplicates()
+    return not pairs['inner'].duplicated().any()
+
+
+def absorbed_dof(groups, clusters=None):
+    """
+    Parameters absorbed by the fixed effects, for the small-sample correction.
+
+    Counts a constant plus (levels - 1) per fixed effect, as with dummies;
+    fixed effects nested within clusters are not counted (their parameters
+    do not reduce the effective number of clusters).
+    """
+    dof = 1
+    for labels in groups:
+        if clusters is not None and _nested(labels, clusters):
+            continue
+        dof += pd.unique(np.asarray(labels)).size - 1
+    return dof
+
+
+def event_study(panel, exposures, outcomes=('ln_wage',), event_year=EVENT_YEAR, reference_year=None,
+                entity_col='soc_code', time_col='year', cluster_col=None, chunk_size=CHUNK_SIZE):
+    """
+    Event studies for every outcome × exposure pair, sharing one demeaning pass per chunk.
+
+    Parameters
+    ----------
+    panel : pd.DataFrame
+        Long occupation × year panel (e.g. wage_validation.wage_long merged with exposure)
+    exposures : str, list of str, or pd.DataFrame
+        Time-invariant exposure columns of panel, or a frame of exposure
+        columns aligned with panel's rows (e.g. many placebo draws)
+    outcomes : sequence of str
+        Outcome columns (e.g. ln_wage, ln_employment)
+    event_year : int
+        First treated year; relative_year = year - event_year
+    reference_year : int, optional
+        Omitted year (default event_year - 1)
+    entity_col, time_col : str
+        Fixed effects (and time variable)
+    cluster_col : str, optional
+        Cluster variable (default: entity_col)
+
+    Returns
+    -------
+    dict
+        {(outcome, exposure): EventStudyResult}. All specifications use the
+        rows where every outcome and exposure is finite.
+    """
+    if isinstance(exposures, str):
+        exposures = [exposures]
+    exposure_frame = exposures if isinstance(exposures, pd.DataFrame) else panel[list(exposures)]
+    exposure_frame = exposure_frame.set_axis(panel.index, axis=0)
+    outcomes = list(outcomes)
+    reference_year = event_year - 1 if reference_year is None else reference_year
+    cluster_col = entity_col if cluster_col is None else cluster_col
+
+    sample = (np.isfinite(panel[outcomes].to_numpy(dtype=np.float64)).all(axis=1)
+              & np.isfinite(exposure_frame.to_numpy(dtype=np.float64)).all(axis=1))
+    data = panel.loc[sample]
+    exposure_values = exposure_frame.loc[sample].to_numpy(dtype=np.float64)
+
+    all_years = np.sort(data[time_col].unique())
+    if reference_year not in all_years:
+        raise ValueError(f"Reference year {reference_year} not in panel years {all_years.tolist()}")
+    years = all_years[all_years != reference_year]
+    year_dummies = (data[time_col].to_numpy()[:, None] == years[None, :]).astype(np.float64)
+
+    groups = [data[entity_col].to_numpy(), data[time_col].to_numpy()]
+    cluster_codes, cluster_levels = pd.factorize(data[cluster_col].to_numpy())
+    df_extra = absorbed_dof(groups, data[cluster_col].to_numpy())
+
+    y_all, iterations = absorb(data[outcomes].to_numpy(dtype=np.float64), groups)
+    n, n_years = len(data), len(years)
+    results = {}
+    for start in range(0, exposure_values.shape[1], chunk_size):
+        chunk = exposure_values[:, start:start + chunk_size]
+        m = chunk.shape[1]
+        # (n, m, years) interactions for m exposures, absorbed in one pass
+        X, _ = absorb((chunk[:, :, None] * year_dummies[:, None, :]).reshape(n, -1), groups)
+        X = X.reshape(n, m, n_years)
+
+        # Batched OLS over exposures × outcomes: beta (m, outcomes, years)
+        fit = fit_batch(y_all, X.transpose(1, 0, 2), cov_type='cluster', groups=cluster_codes, df_extra=df_extra)
+        beta, vcov = fit.params, fit.vcov
+
+        for j in range(m):
+            name = str(exposure_frame.columns[start + j])
+            for i, outcome in enumerate(outcomes):
+                results[outcome, name] = EventStudyResult(
+                    outcome=outcome,
+                    exposure=name,
+                    years=years,
+                    reference_year=reference_year,
+                    event_year=event_year,
+                    beta=beta[j, i],
+                    vcov=vcov[j, i],
+                    nobs=n,
+                    n_clusters=len(cluster_levels),
+                    iterations=iterations,
+                )
+    return results
+
+
+def coefficient_table(results):
+    """Stack EventStudyResult coefficients into one tidy frame (outcome, exposure, year, ...)."""
+    frames = [
+        result.coefficients.assign(outcome=outcome, exposure=exposure,
+                                   pretrend_pvalue=result.pretrend_test()[2], nobs=result.nobs)
+        for (outcome, exposure), result in results.items()
+    ]
+    table = pd.concat(frames, ignore_index=True)
+    first = ['outcome', 'exposure']
+    return table[first + [c for c in table.columns if c not in first]]
+
+
+def render_event_study_figure(results, path, dpi=300):
+    """Coefficient plot (β_k with 95% CI by relative year), one panel per result."""
+    import matplotlib.pyplot as plt
+
+    results = list(results)
+    fig, axes = plt.subplots(1, len(results), figsize=(7 * len(results), 5), squeeze=False)
+    for ax, result in zip(axes[0], results):
+        table = result.coefficients
+        ax.errorbar(table['relative_year'], table['beta'],
+                    yerr=[table['beta'] - table['ci_low'], table['ci_high'] - table['beta']],
+                    fmt='o-', capsize=4, linewidth=2, markersize=6)
+        ax.axhline(0, color='gray', linewidth=1)
+        ax.axvline(-0.5, color='r', linestyle='--', alpha=0.6, label=f'Event ({result.event_year})')
+        ax.set_xlabel(f'Years relative to {result.event_year}')
+        ax.set_ylabel(f'β (× {result.exposure})')
+        ax.set_title(f'{result.outcome} on {result.exposure} × year')
+        ax.legend()
+        ax.grid(alpha=0.3)
+
+    plt.tight_layout()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return path
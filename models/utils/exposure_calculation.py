@@ -4,12 +4,42 @@ Shared Exposure Calculation Utilities
 
 Common functions for calculating AI exposure with task importance weighting.
 
+The O*NET Task Ratings workbook is parsed at most once per process by
+load_task_importance: the importance (Scale ID 'IM') subset is kept in
+memory and also written to a Parquet file under data/cache/onet/, keyed by
+the workbook's size and modification time, so later processes skip the
+Excel parse entirely.
+
+load_importance_matrix turns that subset into a sparse (SOC × task)
+ImportanceMatrix, also once per O*NET version. Occupation exposure for any
+number of usage or indicator vectors (API releases, bootstrap replicates,
+allocation rules) is then one sparse-dense product;
+calculate_importance_weighted_exposure is a wrapper for a single crosswalk.
+
 Author: Ilan Strauss | AI Disclosures Project
 Date: January 2026
 """
 
+import functools
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
+from scipy import sparse
+
+ROOT_DIR = Path(__file__).parent.parent.parent  # anthropic-onet-crosswalk/
+DEFAULT_ONET_DIR = ROOT_DIR / "data" / "onet" / "db_30_1_excel"
+TASK_IMPORTANCE_CACHE_DIR = ROOT_DIR / "data" / "cache" / "onet"
+TASK_RATINGS_COLUMNS = ['O*NET-SOC Code', 'Task ID', 'Scale ID', 'Data Value']
+
+
+# Built-in groupby 'first' skips nulls (skipna=True), so it returns the first
+# non-null value per group (NaN if none) without a Python call per group.
+# first_nonnull is the reference implementation of those semantics; see
+# benchmark_aggregation.py for the comparison.
+FIRST_NONNULL = 'first'
 
 
 def first_nonnull(x):
@@ -18,6 +48,158 @@ def first_nonnull(x):
     return x.iloc[0] if len(x) else np.nan
 
 
+@functools.lru_cache(maxsize=4)
+def _load_task_importance(path, size, mtime_ns):
+    """Parse (or read the on-disk copy of) one Task Ratings version; keyed on its size and mtime."""
+    cache_file = TASK_IMPORTANCE_CACHE_DIR / f"task_importance_{size}_{mtime_ns}.parquet"
+    try:
+        importance = pd.read_parquet(cache_file)
+        print(f"  Loaded cached O*NET task importance ({cache_file.name})")
+        return importance
+    except (OSError, ImportError, ValueError):
+        pass
+
+    print("  Parsing O*NET Task Ratings workbook...")
+    task_ratings = pd.read_excel(path, usecols=TASK_RATINGS_COLUMNS)
+
+    # Filter for Importance scale
+    importance = task_ratings.loc[task_ratings['Scale ID'] == 'IM', [
+        'O*NET-SOC Code',
+        'Task ID',
+        'Data Value'
+    ]].rename(columns={
+        'O*NET-SOC Code': 'onet_soc_code',
+        'Task ID': 'onet_task_id',
+        'Data Value': 'task_importance'
+    }).reset_index(drop=True)
+
+    # Columnar copy for later processes (written atomically; skipped without a Parquet engine)
+    try:
+        TASK_IMPORTANCE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        importance.to_parquet(tmp, index=False)
+        os.replace(tmp, cache_file)
+    except (OSError, ImportError):
+        pass
+    return importance
+
+
+def load_task_importance(onet_dir=None):
+    """
+    O*NET task importance ratings (Scale ID 'IM'), parsed once per process.
+
+    Parameters
+    ----------
+    onet_dir : Path, optional
+        Path to O*NET database directory. If None, uses default location.
+
+    Returns
+    -------
+    pd.DataFrame
+        onet_soc_code, onet_task_id, task_importance. Shared between
+        callers in the process, so treat it as read-only.
+    """
+    task_ratings_file = Path(onet_dir if onet_dir is not None else DEFAULT_ONET_DIR) / "Task Ratings.xlsx"
+    stat = task_ratings_file.stat()
+    return _load_task_importance(str(task_ratings_file.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+@dataclass(frozen=True)
+class ImportanceMatrix:
+    """
+    Sparse O*NET importance matrix: one row per SOC, one column per task.
+
+    Columns are the unique (SOC, Task ID) pairs of the task universe, so each
+    column has exactly one nonzero (its occupation's importance rating).
+    Exposure of SOC i to a task-level indicator vector u is
+    (matrix @ u)_i / row_sums_i.
+    """
+
+    soc_codes: np.ndarray       # (n_soc,) sorted O*NET-SOC codes (row labels)
+    task_soc: np.ndarray        # (n_task,) row position of each task's occupation
+    task_ids: np.ndarray        # (n_task,) O*NET Task IDs (column labels)
+    matrix: sparse.csr_matrix   # (n_soc, n_task) task importance
+    row_sums: np.ndarray        # (n_soc,) total task importance per SOC
+
+    @classmethod
+    def from_importance(cls, importance):
+        """Build from a load_task_importance frame (duplicate pairs keep their first rating)."""
+        pairs = importance.drop_duplicates(['onet_soc_code', 'onet_task_id'])
+        soc_codes, task_soc = np.unique(pairs['onet_soc_code'].to_numpy(dtype=str), return_inverse=True)
+        n_task = len(pairs)
+        matrix = sparse.csr_matrix(
+            (pairs['task_importance'].to_numpy(dtype=np.float64), (task_soc, np.arange(n_task))),
+            shape=(len(soc_codes), n_task),
+        )
+        return cls(
+            soc_codes=soc_codes,
+            task_soc=task_soc,
+            task_ids=pairs['onet_task_id'].to_numpy(),
+            matrix=matrix,
+            row_sums=np.asarray(matrix.sum(axis=1)).ravel(),
+        )
+
+    @property
+    def n_tasks(self):
+        return self.matrix.shape[1]
+
+    def task_index(self, soc_codes, task_ids):
+        """Column of each (SOC, Task ID) pair; -1 for pairs outside the task universe."""
+        keys = pd.MultiIndex.from_arrays([self.soc_codes[self.task_soc], self.task_ids])
+        lookup = pd.MultiIndex.from_arrays([np.asarray(soc_codes, dtype=str), np.asarray(task_ids)])
+        return keys.get_indexer(lookup)
+
+    def task_vectors(self, soc_codes, task_ids, values):
+        """
+        Sum row-level values (shape (n_rows,) or (n_rows, k)) into task columns.
+
+        Rows whose (SOC, Task ID) pair is not in the task universe are
+        dropped, as in a left join onto the universe.
+        """
+        values = np.nan_to_num(np.asarray(values, dtype=np.float64))
+        cols = self.task_index(soc_codes, task_ids)
+        keep = cols >= 0
+        rows = np.flatnonzero(keep)
+        assign = sparse.csr_matrix(
+            (np.ones(len(rows)), (cols[keep], rows)), shape=(self.n_tasks, len(values))
+        )
+        return assign @ values
+
+    def ai_importance(self, usage):
+        """Importance of AI-touched tasks per SOC: matrix @ 1[usage > 0] (usage (n_task,) or (n_task, k))."""
+        return self.matrix @ (np.asarray(usage) > 0).astype(np.float64)
+
+    def exposure(self, usage):
+        """Importance-weighted exposure per SOC for one or more task-level usage vectors."""
+        ai = self.ai_importance(usage)
+        sums = self.row_sums if ai.ndim == 1 else self.row_sums[:, None]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.clip(ai / sums, 0, 1)
+
+
+@functools.lru_cache(maxsize=4)
+def _importance_matrix(path, size, mtime_ns):
+    return ImportanceMatrix.from_importance(_load_task_importance(path, size, mtime_ns))
+
+
+def load_importance_matrix(onet_dir=None):
+    """
+    Sparse (SOC × task) importance matrix for one O*NET version, built once per process.
+
+    Parameters
+    ----------
+    onet_dir : Path, optional
+        Path to O*NET database directory. If None, uses default location.
+
+    Returns
+    -------
+    ImportanceMatrix
+    """
+    task_ratings_file = Path(onet_dir if onet_dir is not None else DEFAULT_ONET_DIR) / "Task Ratings.xlsx"
+    stat = task_ratings_file.stat()
+    return _importance_matrix(str(task_ratings_file.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
 def calculate_importance_weighted_exposure(crosswalk_df, onet_dir=None):
     """
     Calculate occupation-level AI exposure using task importance weights.
@@ -26,6 +208,9 @@ def calculate_importance_weighted_exposure(crosswalk_df, onet_dir=None):
     exposure, we need the FULL O*NET task universe to compute:
     exposure = (importance of AI-touched tasks) / (total importance of ALL tasks)
 
+    Each O*NET task counts once in both numerator and denominator, even when
+    several crosswalk rows map to it (their usage is summed).
+
     Parameters
     ----------
     crosswalk_df : pd.DataFrame
@@ -38,77 +223,34 @@ def calculate_importance_weighted_exposure(crosswalk_df, onet_dir=None):
     pd.DataFrame
         Occupation-level data with ai_exposure in [0,1]
     """
-    from pathlib import Path
-
     # Load full O*NET task ratings to get ALL tasks (not just Claude-touched ones)
-    if onet_dir is None:
-        onet_dir = Path(__file__).parent.parent.parent / "data" / "onet" / "db_30_1_excel"
-
-    task_ratings_file = onet_dir / "Task Ratings.xlsx"
-
     print("  Loading full O*NET task universe...")
-    task_ratings = pd.read_excel(task_ratings_file)
-
-    # Filter for Importance scale
-    importance = task_ratings[task_ratings['Scale ID'] == 'IM'].copy()
-    importance = importance[[
-        'O*NET-SOC Code',
-        'Task ID',
-        'Data Value'
-    ]].rename(columns={
-        'O*NET-SOC Code': 'onet_soc_code',
-        'Task ID': 'onet_task_id',
-        'Data Value': 'task_importance'
-    })
-
-    print(f"  Full task universe: {len(importance):,} (occ, task) pairs")
-
-    # Get Claude usage from crosswalk (only has tasks WITH usage)
-    claude_usage = crosswalk_df[[
-        'onet_soc_code',
-        'onet_task_id',
-        'api_usage_count',
-        'TOT_EMP',
-        'A_MEAN',
-        'A_MEDIAN',
-        'onet_occupation_title',
-        'job_zone' if 'job_zone' in crosswalk_df.columns else 'Job Zone'
-    ]].copy()
-
-    # Rename job_zone if needed
-    if 'Job Zone' in claude_usage.columns:
-        claude_usage = claude_usage.rename(columns={'Job Zone': 'job_zone'})
-
-    # Merge full task universe with Claude usage (left join on importance)
-    # Tasks without Claude usage will have api_usage_count = NaN
-    full_tasks = importance.merge(
-        claude_usage,
-        on=['onet_soc_code', 'onet_task_id'],
-        how='left'
+    universe = load_importance_matrix(onet_dir)
+    print(f"  Full task universe: {universe.n_tasks:,} (occ, task) pairs")
+
+    # Claude usage per task column (crosswalk rows outside the universe are dropped)
+    task_col = universe.task_index(crosswalk_df['onet_soc_code'], crosswalk_df['onet_task_id'])
+    matched = crosswalk_df[task_col >= 0]
+    usage = universe.task_vectors(matched['onet_soc_code'], matched['onet_task_id'],
+                                  matched['api_usage_count'])
+    print(f"  Tasks with Claude usage: {(usage > 0).sum():,.0f}")
+
+    # Occupation attributes from the matched crosswalk rows
+    job_zone_col = 'job_zone' if 'job_zone' in crosswalk_df.columns else 'Job Zone'
+    attributes = matched.groupby('onet_soc_code').agg(
+        A_MEAN=("A_MEAN", FIRST_NONNULL),
+        A_MEDIAN=("A_MEDIAN", FIRST_NONNULL),
+        TOT_EMP=("TOT_EMP", FIRST_NONNULL),
+        onet_occupation_title=("onet_occupation_title", FIRST_NONNULL),
+        job_zone=(job_zone_col, FIRST_NONNULL)
     )
 
-    # Fill missing usage with 0
-    full_tasks['api_usage_count'] = full_tasks['api_usage_count'].fillna(0)
-
-    # Binary indicator: does this task have Claude usage?
-    full_tasks['has_claude_usage'] = (full_tasks['api_usage_count'] > 0).astype(float)
-
-    # Importance of AI-touched tasks
-    full_tasks['ai_task_importance'] = full_tasks['task_importance'] * full_tasks['has_claude_usage']
-
-    print(f"  Tasks with Claude usage: {full_tasks['has_claude_usage'].sum():,.0f}")
-
-    # Aggregate to occupation level
-    occ = full_tasks.groupby("onet_soc_code").agg(
-        total_task_importance=("task_importance", "sum"),
-        ai_task_importance=("ai_task_importance", "sum"),
-        api_usage_count=("api_usage_count", "sum"),
-        A_MEAN=("A_MEAN", first_nonnull),
-        A_MEDIAN=("A_MEDIAN", first_nonnull),
-        TOT_EMP=("TOT_EMP", first_nonnull),
-        onet_occupation_title=("onet_occupation_title", first_nonnull),
-        job_zone=("job_zone", first_nonnull)
-    ).reset_index()
+    occ = pd.DataFrame({
+        'onet_soc_code': universe.soc_codes,
+        'total_task_importance': universe.row_sums,
+        'ai_task_importance': universe.ai_importance(usage),
+        'api_usage_count': np.bincount(universe.task_soc, weights=usage, minlength=len(universe.soc_codes)),
+    }).join(attributes, on='onet_soc_code')
 
     # Drop rows missing employment/wage data (not in BLS)
     occ = occ[
@@ -116,16 +258,13 @@ def calculate_importance_weighted_exposure(crosswalk_df, onet_dir=None):
         occ["TOT_EMP"].notna() &
         (occ["TOT_EMP"] > 0) &
         (occ["total_task_importance"] > 0)
-    ].copy()
+    ].reset_index(drop=True)
 
     print(f"  Occupations with wage data: {len(occ):,}")
 
     # IMPORTANCE-WEIGHTED EXPOSURE
     # What fraction of high-importance work in this occupation is AI-exposed?
-    occ["ai_exposure"] = occ["ai_task_importance"] / occ["total_task_importance"]
-
-    # Ensure [0,1] bounds
-    occ["ai_exposure"] = occ["ai_exposure"].clip(0, 1)
+    occ["ai_exposure"] = (occ["ai_task_importance"] / occ["total_task_importance"]).clip(0, 1)
 
     # Also compute simple usage_per_worker for comparison
     occ["usage_per_worker"] = occ["api_usage_count"] / occ["TOT_EMP"]
@@ -158,11 +297,11 @@ def calculate_simple_usage_intensity(df):
     # Occupation-level totals
     occ = df.groupby("onet_soc_code").agg(
         api_usage_count=("api_usage_count", "sum"),
-        A_MEAN=("A_MEAN", first_nonnull),
-        A_MEDIAN=("A_MEDIAN", first_nonnull),
-        TOT_EMP=("TOT_EMP", first_nonnull),
-        onet_occupation_title=("onet_occupation_title", first_nonnull),
-        job_zone=("job_zone", first_nonnull) if "job_zone" in df.columns else ("Job Zone", first_nonnull)
+        A_MEAN=("A_MEAN", FIRST_NONNULL),
+        A_MEDIAN=("A_MEDIAN", FIRST_NONNULL),
+        TOT_EMP=("TOT_EMP", FIRST_NONNULL),
+        onet_occupation_title=("onet_occupation_title", FIRST_NONNULL),
+        job_zone=("job_zone", FIRST_NONNULL) if "job_zone" in df.columns else ("Job Zone", FIRST_NONNULL)
     ).reset_index()
 
     # Drop rows missing key denominators
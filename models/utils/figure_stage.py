@@ -0,0 +1,181 @@
+"""
+Figure Stage
+============
+
+Renders the validation figures from the result tables the scripts save,
+as a separate, optional step: estimation never waits on matplotlib, and
+sweeps that skip figures lose nothing that cannot be drawn later.
+
+    FIGURES          {name: Figure(module, function, inputs, output)}
+    render_figures   Render the requested figures into an output directory
+    print_figures    One line per figure: saved, unchanged or missing inputs
+
+Each renderer is called with its input tables (read with pd.read_csv, in
+the order listed), the output path and dpi; its module is only imported
+when the figure is drawn, under the non-interactive Agg backend.
+
+A figure is skipped when its PNG exists and nothing it depends on has
+changed since it was drawn: the content digests of its input tables and
+of the renderer's source file, and the dpi, are compared with those
+recorded in figure_manifest.json next to the figures. Digests come from
+run_store.hash_inputs, so a table rewritten with identical contents
+counts as unchanged. With workers > 1 figures render in a process pool
+(pyplot is not thread-safe).
+
+Usage:
+    python crosswalk.py figures                          # every figure whose tables exist
+    python crosswalk.py figures did empirical_validation --force
+    python crosswalk.py figures --workers 3
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import importlib
+import importlib.util
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from run_store import hash_inputs
+
+# --- CONFIGURATION ---
+ROOT_DIR = Path(__file__).parent.parent.parent  # anthropic-onet-crosswalk/
+OUTPUT_DIR = ROOT_DIR / "models" / "acemoglu_restrepo" / "output"
+MANIFEST_FILE = 'figure_manifest.json'
+DPI = 300
+
+
+@dataclass(frozen=True)
+class Figure:
+    """A renderer (module.function) and the saved tables it draws from."""
+
+    module: str
+    function: str
+    inputs: tuple             # CSV names in the output directory, passed in order
+    output: str               # PNG name in the output directory
+
+
+FIGURES = {
+    'empirical_validation': Figure('wage_validation', 'render_cross_section_figure',
+                                   ('empirical_validation_data.csv', 'empirical_validation_coefficients.csv'),
+                                   'empirical_validation_plots.png'),
+    'did': Figure('wage_validation', 'render_did_figure', ('did_panel_data.csv',), 'did_analysis_plots.png'),
+    'spec_curve': Figure('spec_curve', 'render_spec_curve', ('spec_curve_coefficients.csv',), 'spec_curve.png'),
+}
+
+
+def figure_state(figure, output_dir, dpi=DPI):
+    """What the figure depends on: input and renderer-source digests, and dpi."""
+    source = importlib.util.find_spec(figure.module).origin
+    paths = [Path(output_dir) / name for name in figure.inputs] + [Path(source)]
+    return {'digests': hash_inputs(paths), 'dpi': dpi}
+
+
+def _load_manifest(output_dir):
+    path = Path(output_dir) / MANIFEST_FILE
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return {}
+
+
+def _save_manifest(output_dir, manifest):
+    path = Path(output_dir) / MANIFEST_FILE
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def _render(task):
+    """Draw one figure (worker task); returns seconds taken."""
+    name, output_dir, dpi = task
+    import matplotlib
+    matplotlib.use('Agg')
+
+    start = time.perf_counter()
+    figure = FIGURES[name]
+    render = getattr(importlib.import_module(figure.module), figure.function)
+    tables = [pd.read_csv(Path(output_dir) / table) for table in figure.inputs]
+    render(*tables, Path(output_dir) / figure.output, dpi=dpi)
+    return time.perf_counter() - start
+
+
+def render_figures(output_dir=OUTPUT_DIR, names=None, workers=1, force=False, dpi=DPI):
+    """
+    Render figures whose inputs changed since they were last drawn.
+
+    Parameters
+    ----------
+    output_dir : Path
+        Directory holding the saved tables; figures are written next to them
+    names : sequence of str, optional
+        Keys of FIGURES (default: every figure whose input tables exist)
+    workers : int
+        Processes to render in (1: in this process)
+    force : bool
+        Redraw even if nothing changed
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per figure: figure, path, status ('rendered', 'unchanged' or
+        'missing inputs'), seconds
+    """
+    output_dir = Path(output_dir)
+    if names is None:
+        names = [name for name, figure in FIGURES.items()
+                 if all((output_dir / table).exists() for table in figure.inputs)]
+    unknown = sorted(set(names) - set(FIGURES))
+    if unknown:
+        raise ValueError(f"Unknown figures {unknown}; choose from {list(FIGURES)}")
+
+    manifest = _load_manifest(output_dir)
+    status, states, pending = {}, {}, []
+    for name in names:
+        figure = FIGURES[name]
+        if not all((output_dir / table).exists() for table in figure.inputs):
+            status[name] = 'missing inputs'
+            continue
+        states[name] = figure_state(figure, output_dir, dpi)
+        if not force and (output_dir / figure.output).exists() and manifest.get(name) == states[name]:
+            status[name] = 'unchanged'
+        else:
+            pending.append(name)
+
+    tasks = [(name, str(output_dir), dpi) for name in pending]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            seconds = list(pool.map(_render, tasks))
+    else:
+        seconds = [_render(task) for task in tasks]
+    timings = dict(zip(pending, seconds))
+
+    if pending:
+        manifest.update({name: states[name] for name in pending})
+        _save_manifest(output_dir, manifest)
+    status.update({name: 'rendered' for name in pending})
+    return pd.DataFrame({
+        'figure': list(names),
+        'path': [output_dir / FIGURES[name].output for name in names],
+        'status': [status[name] for name in names],
+        'seconds': [timings.get(name, 0.0) for name in names],
+    })
+
+
+def print_figures(table):
+    """Report a render_figures table."""
+    for row in table.itertuples():
+        if row.status == 'rendered':
+            print(f"✓ Saved plots to: {row.path} ({row.seconds:.1f}s)")
+        elif row.status == 'unchanged':
+            print(f"  Unchanged since last render: {row.path}")
+        else:
+            print(f"  Skipped {row.figure}: input tables not found ({', '.join(FIGURES[row.figure].inputs)})")
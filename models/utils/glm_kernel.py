@@ -0,0 +1,226 @@
+"""
+Batched Poisson GLM Kernel
+==========================
+
+Poisson / quasi-Poisson regression with a log link and offsets, fit by
+IRLS for many samples and specifications in one call: subsamples
+(exclusion rules, match-score cutoffs) as 0/1 row weights, bootstrap
+replicates as resampling counts, and specifications as separate outcome,
+design or offset rows.
+
+    y        (n,) or (B, n)
+    X        (n, k) or (B, n, k)
+    offset   (n,) or (B, n)
+    weights  (n,) or (B, n)      frequency weights; 0 drops a row
+
+Every IRLS step solves all unconverged fits at once (batched X'WX
+solves; a shared 2-D X is never copied per fit), and each fit stops on
+its own deviance criterion (statsmodels' rule: |ΔD| ≤ tol·(1 + |D|)).
+start_params warm-starts every fit, e.g. bootstrap replicates from the
+full-sample estimate (about 3 iterations instead of 5 on the O-ring data).
+
+Covariance, with A = (X'WX)⁻¹, W = diag(f·μ) and e = y − μ:
+
+    nonrobust   φ·A, φ = 1 (Poisson) or Pearson χ²/(Σf − k) (scale='X2')
+    HC0         A X' diag(f·e²) X A
+    HC3         A X' diag(f·e²/(1 − h)²) X A,   h = μ·diag(X A X')
+
+statsmodels' GLM(...).fit(cov_type='HC3') returns HC0 (GLM results have
+no HC3 formula and fall back to the plain sandwich), so HC0 is the one to
+compare with statsmodels; HC3 adds the leverage correction of the final
+IRLS weighted least squares. P-values use the normal distribution, as
+statsmodels GLM does by default.
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import special, stats
+
+# --- CONFIGURATION ---
+COV_TYPES = ('nonrobust', 'HC0', 'HC3')
+IRLS_TOL = 1e-8
+IRLS_MAX_ITER = 100
+
+
+@dataclass(frozen=True, eq=False)
+class PoissonBatch:
+    """
+    Coefficients and covariances for a batch of Poisson regressions.
+
+    The fit axis (B) leads every array; it is dropped when no input is
+    batched.
+    """
+
+    names: tuple              # Regressor names (k)
+    params: np.ndarray        # (B, k)
+    vcov: np.ndarray          # (B, k, k)
+    mu: np.ndarray            # (B, n) fitted means (rows with weight 0 included)
+    deviance: np.ndarray      # (B,)
+    scale: np.ndarray         # (B,) φ used in the nonrobust covariance
+    nobs: np.ndarray          # (B,) Σ weights
+    iterations: np.ndarray    # (B,) IRLS iterations
+    converged: np.ndarray     # (B,)
+    cov_type: str
+
+    @property
+    def bse(self):
+        return np.sqrt(np.diagonal(self.vcov, axis1=-2, axis2=-1))
+
+    @property
+    def tvalues(self):
+        return self.params / self.bse
+
+    @property
+    def pvalues(self):
+        """Two-sided normal p-values (statsmodels GLM default)."""
+        return 2 * stats.norm.sf(np.abs(self.tvalues))
+
+    def index(self, term):
+        """Position of a regressor name along the last params axis."""
+        return self.names.index(term)
+
+
+def _deviance(y, mu, f):
+    return 2 * (f * (special.xlogy(y, y) - special.xlogy(y, mu) - (y - mu))).sum(axis=-1)
+
+
+def fit_poisson_batch(y, X, offset=None, weights=None, cov_type='HC3', scale=1.0, names=None, start_params=None,
+                      tol=IRLS_TOL, max_iter=IRLS_MAX_ITER):
+    """
+    Poisson GLM (log link) for every fit in the batch, by IRLS.
+
+    Parameters
+    ----------
+    y : array-like (n,) or (B, n)
+        Non-negative outcomes (need not be integers: quasi-likelihood)
+    X : array-like or pd.DataFrame (n, k), or array (B, n, k)
+        Regressors, including the constant if wanted
+    offset : array-like (n,) or (B, n), optional
+        Added to the linear predictor (e.g. log employment)
+    weights : array-like (n,) or (B, n), optional
+        Frequency weights: 0/1 masks select subsamples, counts give
+        bootstrap replicates. Rows with weight 0 may hold NaN.
+    cov_type : {'nonrobust', 'HC0', 'HC3'}
+    scale : float or 'X2'
+        Dispersion for the nonrobust covariance; 'X2' is quasi-Poisson
+        (Pearson χ² / residual dof)
+    names : sequence of str, optional
+        Regressor names (default: X's columns if a DataFrame)
+    start_params : array-like (k,) or (B, k), optional
+        Warm start; by default each fit starts from μ = (y + ȳ)/2
+
+    Returns
+    -------
+    PoissonBatch
+    """
+    if cov_type not in COV_TYPES:
+        raise ValueError(f"cov_type must be one of {COV_TYPES}, got '{cov_type}'")
+    if names is None:
+        names = list(X.columns) if isinstance(X, pd.DataFrame) else [f'x{i}' for i in range(np.shape(X)[-1])]
+
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n, k = X.shape[-2:]
+    offset = np.zeros(n) if offset is None else np.asarray(offset, dtype=np.float64)
+    f = np.ones(n) if weights is None else np.asarray(weights, dtype=np.float64)
+    batched = X.ndim == 3 or y.ndim == 2 or offset.ndim == 2 or f.ndim == 2
+    n_fits = max(X.shape[0] if X.ndim == 3 else 1, *(a.shape[0] if a.ndim == 2 else 1 for a in (y, offset, f)))
+
+    # Rows outside a fit's sample contribute nothing; clear them so NaNs cannot leak
+    f = np.broadcast_to(f, (n_fits, n))
+    used = f > 0
+    y = np.where(used, np.broadcast_to(y, (n_fits, n)), 0.0)
+    offset = np.where(used, np.broadcast_to(offset, (n_fits, n)), 0.0)
+    if X.ndim == 3:
+        X = np.broadcast_to(X, (n_fits, n, k))
+        if np.isnan(X[used]).any():
+            raise ValueError("X has missing values in rows with positive weight")
+        X = np.where(used[..., None], X, 0.0)
+    else:
+        if np.isnan(X[used.any(axis=0)]).any():
+            raise ValueError("X has missing values in rows with positive weight")
+        X = np.where(used.any(axis=0)[:, None], X, 0.0)
+    if (y < 0).any() or np.isnan(y).any() or np.isnan(offset).any():
+        raise ValueError("y must be non-negative and y, offset complete in rows with positive weight")
+
+    def design(cols):
+        return X if X.ndim == 2 else X[cols]
+
+    def linear(cols, beta):
+        return (design(cols) @ beta[..., None])[..., 0] if X.ndim == 3 else beta @ X.T
+
+    nobs = f.sum(axis=1)
+    beta = np.zeros((n_fits, k))
+    if start_params is None:
+        ybar = (f * y).sum(axis=1, keepdims=True) / nobs[:, None]
+        eta = np.log((y + ybar) / 2)
+    else:
+        beta[:] = np.broadcast_to(np.asarray(start_params, dtype=np.float64), (n_fits, k))
+        eta = linear(slice(None), beta) + offset
+    deviance = _deviance(y, np.exp(eta), f)
+
+    active = np.ones(n_fits, dtype=bool)
+    iterations = np.zeros(n_fits, dtype=int)
+    for _ in range(max_iter):
+        cols = np.flatnonzero(active)
+        if not len(cols):
+            break
+        mu = np.exp(eta[cols])
+        w = f[cols] * mu
+        z = eta[cols] - offset[cols] + (y[cols] - mu) / mu
+        Xc = design(cols)
+        XtW = np.swapaxes(Xc, -1, -2) * w[:, None, :]                  # (b, k, n)
+        beta[cols] = np.linalg.solve(XtW @ Xc, (XtW @ z[..., None]))[..., 0]
+        eta[cols] = linear(cols, beta[cols]) + offset[cols]
+        new_deviance = _deviance(y[cols], np.exp(eta[cols]), f[cols])
+        iterations[cols] += 1
+        done = np.abs(new_deviance - deviance[cols]) <= tol * (1 + np.abs(new_deviance))
+        deviance[cols] = new_deviance
+        active[cols[done]] = False
+    converged = ~active
+    if not converged.all():
+        warnings.warn(f"{(~converged).sum()} of {n_fits} Poisson fits did not converge in {max_iter} iterations")
+
+    # Covariance at the final estimates
+    mu = np.exp(eta)
+    Xa = design(slice(None))
+    XtW = np.swapaxes(Xa, -1, -2) * (f * mu)[:, None, :]
+    bread = np.linalg.inv(XtW @ Xa)                                   # (B, k, k)
+    resid = y - mu
+    if isinstance(scale, str):
+        if scale != 'X2':
+            raise ValueError(f"scale must be a number or 'X2', got '{scale}'")
+        scale = (f * resid ** 2 / mu).sum(axis=1) / (nobs - k)
+    scale = np.broadcast_to(np.asarray(scale, dtype=np.float64), (n_fits,)).copy()
+    if cov_type == 'nonrobust':
+        vcov = scale[:, None, None] * bread
+    else:
+        score_weight = f * resid ** 2
+        if cov_type == 'HC3':
+            leverage = mu * np.einsum('bnk,bkl,bnl->bn', np.broadcast_to(Xa, (n_fits, n, k)), bread,
+                                      np.broadcast_to(Xa, (n_fits, n, k)))
+            score_weight = score_weight / (1 - np.where(used, leverage, 0.0)) ** 2
+        meat = (np.swapaxes(Xa, -1, -2) * score_weight[:, None, :]) @ Xa
+        vcov = bread @ meat @ bread
+
+    def shape(array):
+        return array if batched else array[0]
+
+    return PoissonBatch(
+        names=tuple(names),
+        params=shape(beta),
+        vcov=shape(vcov),
+        mu=shape(mu),
+        deviance=shape(deviance),
+        scale=shape(scale),
+        nobs=shape(nobs),
+        iterations=shape(iterations),
+        converged=shape(converged),
+        cov_type=cov_type,
+    )
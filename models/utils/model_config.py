@@ -0,0 +1,130 @@
+"""
+Model Configuration Objects
+===========================
+
+Immutable parameter sets for the Acemoglu-Restrepo, Kaleckian and
+Bhaduri-Marglin models and the nested-CES general-equilibrium solver. Every
+model function takes a ModelConfig instead of reading module-level
+constants, so any number of scenario configurations can be evaluated side
+by side (threads, processes, notebooks) without monkeypatching globals.
+
+Derived quantities (profit share, aggregate saving rate, calibrated g₀,
+aggregate MPC, multiplier) are properties, so they always match the config
+they are read from.
+
+Fields may also hold numpy arrays (e.g. Monte Carlo parameter draws); the
+derived properties are then evaluated element-wise.
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import dataclasses
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ModelConfig:
+    """
+    Behavioral parameters for the three macro models.
+
+    Defaults are the estimate_models.py baseline calibration.
+    """
+
+    # Acemoglu-Restrepo (Acemoglu & Restrepo 2018)
+    sigma: float = 1.5    # Elasticity of substitution between tasks
+                          # At σ=1 (Cobb-Douglas), task displacement has zero wage effect
+                          # As σ→∞, wage effect approaches -exposure_share
+    alpha: float = 1.0    # Displacement rate: fraction of exposed wage bill actually displaced (0-1)
+                          # α=1.0 is pessimistic "full displacement" assumption
+    phi: float = 0.0      # Productivity effect: offsetting productivity gains in remaining tasks
+                          # φ=0 is the pessimistic case (no offsetting productivity gains)
+
+    # Nested-CES general equilibrium (models/utils/nested_ces.py)
+    eta: float = 0.9      # Elasticity of substitution between occupations (Goos, Manning & Salomons 2014)
+    automation_cost_ratio: float = 0.5  # Cost of AI-performed tasks relative to the pre-shock wage
+
+    # Kaleckian (Stockhammer 2011, Onaran & Galanis 2014)
+    c_w: float = 0.80     # Marginal propensity to consume out of wages
+    c_pi: float = 0.40    # Marginal propensity to consume out of profits
+    avg_c: Optional[float] = None  # Fixed aggregate consumption propensity for the multiplier;
+                                   # None derives it from class MPCs and distribution
+
+    # Bhaduri-Marglin (Stockhammer 2017, Onaran & Galanis 2014)
+    s_w: float = 0.08     # Propensity to save out of wages - Onaran & Galanis (2014): 0.05-0.15
+    s_pi: float = 0.45    # Propensity to save out of profits
+    g_u: float = 0.10     # Investment sensitivity to capacity utilization
+    g_pi: float = 0.05    # Investment sensitivity to profit share
+    u_baseline: float = 0.80  # Baseline capacity utilization (80%)
+
+    # Distribution
+    wage_share_baseline: float = 0.55  # US wage share
+
+    def __post_init__(self):
+        if np.any(np.asarray(self.sigma) <= 0):
+            raise ValueError(f"sigma must be positive, got {self.sigma}")
+        for name in ('c_w', 'c_pi', 'avg_c'):
+            value = getattr(self, name)
+            if value is not None and np.any((np.asarray(value) < 0) | (np.asarray(value) > 1)):
+                raise ValueError(f"{name} must be in [0, 1], got {value}")
+        if np.any(np.asarray(self.eta) <= 0):
+            raise ValueError(f"eta must be positive, got {self.eta}")
+        if np.any(np.asarray(self.automation_cost_ratio) <= 0):
+            raise ValueError(f"automation_cost_ratio must be positive, got {self.automation_cost_ratio}")
+        if np.any((np.asarray(self.wage_share_baseline) <= 0) |
+                  (np.asarray(self.wage_share_baseline) >= 1)):
+            raise ValueError(f"wage_share_baseline must be in (0, 1), got {self.wage_share_baseline}")
+        if np.any(np.asarray(self.aggregate_mpc) >= 1):
+            raise ValueError(f"aggregate MPC must be below 1 for a finite multiplier, got {self.aggregate_mpc}")
+        if np.any(np.asarray(self.u_baseline) <= 0):
+            raise ValueError(f"u_baseline must be positive, got {self.u_baseline}")
+
+    def replace(self, **changes):
+        """Return a new config with the given fields changed."""
+        return dataclasses.replace(self, **changes)
+
+    def as_dict(self):
+        """Field values as a plain dict."""
+        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+
+    @property
+    def profit_share_baseline(self):
+        """Baseline profit share π₀ = 1 - ω₀."""
+        return 1 - self.wage_share_baseline
+
+    def saving_rate(self, pi):
+        """Aggregate saving rate σ(π) = s_w×(1-π) + s_π×π."""
+        return self.s_w * (1 - pi) + self.s_pi * pi
+
+    @property
+    def saving_rate_baseline(self):
+        """Aggregate saving rate at the baseline profit share, σ(π₀)."""
+        return self.saving_rate(self.profit_share_baseline)
+
+    @property
+    def g_0(self):
+        """
+        Autonomous investment calibrated so that u*(π₀) = u_baseline.
+
+        u* = (g₀ + g_π×π) / (σ(π) - g_u)  ⇒  g₀ = u_baseline × (σ(π₀) - g_u) - g_π × π₀
+        """
+        return (self.u_baseline * (self.saving_rate_baseline - self.g_u)
+                - self.g_pi * self.profit_share_baseline)
+
+    @property
+    def aggregate_mpc(self):
+        """Aggregate MPC: avg_c if fixed, else c_w×ω₀ + c_π×(1-ω₀)."""
+        if self.avg_c is not None:
+            return self.avg_c
+        return self.c_w * self.wage_share_baseline + self.c_pi * (1 - self.wage_share_baseline)
+
+    @property
+    def multiplier(self):
+        """Keynesian multiplier κ = 1/(1-c)."""
+        return 1 / (1 - self.aggregate_mpc)
+
+
+DEFAULT_CONFIG = ModelConfig()
@@ -0,0 +1,162 @@
+"""
+Nested-CES Task Model Solver
+============================
+
+General-equilibrium counterpart to the reduced-form Acemoglu-Restrepo proxy.
+Aggregate output nests occupations, and each occupation nests its tasks:
+
+    Y   = [Σ_i β_i^(1/η) Y_i^((η-1)/η)]^(η/(η-1))                      (occupations, elasticity η)
+    Y_i = [θ_i^(1/σ) K_i^((σ-1)/σ) + (1-θ_i)^(1/σ) L_i^((σ-1)/σ)]^(σ/(σ-1))   (tasks, elasticity σ)
+
+θ_i = α × exposure_i is the share of occupation i's tasks shifted to AI
+capital, supplied elastically at effective cost r_i = cost_ratio × w_i⁰.
+Occupation labor L_i is fixed (no reallocation in the short run), so
+relative wages are endogenous. With aggregate output as numeraire the
+equilibrium is, for every occupation,
+
+    F_i = ln(1-θ_i) - σ(ln w_i - ln p_i) + ln β_i - η ln p_i + ln Y - ln L_i = 0
+    G   = ln P = ln[Σ_i β_i p_i^(1-η)] / (1-η) = 0
+    ln p_i = ln[θ_i r_i^(1-σ) + (1-θ_i) w_i^(1-σ)] / (1-σ)
+
+The baseline (θ = 0) is calibrated to observed wages and employment, and
+the system is written in log deviations from it (x_i = Δln w_i,
+q_i = Δln p_i, y = Δln Y), where β and L drop out:
+
+    F_i = ln(1-θ_i) - σ(x_i - q_i) - η q_i + y = 0
+    G   = ln[Σ_i ω⁰_i e^((1-η) q_i)] / (1-η) = 0       (ω⁰ = baseline wage shares)
+    q_i = ln[θ_i ρ^(1-σ) + (1-θ_i) e^((1-σ) x_i)] / (1-σ)   (ρ = cost_ratio)
+
+It is solved by Newton iteration on (x, y) with the analytic Jacobian,
+which is diagonal in x plus one bordering row/column, so each step is O(N)
+and every array operation is vectorized over a leading batch of parameter
+draws or bootstrap replicates. σ = 1 and η = 1 (Cobb-Douglas) are handled
+by their limits.
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import numpy as np
+
+# θ is capped below 1 so every occupation keeps a labor-performed task share
+MAX_AUTOMATION_SHARE = 1 - 1e-6
+# |1-σ| or |1-η| below this uses a second-order expansion around Cobb-Douglas
+UNIT_ELASTICITY_TOL = 1e-6
+MAX_STEP = 1.0  # Cap on |Δx| per Newton step
+
+
+def _power_mean(weights, logs, eps):
+    """
+    ln[Σ_k w_k e^(ε l_k)] / ε over the last axis, and the shares w_k e^(ε l_k) / Σ.
+
+    Weights sum to 1; eps has a trailing axis of length 1. Near ε = 0 uses
+    m + ε v / 2 (m, v = weighted mean and variance of l), whose ε → 0 limit
+    is the Cobb-Douglas weighted mean.
+    """
+    small = np.abs(eps) < UNIT_ELASTICITY_TOL
+    safe_eps = np.where(small, 1.0, eps)
+    with np.errstate(divide='ignore'):
+        terms = np.log(weights) + safe_eps * logs
+    top = terms.max(axis=-1, keepdims=True)
+    log_total = top + np.log(np.exp(terms - top).sum(axis=-1, keepdims=True))
+
+    mean = (weights * logs).sum(axis=-1, keepdims=True)
+    dev = logs - mean
+    approx = mean + eps * (weights * dev ** 2).sum(axis=-1, keepdims=True) / 2
+
+    value = np.where(small, approx, log_total / safe_eps)[..., 0]
+    shares = np.where(small, weights * (1 + eps * dev), np.exp(terms - log_total))
+    return value, shares
+
+
+def _task_cost(theta, log_cost_ratio, x, eps):
+    """
+    Two-task-bundle unit cost q = ln[θ ρ^ε + (1-θ) e^(εx)] / ε and labor cost share s = ∂q/∂x.
+
+    Specialized form of _power_mean for the inner nest (ε = 1-σ).
+    """
+    small = np.abs(eps) < UNIT_ELASTICITY_TOL
+    safe_eps = np.where(small, 1.0, eps)
+    with np.errstate(divide='ignore'):
+        a = np.log(theta) + safe_eps * log_cost_ratio
+    b = np.log1p(-theta) + safe_eps * x
+    log_total = np.logaddexp(a, b)
+    q = log_total / safe_eps
+    s = np.exp(b - log_total)
+
+    # Expansion around σ = 1
+    gap = x - log_cost_ratio
+    mean = theta * log_cost_ratio + (1 - theta) * x
+    q_small = mean + eps * theta * (1 - theta) * gap ** 2 / 2
+    s_small = (1 - theta) * (1 + eps * theta * gap)
+    return np.where(small, q_small, q), np.where(small, s_small, s)
+
+
+def solve_equilibrium(exposure, wage, emp, sigma=1.5, eta=0.9, alpha=1.0, cost_ratio=0.5,
+                      tol=1e-10, max_iter=50):
+    """
+    Solve the nested-CES equilibrium after the automation shock.
+
+    Parameters
+    ----------
+    exposure : array-like, shape (..., N)
+        Occupation exposure; leading axes are a batch (draws, replicates)
+    wage, emp : array-like, shape (N,)
+        Baseline annual wage and employment per occupation
+    sigma, eta, alpha, cost_ratio : float or array-like broadcastable to the batch shape
+        Task elasticity, occupation elasticity, displacement rate, and AI
+        capital cost relative to the baseline wage
+    tol : float
+        Convergence tolerance on max |F|, |G|
+    max_iter : int
+        Newton iteration cap
+
+    Returns
+    -------
+    dict
+        log_wage_change (..., N); wage_bill_change, output_change,
+        labor_share and converged (batch shape); iterations
+    """
+    wage_bill = np.asarray(wage, dtype=np.float64) * np.asarray(emp, dtype=np.float64)
+    base_share = wage_bill / wage_bill.sum()
+    exposure = np.nan_to_num(np.asarray(exposure, dtype=np.float64))
+    batch = np.broadcast_shapes(exposure.shape[:-1], *(np.shape(p) for p in (sigma, eta, alpha, cost_ratio)))
+    n = exposure.shape[-1]
+
+    def column(value):
+        return np.broadcast_to(np.asarray(value, dtype=np.float64), batch)[..., None]
+
+    sigma, eta, alpha, cost_ratio = map(column, (sigma, eta, alpha, cost_ratio))
+    theta = np.clip(alpha * np.broadcast_to(exposure, batch + (n,)), 0.0, MAX_AUTOMATION_SHARE)
+    log_labor_tasks = np.log1p(-theta)
+    log_cost_ratio = np.log(cost_ratio)
+
+    x = np.zeros(batch + (n,))
+    y = np.zeros(batch)
+    converged = np.zeros(batch, dtype=bool)
+
+    for iteration in range(1, max_iter + 1):
+        q, s = _task_cost(theta, log_cost_ratio, x, 1 - sigma)
+        G, spend = _power_mean(base_share, q, 1 - eta)
+        F = log_labor_tasks - sigma * (x - q) - eta * q + y[..., None]
+
+        converged = (np.abs(F).max(axis=-1) < tol) & (np.abs(G) < tol)
+        if converged.all():
+            break
+
+        # Newton step on [-D 1; gᵀ 0] [Δx; Δy] = -[F; G], D = diag(σ(1-s) + ηs), g = spend × s
+        d = sigma * (1 - s) + eta * s
+        g = spend * s
+        delta_y = -(G + (g * F / d).sum(axis=-1)) / (g / d).sum(axis=-1)
+        x += np.clip((F + delta_y[..., None]) / d, -MAX_STEP, MAX_STEP)
+        y += delta_y
+
+    wage_bill_change = np.log((base_share * np.exp(x)).sum(axis=-1))
+    return {
+        'log_wage_change': x,
+        'wage_bill_change': wage_bill_change,
+        'output_change': y,
+        'labor_share': np.exp(wage_bill_change - y),
+        'iterations': iteration,
+        'converged': converged,
+    }
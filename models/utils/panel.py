@@ -0,0 +1,83 @@
+"""
+Panel Construction
+==================
+
+Reshaping occupation data between wide (one row per SOC, one column per
+period) and long (one row per SOC × period) layouts, for fixed-effects and
+difference-in-differences estimation.
+
+Long panels carry integer-coded ids next to the labels:
+
+    entity_id   0..n_entities-1, in order of first appearance
+    time_id     0..n_periods-1, in period order
+
+so estimators can demean or cluster with bincount/indexing instead of
+string groupbys or dummy matrices. Reshapes are single numpy reshapes of
+the wide blocks (no per-row Python), and log transforms run once on the
+stacked arrays.
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def wide_to_long(wide, id_col, columns, periods, constants=(), log=(), period_col='period'):
+    """
+    Stack wide per-period columns into an entity × period panel.
+
+    Parameters
+    ----------
+    wide : pd.DataFrame
+        One row per entity
+    id_col : str
+        Entity identifier column (e.g. 'soc_code')
+    columns : dict
+        {output column: [source column for each period]}, e.g.
+        {'ln_wage': ['wage_annual_mean_2022', 'wage_annual_mean_2023']}
+    periods : sequence
+        Period labels, same length as each source list (e.g. years)
+    constants : sequence of str
+        Time-invariant columns repeated on every period row
+    log : sequence of str
+        Output columns to log-transform after stacking
+    period_col : str
+        Name of the period label column
+
+    Returns
+    -------
+    pd.DataFrame
+        n_entities × n_periods rows ordered by entity, then period, with
+        id_col, the stacked columns, period_col, the constants, entity_id
+        and time_id
+    """
+    n_entity, n_period = len(wide), len(periods)
+    for out, sources in columns.items():
+        if len(sources) != n_period:
+            raise ValueError(f"'{out}' has {len(sources)} source columns for {n_period} periods")
+
+    entity_id, _ = pd.factorize(wide[id_col])
+    time_id = np.arange(n_period)
+    data = {
+        id_col: np.repeat(wide[id_col].to_numpy(), n_period),
+    }
+    for out, sources in columns.items():
+        # (n_entity, n_period) block, flattened row-major: entity-major, period-minor
+        block = wide[list(sources)].to_numpy()
+        if out in log:
+            block = np.log(block.astype(np.float64))
+        data[out] = block.reshape(n_entity * n_period)
+    data[period_col] = np.tile(np.asarray(periods), n_entity)
+    for col in constants:
+        data[col] = np.repeat(wide[col].to_numpy(), n_period)
+    data['entity_id'] = np.repeat(entity_id, n_period)
+    data['time_id'] = np.tile(time_id, n_entity)
+    return pd.DataFrame(data)
+
+
+def year_columns(stub, years):
+    """Source column names '{stub}_{year}' for wide_to_long."""
+    return [f"{stub}_{year}" for year in years]
+
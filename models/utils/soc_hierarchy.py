@@ -0,0 +1,261 @@
+"""
+SOC Hierarchy Rollup Index
+==========================
+
+Integer-indexed SOC 2018 hierarchy with precomputed parent pointers, for
+rolling occupation data up to coarser levels and for joining O*NET and BLS
+data whose codes sit at different levels.
+
+Levels (finest → coarsest), with the code of 15-1252.00 at each:
+
+    onet      15-1252.00   O*NET-SOC occupation
+    detailed  15-1252      SOC detailed occupation (BLS OES 6-digit)
+    broad     15-1250      SOC broad occupation
+    minor     15-1200      SOC minor group
+    major     15-0000      SOC major group
+
+A code's own level is read from its form: a '.YY' suffix is O*NET; otherwise
+trailing zeros mark aggregates (XX-0000 major, XX-XX00 minor, XX-XXX0 broad).
+BLS sometimes publishes a broad code in place of its detailed occupations
+(e.g. 13-1020 Buyers and Purchasing Agents, where O*NET has 13-1021..23);
+such codes are broad-level leaves, and hierarchical_join matches them to
+the rolled-up O*NET values.
+
+Rollups are bincounts over precomputed ancestor ids, so any level can be
+aggregated to any coarser level in one vectorized pass.
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import numpy as np
+import pandas as pd
+
+LEVELS = ('onet', 'detailed', 'broad', 'minor', 'major')
+LEVEL_INDEX = {level: i for i, level in enumerate(LEVELS)}
+
+
+def soc_level(codes):
+    """Level index (into LEVELS) of each code, read from its form."""
+    codes = pd.Series(np.asarray(codes, dtype=str))
+    level = np.full(len(codes), LEVEL_INDEX['detailed'])
+    level[codes.str.endswith('0').to_numpy()] = LEVEL_INDEX['broad']
+    level[codes.str.endswith('00').to_numpy()] = LEVEL_INDEX['minor']
+    level[codes.str.endswith('-0000').to_numpy()] = LEVEL_INDEX['major']
+    level[codes.str.contains('.', regex=False).to_numpy()] = LEVEL_INDEX['onet']
+    return level
+
+
+def truncate(codes, level):
+    """Code of each input's ancestor at the given level (string form; not validated)."""
+    codes = pd.Series(np.asarray(codes, dtype=str))
+    if level == 'onet':
+        out = codes
+    elif level == 'detailed':
+        out = codes.str[:7]
+    elif level == 'broad':
+        out = codes.str[:6] + '0'
+    elif level == 'minor':
+        out = codes.str[:5] + '00'
+    elif level == 'major':
+        out = codes.str[:2] + '-0000'
+    else:
+        raise ValueError(f"Unknown SOC level '{level}'; expected one of {LEVELS}")
+    return out.to_numpy(dtype=str)
+
+
+class SOCHierarchy:
+    """
+    SOC hierarchy over a set of codes (at any mix of levels).
+
+    Every code and all of its ancestors become nodes. Nodes at each level
+    are numbered 0..n-1 in sorted code order; parent[level][i] is the id of
+    node i's parent at the next coarser level, and ancestor ids between any
+    two levels are precomputed.
+
+    Attributes
+    ----------
+    codes : dict
+        {level: sorted array of node codes}
+    parent : dict
+        {level: int array of parent ids at the next coarser level}
+    """
+
+    def __init__(self, codes):
+        codes = np.unique(np.asarray(codes, dtype=str))
+        levels = soc_level(codes)
+
+        self.codes = {
+            level: np.unique(truncate(codes[levels <= i], level))
+            for i, level in enumerate(LEVELS)
+        }
+        self.parent = {
+            level: np.searchsorted(self.codes[coarser], truncate(self.codes[level], coarser))
+            for level, coarser in zip(LEVELS[:-1], LEVELS[1:])
+        }
+
+        # Ancestor ids for every (finer, coarser) pair, by composing parent pointers
+        self._ancestors = {}
+        for i, start in enumerate(LEVELS):
+            ids = np.arange(len(self.codes[start]))
+            self._ancestors[start, start] = ids
+            for finer, coarser in zip(LEVELS[i:-1], LEVELS[i + 1:]):
+                ids = self.parent[finer][ids]
+                self._ancestors[start, coarser] = ids
+
+        # A node is a leaf if no node at the next finer level points to it
+        self._n_children = {LEVELS[0]: np.zeros(len(self.codes[LEVELS[0]]), dtype=int)}
+        for finer, level in zip(LEVELS[:-1], LEVELS[1:]):
+            self._n_children[level] = np.bincount(self.parent[finer], minlength=len(self.codes[level]))
+
+    def __len__(self):
+        return sum(len(c) for c in self.codes.values())
+
+    def __repr__(self):
+        sizes = ', '.join(f"{level}={len(self.codes[level])}" for level in LEVELS)
+        return f"SOCHierarchy({sizes})"
+
+    # --- lookups ---
+
+    def ids(self, codes, level):
+        """Node id at `level` of each code's ancestor; -1 if the code is coarser than level or unknown."""
+        own_level = soc_level(codes)
+        target = truncate(codes, level)
+        nodes = self.codes[level]
+        pos = np.searchsorted(nodes, target)
+        found = (pos < len(nodes)) & (nodes[np.minimum(pos, len(nodes) - 1)] == target)
+        return np.where(found & (own_level <= LEVEL_INDEX[level]), pos, -1)
+
+    def node_ids(self, codes):
+        """(level index, node id at that level) of each code itself."""
+        levels = soc_level(codes)
+        ids = np.full(len(levels), -1)
+        for i, level in enumerate(LEVELS):
+            mask = levels == i
+            if mask.any():
+                ids[mask] = self.ids(np.asarray(codes, dtype=str)[mask], level)
+        return levels, ids
+
+    def ancestor(self, ids, from_level, to_level):
+        """Ancestor ids at to_level of node ids at from_level (-1 passes through)."""
+        if LEVEL_INDEX[to_level] < LEVEL_INDEX[from_level]:
+            raise ValueError(f"Cannot roll up from '{from_level}' to finer level '{to_level}'")
+        ids = np.asarray(ids)
+        table = self._ancestors[from_level, to_level]
+        return np.where(ids >= 0, table[np.maximum(ids, 0)], -1)
+
+    def ancestor_ids(self, codes, level):
+        """Node id at `level` of each code's ancestor, for codes at their own (mixed) levels."""
+        levels, ids = self.node_ids(codes)
+        out = np.full(len(ids), -1)
+        for i, own in enumerate(LEVELS[:LEVEL_INDEX[level] + 1]):
+            mask = levels == i
+            if mask.any():
+                out[mask] = self.ancestor(ids[mask], own, level)
+        return out
+
+    def is_leaf(self, codes):
+        """True for codes with no finer node beneath them in this hierarchy."""
+        levels, ids = self.node_ids(codes)
+        leaf = np.zeros(len(ids), dtype=bool)
+        for i, level in enumerate(LEVELS):
+            mask = (levels == i) & (ids >= 0)
+            leaf[mask] = self._n_children[level][ids[mask]] == 0
+        return leaf
+
+    # --- rollups ---
+
+    def rollup(self, codes, values, level, weights=None, how='mean'):
+        """
+        Aggregate values from codes (any finer levels) to `level`.
+
+        Parameters
+        ----------
+        codes : array-like of str
+        values : array-like of float
+        level : str
+            Target level; codes coarser than it are ignored
+        weights : array-like, optional
+            Weights for how='mean' (e.g. employment); unweighted if None
+        how : {'mean', 'sum'}
+            NaN values (and NaN weights) are skipped, as in groupby
+
+        Returns
+        -------
+        pd.Series
+            Indexed by the level's codes that have at least one row
+        """
+        target = self.ancestor_ids(codes, level)
+        values = np.asarray(values, dtype=np.float64)
+        weights = np.ones_like(values) if weights is None else np.asarray(weights, dtype=np.float64)
+        valid = (target >= 0) & np.isfinite(values) & np.isfinite(weights)
+        n = len(self.codes[level])
+
+        if how == 'sum':
+            result = np.bincount(target[valid], weights=values[valid], minlength=n)
+        elif how == 'mean':
+            count = np.bincount(target[valid], weights=weights[valid], minlength=n)
+            total = np.bincount(target[valid], weights=(weights * values)[valid], minlength=n)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result = total / count
+        else:
+            raise ValueError(f"how must be 'mean' or 'sum', got '{how}'")
+
+        # As in groupby: every group with rows is present (all-NaN → NaN mean, 0 sum)
+        present = np.bincount(target[target >= 0], minlength=n) > 0
+        return pd.Series(result[present], index=pd.Index(self.codes[level][present], name='soc_code'))
+
+    def rollup_frame(self, frame, code_col, level, means=(), sums=(), weight=None):
+        """
+        Roll several columns of a frame up to `level`.
+
+        means columns are averaged (weighted by the `weight` column if given),
+        sums columns are summed. Returns a frame with a 'soc_code' column.
+        """
+        codes = frame[code_col].to_numpy(dtype=str)
+        weights = None if weight is None else frame[weight].to_numpy(dtype=np.float64)
+        columns = {col: self.rollup(codes, frame[col], level, weights, 'mean') for col in means}
+        columns.update({col: self.rollup(codes, frame[col], level, how='sum') for col in sums})
+        out = pd.DataFrame(columns)
+        out = out[[c for c in frame.columns if c in out.columns]]
+        return out.rename_axis('soc_code').reset_index()
+
+
+def hierarchical_join(left, right, left_on, right_on, means=(), sums=(), weight=None,
+                      levels=('detailed', 'broad'), hierarchy=None):
+    """
+    Attach right-hand occupation values to left rows, falling back to coarser SOC levels.
+
+    Right is rolled up to each of `levels` (finest first). Each left row
+    takes values from the finest level at which both its own code (or its
+    ancestor) and the right-hand rollup exist; left codes coarser than a
+    level skip it. Used for BLS ↔ O*NET code mismatches.
+
+    Returns
+    -------
+    pd.DataFrame
+        left with the means/sums columns and soc_match_level (NaN if unmatched)
+    """
+    if hierarchy is None:
+        hierarchy = SOCHierarchy(np.concatenate([
+            left[left_on].to_numpy(dtype=str), right[right_on].to_numpy(dtype=str)
+        ]))
+    out = left.copy()
+    columns = list(means) + list(sums)
+    for col in columns:
+        out[col] = np.nan
+    out['soc_match_level'] = pd.Series([None] * len(out), index=out.index, dtype=object)
+
+    left_codes = left[left_on].to_numpy(dtype=str)
+    for level in levels:
+        rolled = hierarchy.rollup_frame(right, right_on, level, means=means, sums=sums, weight=weight)
+        node = np.full(len(hierarchy.codes[level]), -1)
+        node[hierarchy.ids(rolled['soc_code'], level)] = np.arange(len(rolled))
+
+        target = hierarchy.ancestor_ids(left_codes, level)
+        row = np.where(target >= 0, node[np.maximum(target, 0)], -1)
+        fill = (row >= 0) & out['soc_match_level'].isna().to_numpy()
+        for col in columns:
+            out.loc[fill, col] = rolled[col].to_numpy()[row[fill]]
+        out.loc[fill, 'soc_match_level'] = level
+    return out
@@ -0,0 +1,207 @@
+"""
+Specification Curve
+===================
+
+Every combination of the analyst choices behind the cross-sectional
+validation, estimated on one shared sample per exposure definition:
+
+    exposure    importance-weighted (calculate_importance_weighted_exposure)
+                or usage intensity (calculate_simple_usage_intensity)
+    period      Δln(w) over 2022-2023, 2023-2024 or 2022-2024
+    control     with or without ln(employment 2022)
+    weighted    OLS or WLS with 2022 employment weights
+    treatment   continuous exposure or above-median indicator
+
+    Δln(w_i) = β₀ + β·Treatment_i [+ γ·ln(emp_i,2022)] + ε_i   (HC3)
+
+Pipeline:
+    1. build_design_cache   One merged frame per exposure definition (exposure
+                            computed and SOC-joined once), with the
+                            regressors and all period outcomes
+    2. enumerate_specs      Cartesian product of SPEC_DIMENSIONS
+    3. run_spec_curve       Specs grouped by design (exposure, treatment,
+                            control, weights); each group fits all periods
+                            against one factorization (ols_kernel.fit_batch),
+                            optionally with groups in a process pool
+    4. render_spec_curve    Sorted coefficients with CIs over the choice grid
+
+Binary and continuous coefficients are on different scales, so the tidy
+table also reports effect_sd (β × SD of the treatment in the sample) and
+the curve is drawn on that scale.
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from exposure_calculation import calculate_importance_weighted_exposure, calculate_simple_usage_intensity
+from ols_kernel import fit_batch
+from wage_validation import CROSSWALK_FILE, YEARS, merge_exposure, period_label
+
+# --- CONFIGURATION ---
+EXPOSURE_DEFINITIONS = {
+    'importance': calculate_importance_weighted_exposure,
+    'usage_intensity': calculate_simple_usage_intensity,
+}
+SPEC_PERIODS = [(2022, 2023), (2023, 2024), (2022, 2024)]
+SPEC_DIMENSIONS = {
+    'exposure': list(EXPOSURE_DEFINITIONS),
+    'period': [period_label(period) for period in SPEC_PERIODS],
+    'control': [True, False],
+    'weighted': [False, True],
+    'treatment': ['continuous', 'binary'],
+}
+BASE_YEAR = YEARS[0]
+CONTROL = f'ln_employment_{BASE_YEAR}'
+WEIGHT = f'employment_{BASE_YEAR}'
+TREATMENT_COLUMNS = {'continuous': 'ai_exposure', 'binary': 'high_exposure'}
+CONFIDENCE = 0.95
+
+
+def exposure_definitions(crosswalk_path=CROSSWALK_FILE, definitions=EXPOSURE_DEFINITIONS):
+    """{name: occupation exposure} for each definition, from one read of the crosswalk."""
+    crosswalk = pd.read_csv(crosswalk_path)
+    return {name: func(crosswalk) for name, func in definitions.items()}
+
+
+def build_design_cache(panel, exposures, periods=SPEC_PERIODS):
+    """
+    One estimation frame per exposure definition.
+
+    Each frame holds the treatment columns (ai_exposure, high_exposure at
+    the sample median), the baseline control and weight, and Δln(w) for
+    every period, restricted to the rows complete for all of them so every
+    spec on that exposure uses the same occupations.
+
+    Parameters
+    ----------
+    panel : ValidationPanel
+    exposures : dict
+        {name: occupation exposure} (see exposure_definitions)
+    """
+    outcomes = [f'delta_ln_wage_{period_label(period)}' for period in periods]
+    cache = {}
+    for name, occ_exposure in exposures.items():
+        data = merge_exposure(panel.wage_changes, occ_exposure, means=['ai_exposure'], sums=[])
+        columns = ['soc_code', 'ai_exposure', CONTROL, WEIGHT] + outcomes
+        frame = data[columns].dropna()
+        frame = frame[frame[WEIGHT] > 0].reset_index(drop=True)
+        frame['high_exposure'] = (frame['ai_exposure'] > frame['ai_exposure'].median()).astype(int)
+        cache[name] = frame
+    return cache
+
+
+def enumerate_specs(dimensions=SPEC_DIMENSIONS):
+    """Cartesian product of the choice dimensions, one row per spec with a spec_id."""
+    specs = pd.DataFrame(list(itertools.product(*dimensions.values())), columns=list(dimensions))
+    return specs.rename_axis('spec_id').reset_index()
+
+
+def _fit_design(frame, treatment, control, weighted, periods):
+    """All period outcomes on one design (worker task); returns tidy rows."""
+    term = TREATMENT_COLUMNS[treatment]
+    regressors = [term, CONTROL] if control else [term]
+    X = frame[regressors].assign(const=1.0)[['const'] + regressors]
+    Y = frame[[f'delta_ln_wage_{period}' for period in periods]]
+    fit = fit_batch(Y, X, weights=frame[WEIGHT] if weighted else None, cov_type='HC3')
+    j = fit.index(term)
+    beta, se, pvalue = fit.params[:, j], fit.bse[:, j], fit.pvalues[:, j]
+    treatment_sd = frame[term].std()
+    z = stats.norm.ppf(0.5 + CONFIDENCE / 2)
+    return [
+        {
+            'period': period,
+            'term': term,
+            'beta': beta[i],
+            'se': se[i],
+            'pvalue': pvalue[i],
+            'ci_low': beta[i] - z * se[i],
+            'ci_high': beta[i] + z * se[i],
+            'nobs': fit.nobs,
+            'rsquared': fit.rsquared[i],
+            'treatment_sd': treatment_sd,
+            'effect_sd': beta[i] * treatment_sd,
+        }
+        for i, period in enumerate(periods)
+    ]
+
+
+def _fit_group(task):
+    frame, key, periods = task
+    rows = _fit_design(frame, *key[1:], periods)
+    return [dict(zip(('exposure', 'treatment', 'control', 'weighted'), key), **row) for row in rows]
+
+
+def run_spec_curve(cache, specs=None, workers=1):
+    """
+    Estimate every spec; returns the tidy coefficient table (one row per spec).
+
+    Specs sharing a design (same exposure, treatment, control and weights)
+    are fit together on the cached frame. With workers > 1 (None: one per
+    CPU, capped at the number of groups) the groups run in a process pool,
+    which only pays off for grids much larger than the default 48 specs.
+    """
+    if specs is None:
+        specs = enumerate_specs()
+    keys = ['exposure', 'treatment', 'control', 'weighted']
+    tasks = [
+        (cache[key[0]], key, list(group['period']))
+        for key, group in specs.groupby(keys, sort=False)
+    ]
+    if workers is None:
+        workers = min(os.cpu_count() or 1, len(tasks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fitted = list(pool.map(_fit_group, tasks))
+    else:
+        fitted = [_fit_group(task) for task in tasks]
+
+    table = pd.DataFrame([row for rows in fitted for row in rows])
+    table = specs.merge(table, on=keys + ['period'], how='left')
+    table['significant'] = table['pvalue'] < 1 - CONFIDENCE
+    return table
+
+
+def render_spec_curve(table, path, dpi=300):
+    """Specification curve: effect_sd with CIs (sorted) above the choice indicators."""
+    import matplotlib.pyplot as plt
+
+    table = table.sort_values('effect_sd').reset_index(drop=True)
+    x = np.arange(len(table))
+    scale = table['treatment_sd']
+    choices = [(dimension, value) for dimension in SPEC_DIMENSIONS for value in SPEC_DIMENSIONS[dimension]]
+
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), sharex=True,
+                                   gridspec_kw={'height_ratios': [2, 1.4]})
+
+    # 1. Sorted estimates (1-SD effect) with confidence intervals
+    colors = np.where(table['significant'], '#d62728', '#7f7f7f')
+    ax1.vlines(x, table['ci_low'] * scale, table['ci_high'] * scale, colors=colors, alpha=0.5)
+    ax1.scatter(x, table['effect_sd'], c=colors, s=20, zorder=3)
+    ax1.axhline(0, color='black', linewidth=1)
+    ax1.set_ylabel('Effect of 1 SD of treatment on Δln(Wage)')
+    ax1.set_title(f'Specification Curve ({len(table)} specifications; red: p < {1 - CONFIDENCE:.2f})')
+    ax1.grid(alpha=0.3)
+
+    # 2. Which choices each specification makes
+    for row, (dimension, value) in enumerate(choices):
+        chosen = (table[dimension] == value).to_numpy()
+        ax2.scatter(x[chosen], np.full(chosen.sum(), row), marker='|', s=60, color='#1f77b4')
+    ax2.set_yticks(range(len(choices)))
+    ax2.set_yticklabels([f'{dimension}: {value}' for dimension, value in choices])
+    ax2.invert_yaxis()
+    ax2.set_xlabel('Specification (sorted by estimate)')
+    ax2.grid(alpha=0.3, axis='x')
+
+    plt.tight_layout()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return Path(path)
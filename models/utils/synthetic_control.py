@@ -0,0 +1,320 @@
+"""
+Synthetic Control
+=================
+
+Donor-weighted counterfactual wage paths for high-exposure occupations
+(Abadie, Diamond & Hainmueller 2010), from low-exposure donor occupations
+over a multi-year OES panel:
+
+    min_w ‖y₁,pre − Y₀,pre · w‖²   s.t.  w ≥ 0,  Σw = 1
+
+    gap_t = y₁,t − Y₀,t · w     (the effect estimate for post-event years)
+
+Treated units are either individual SOCs above the median exposure
+(unit='soc') or the mean ln wage of each upper exposure quartile
+(unit='quartile'); donors are the bottom-quartile SOCs. Outcomes are
+demeaned by each unit's pre-event mean by default (intercept-shifted
+synthetic control), since occupations' wage levels differ far more than
+their paths and high-wage occupations lie outside the donors' convex hull.
+
+Weights: each problem has only T0 (pre-event years) equations, so it is
+solved exactly as non-negative least squares (Lawson-Hanson active set)
+on the donor matrix augmented with a heavily weighted row of ones, which
+enforces Σw = 1 to ~1e-7 before the weights are renormalized. Treated
+units and placebos share the donor matrix and are split across threads
+(workers); each solve is independent, so results do not depend on the
+split.
+
+Inference (placebo in space): each donor in turn is treated as if
+exposed and fit from the remaining donors. A treated unit's p-value is
+its rank in post/pre RMSPE among itself and the placebos; the average
+effect over treated units is compared with averages over random sets of
+placebos of the same size.
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import nnls
+
+from event_study import EVENT_YEAR
+from resampling import DEFAULT_REPS, SEED, resampling_pvalue
+
+# --- CONFIGURATION ---
+TREATED_QUANTILE = 0.5      # Treated SOCs: exposure above this quantile
+DONOR_QUANTILE = 0.25       # Donor SOCs: exposure at or below this quantile
+TREATED_QUARTILES = ['Q2', 'Q3', 'Q4']
+ADDING_UP_WEIGHT = 1e3      # Scale of the Σw = 1 row in the NNLS system, relative to RMS ‖y_pre‖
+PERFECT_FIT = 1e-6          # Pre-period MSE below this share of mean ‖y_pre‖²/T0 counts as a perfect fit
+WEIGHT_FLOOR = 1e-6         # Donors with weight above this count as used
+
+
+@dataclass(frozen=True, eq=False)
+class SyntheticControlResult:
+    """Synthetic paths for the treated units and the donor placebos."""
+
+    outcome: str
+    years: np.ndarray
+    event_year: int
+    treated: list             # Treated unit labels
+    donors: list              # Donor unit labels
+    weights: np.ndarray       # (n_donors, n_treated)
+    actual: np.ndarray        # (n_treated, n_years), demeaned if demean
+    synthetic: np.ndarray     # (n_treated, n_years)
+    placebo_gaps: np.ndarray  # (n_donors, n_years) each donor vs the other donors
+    demean: bool
+    rmspe_floor: float        # Pre-period RMSPE treated as a perfect fit in the ratios
+
+    @property
+    def pre(self):
+        return self.years < self.event_year
+
+    @property
+    def gaps(self):
+        return self.actual - self.synthetic
+
+    @staticmethod
+    def _rmspe(gaps, mask):
+        return np.sqrt((gaps[:, mask] ** 2).mean(axis=1))
+
+    def _ratio(self, gaps):
+        # With more donors than pre-event years fits can be exact; don't divide by ~0
+        return self._rmspe(gaps, ~self.pre) / np.maximum(self._rmspe(gaps, self.pre), self.rmspe_floor)
+
+    @property
+    def rmspe_ratio(self):
+        """Post/pre RMSPE of each treated unit (pre-RMSPE floored at rmspe_floor)."""
+        return self._ratio(self.gaps)
+
+    @property
+    def placebo_ratio(self):
+        return self._ratio(self.placebo_gaps)
+
+    @property
+    def pvalues(self):
+        """Rank of each treated unit's RMSPE ratio among itself and the placebos."""
+        exceed = (self.placebo_ratio[None, :] >= self.rmspe_ratio[:, None]).sum(axis=1)
+        return (1 + exceed) / (1 + len(self.donors))
+
+    def summary_table(self):
+        """One row per treated unit: fit, effect, placebo p-value and main donor."""
+        pre = self.pre
+        top = self.weights.argmax(axis=0)
+        return pd.DataFrame({
+            'unit': self.treated,
+            'pre_rmspe': self._rmspe(self.gaps, pre),
+            'post_rmspe': self._rmspe(self.gaps, ~pre),
+            'rmspe_ratio': self.rmspe_ratio,
+            'effect': self.gaps[:, ~pre].mean(axis=1),
+            'pvalue': self.pvalues,
+            'n_donors_used': (self.weights > WEIGHT_FLOOR).sum(axis=0),
+            'top_donor': np.asarray(self.donors)[top],
+            'top_weight': self.weights[top, np.arange(len(self.treated))],
+        })
+
+    def paths_table(self):
+        """Long table of actual, synthetic and gap by unit and year (placebos included)."""
+        n_years = len(self.years)
+        treated = pd.DataFrame({
+            'unit': np.repeat(self.treated, n_years),
+            'year': np.tile(self.years, len(self.treated)),
+            'actual': self.actual.ravel(),
+            'synthetic': self.synthetic.ravel(),
+            'gap': self.gaps.ravel(),
+            'placebo': False,
+        })
+        placebo = pd.DataFrame({
+            'unit': np.repeat(self.donors, n_years),
+            'year': np.tile(self.years, len(self.donors)),
+            'gap': self.placebo_gaps.ravel(),
+            'placebo': True,
+        })
+        return pd.concat([treated, placebo], ignore_index=True)
+
+    def average_effect_test(self, reps=DEFAULT_REPS, seed=SEED):
+        """
+        (average post-event gap over treated units, placebo p-value).
+
+        The placebo distribution averages the post-event gaps of random
+        sets of len(treated) placebos (drawn with replacement if there are
+        more treated units than donors); like pvalues, the observed average
+        counts as one of the draws, so the p-value is never 0.
+        """
+        post = ~self.pre
+        effect = self.gaps[:, post].mean()
+        placebo_effects = self.placebo_gaps[:, post].mean(axis=1)
+        rng = np.random.default_rng(seed)
+        n_treated, n_donors = len(self.treated), len(self.donors)
+        if n_treated <= n_donors:
+            draws = np.argsort(rng.random((reps, n_donors)), axis=1)[:, :n_treated]
+        else:
+            draws = rng.integers(0, n_donors, size=(reps, n_treated))
+        averages = placebo_effects[draws].mean(axis=1)
+        return effect, resampling_pvalue(averages, effect)
+
+
+def solve_weights(donors_pre, targets_pre, allowed=None, workers=None, chunk_size=64):
+    """
+    Simplex-constrained least-squares weights for many targets on one donor matrix.
+
+    Parameters
+    ----------
+    donors_pre : np.ndarray (T0, J)
+        Donor outcomes over the fitting (pre-event) years
+    targets_pre : np.ndarray (T0, B)
+        Outcomes to reproduce, one column per treated unit or placebo
+    allowed : np.ndarray (J, B) of bool, optional
+        Donors available to each target (e.g. a placebo excludes itself)
+    workers : int, optional
+        Threads over column chunks
+
+    Returns
+    -------
+    np.ndarray (J, B)
+    """
+    n_donors, n_targets = donors_pre.shape[1], targets_pre.shape[1]
+    if allowed is None:
+        allowed = np.ones((n_donors, n_targets), dtype=bool)
+    adding_up = ADDING_UP_WEIGHT * np.sqrt(max((targets_pre ** 2).sum(axis=0).mean(), np.finfo(float).tiny))
+    system = np.vstack([donors_pre, np.full(n_donors, adding_up)])
+    rhs = np.vstack([targets_pre, np.full(n_targets, adding_up)])
+
+    def solve(columns):
+        weights = np.zeros((n_donors, len(columns)))
+        for i, column in enumerate(columns):
+            use = allowed[:, column]
+            weights[use, i] = nnls(system[:, use], rhs[:, column], maxiter=50 * n_donors)[0]
+        return weights
+
+    blocks = [range(start, min(start + chunk_size, n_targets)) for start in range(0, n_targets, chunk_size)]
+    if workers and workers > 1 and len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            solved = list(pool.map(solve, blocks))
+    else:
+        solved = [solve(block) for block in blocks]
+    weights = np.concatenate(solved, axis=1)
+    return weights / weights.sum(axis=0)
+
+
+def synthetic_control(wide, treated, donors, event_year=EVENT_YEAR, outcome='ln_wage', demean=True, workers=None):
+    """
+    Synthetic controls for every treated unit, with placebo-in-space fits for every donor.
+
+    Parameters
+    ----------
+    wide : pd.DataFrame
+        Units × years outcome matrix (index: unit labels, columns: years)
+    treated, donors : sequence
+        Labels in wide's index
+    demean : bool
+        Subtract each unit's pre-event mean before fitting
+    workers : int, optional
+        Threads for the weight solves
+
+    Returns
+    -------
+    SyntheticControlResult
+    """
+    years = np.asarray(wide.columns, dtype=int)
+    pre = years < event_year
+    if pre.sum() < (2 if demean else 1) or pre.all():
+        raise ValueError(f"Synthetic control needs {'two' if demean else 'one'} or more pre-event years and "
+                         f"one post-event year; panel has {years.tolist()} (event {event_year})")
+
+    values = wide.to_numpy(dtype=np.float64)
+    if demean:
+        values = values - values[:, pre].mean(axis=1, keepdims=True)
+    frame = pd.DataFrame(values, index=wide.index)
+    Y1 = frame.loc[list(treated)].to_numpy()           # (N, T)
+    Y0 = frame.loc[list(donors)].to_numpy()            # (J, T)
+    n_donors = len(donors)
+
+    # Treated units and placebos (each donor from the others) in one batch
+    targets = np.concatenate([Y1, Y0]).T[pre]          # (T0, N + J)
+    allowed = np.concatenate([np.ones((n_donors, len(treated)), dtype=bool), ~np.eye(n_donors, dtype=bool)], axis=1)
+    weights = solve_weights(Y0[:, pre].T, targets, allowed, workers=workers)
+
+    treated_weights, placebo_weights = weights[:, :len(treated)], weights[:, len(treated):]
+    return SyntheticControlResult(
+        outcome=outcome,
+        years=years,
+        event_year=event_year,
+        treated=list(treated),
+        donors=list(donors),
+        weights=treated_weights,
+        actual=Y1,
+        synthetic=treated_weights.T @ Y0,
+        placebo_gaps=Y0 - placebo_weights.T @ Y0,
+        demean=demean,
+        rmspe_floor=np.sqrt(PERFECT_FIT * (targets ** 2).sum(axis=0).mean() / pre.sum()),
+    )
+
+
+def build_units(panel, unit='soc', outcome='ln_wage', exposure='ai_exposure', entity_col='soc_code',
+                time_col='year'):
+    """
+    Units × years outcome matrix with treated and donor labels.
+
+    unit='soc': treated are SOCs above the TREATED_QUANTILE of exposure;
+    unit='quartile': treated are the mean outcome of each of
+    TREATED_QUARTILES. Donors are SOCs at or below the DONOR_QUANTILE.
+
+    Returns
+    -------
+    (wide, treated, donors)
+    """
+    wide = panel.pivot_table(index=entity_col, columns=time_col, values=outcome).dropna()
+    by_soc = panel.drop_duplicates(entity_col).set_index(entity_col).loc[wide.index, exposure]
+    donors = list(wide.index[by_soc <= by_soc.quantile(DONOR_QUANTILE)])
+    if unit == 'soc':
+        treated = list(wide.index[by_soc > by_soc.quantile(TREATED_QUANTILE)])
+    elif unit == 'quartile':
+        quartile = pd.qcut(by_soc, q=4, labels=['Q1', 'Q2', 'Q3', 'Q4'])
+        aggregates = wide.groupby(quartile, observed=True).mean().loc[TREATED_QUARTILES]
+        wide = pd.concat([wide, aggregates])
+        treated = TREATED_QUARTILES
+    else:
+        raise ValueError(f"unit must be 'soc' or 'quartile', got '{unit}'")
+    return wide, treated, donors
+
+
+def render_synthetic_control_figure(result, path, dpi=300, max_units=4):
+    """Actual vs synthetic paths for up to max_units treated units, and gaps against placebos."""
+    import matplotlib.pyplot as plt
+
+    order = np.argsort(result.pvalues)[:max_units]
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5.5))
+
+    # 1. Actual vs synthetic for the most significant treated units
+    for i, color in zip(order, plt.rcParams['axes.prop_cycle'].by_key()['color']):
+        ax1.plot(result.years, result.actual[i], '-o', color=color, label=f'{result.treated[i]}')
+        ax1.plot(result.years, result.synthetic[i], '--', color=color)
+    ax1.axvline(result.event_year - 0.5, color='gray', linestyle='--', alpha=0.5)
+    ax1.set_xlabel('Year')
+    ax1.set_ylabel(f'{result.outcome}{" (pre-period demeaned)" if result.demean else ""}')
+    ax1.set_title('Actual (solid) vs Synthetic (dashed)')
+    ax1.legend(fontsize=8)
+    ax1.grid(alpha=0.3)
+
+    # 2. Gaps: placebos in grey, treated in red
+    ax2.plot(result.years, result.placebo_gaps.T, color='#7f7f7f', alpha=0.2, linewidth=0.8)
+    ax2.plot(result.years, result.gaps.T, color='#d62728', alpha=0.5, linewidth=1)
+    ax2.plot(result.years, result.gaps.mean(axis=0), color='black', linewidth=2.5, label='Mean treated gap')
+    ax2.axhline(0, color='black', linewidth=1)
+    ax2.axvline(result.event_year - 0.5, color='gray', linestyle='--', alpha=0.5, label='LLM release')
+    ax2.set_xlabel('Year')
+    ax2.set_ylabel('Gap (actual − synthetic)')
+    ax2.set_title(f'Gaps: {len(result.treated)} treated (red) vs {len(result.donors)} placebos (grey)')
+    ax2.legend()
+    ax2.grid(alpha=0.3)
+
+    plt.tight_layout()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return Path(path)
@@ -0,0 +1,880 @@
+"""
+Wage Validation Library
+=======================
+
+Data preparation, regression specifications and figures for the
+Acemoglu-Restrepo empirical validation (cross-sectional wage growth and
+difference-in-differences). The scripts in models/acemoglu_restrepo/ are thin
+entry points over these functions; none of them prints or writes files
+except the render_* functions, which save to the path they are given.
+
+Stages:
+    1. load_validation_panel   Wage panel, wage changes and occupation exposure (loaded once)
+       wage_long               Occupation × year panel with integer ids (any number of years)
+    2. merge_exposure          Attach exposure to BLS occupations (SOC hierarchy join)
+    3. run_cross_section       Δln(w) on exposure: main, robustness and timing specifications
+       run_did                 Pre/post DiD: simple, binary, continuous and quartile estimates
+       did_inference           Wild cluster bootstrap and randomization p-values for β₃
+       run_placebo             Permuted-exposure placebo distributions (cross-section and DiD)
+    4. render_*_figure         2×2 diagnostic figures from the saved tables (matplotlib imported
+                               on first use; run lazily by figure_stage.render_figures)
+
+Each analysis takes a ValidationPanel and returns a frozen result object,
+so batch runs (e.g. alternative exposure definitions via panel.replace)
+share one loaded panel:
+
+    panel = load_validation_panel()
+    results = run_validation(panel)
+    results.cross_section.main.beta, results.did.binary.pvalue
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import dataclasses
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+from statsmodels.regression.linear_model import OLS, WLS
+
+from exposure_calculation import calculate_importance_weighted_exposure
+from panel import wide_to_long, year_columns
+from resampling import DEFAULT_REPS, SEED, randomization_inference, wild_cluster_bootstrap
+from soc_hierarchy import SOCHierarchy, hierarchical_join, truncate
+
+# --- CONFIGURATION ---
+ROOT_DIR = Path(__file__).parent.parent.parent  # anthropic-onet-crosswalk/
+DATA_DIR = ROOT_DIR / "data"
+WAGE_PANEL_FILE = DATA_DIR / "processed" / "wage_panel_2022_2024.csv"
+CROSSWALK_FILE = DATA_DIR / "processed" / "master_task_crosswalk_with_importance.csv"
+
+YEARS = (2022, 2023, 2024)
+PRIMARY_PERIOD = (2023, 2024)   # Clean post-LLM period (full year of availability)
+PRE_PERIOD = (2022, 2023)       # DiD pre-period (LLMs released March 2023)
+POST_PERIOD = (2023, 2024)      # DiD post-period
+QUARTILES = ['Q1', 'Q2', 'Q3', 'Q4']
+PLACEBO_SCHEMES = {'all': 'across all occupations', 'major': 'within SOC major groups'}
+
+
+def significance(pvalue, not_significant='(not significant)'):
+    """Significance stars for a p-value."""
+    if pvalue < 0.001:
+        return "***"
+    if pvalue < 0.01:
+        return "**"
+    if pvalue < 0.05:
+        return "*"
+    return not_significant
+
+
+def period_label(period):
+    """Column suffix for a (start, end) period, e.g. '2022_2024'."""
+    return f"{period[0]}_{period[1]}"
+
+
+# =============================================================================
+# RESULT TYPES
+# =============================================================================
+
+@dataclass(frozen=True, eq=False)
+class ValidationPanel:
+    """
+    Inputs shared by every validation specification.
+
+    wage_panel     Long OES panel (soc_code, year, wage_annual_mean, employment, occ_title)
+    wage_changes   One row per SOC with complete, positive wages in every year,
+                   log wages, Δln(w) and % growth for each period (wage_changes())
+    occ_exposure   O*NET-SOC exposure table (calculate_importance_weighted_exposure)
+    """
+
+    wage_panel: pd.DataFrame
+    wage_changes: pd.DataFrame
+    occ_exposure: pd.DataFrame
+
+    def replace(self, **changes):
+        """Copy with some inputs replaced (e.g. an alternative exposure definition)."""
+        return dataclasses.replace(self, **changes)
+
+
+@dataclass(frozen=True, eq=False)
+class RegressionResult:
+    """One OLS specification: the coefficient of interest and the fitted model."""
+
+    name: str
+    term: str                 # Regressor of interest
+    beta: float
+    se: float
+    pvalue: float
+    rsquared: float
+    nobs: int
+    outcome_mean: float
+    params: pd.Series         # All coefficients
+    fit: object               # statsmodels RegressionResults (residuals, summary, ...)
+
+    @property
+    def tstat(self):
+        return self.beta / self.se
+
+    def stars(self, not_significant='(not significant)'):
+        return significance(self.pvalue, not_significant)
+
+
+@dataclass(frozen=True, eq=False)
+class CrossSectionResult:
+    """Cross-sectional Δln(w) on exposure: main specification, robustness and timing checks."""
+
+    data: pd.DataFrame            # Matched occupations (all variables)
+    sample: pd.DataFrame          # Main regression sample (complete cases, with exposure_quartile)
+    n_candidates: int             # Leaf BLS occupations offered to the exposure merge
+    main: RegressionResult        # Δln(w) ~ exposure + ln(emp 2022), HC3
+    no_controls: RegressionResult
+    weighted: RegressionResult
+    post_llm: RegressionResult    # 2023-2024 only
+    quartile_means: pd.Series     # Mean Δln(w) by exposure quartile
+
+    @property
+    def n_exact(self):
+        return int((self.data['soc_match_level'] == 'detailed').sum())
+
+    @property
+    def quartile_gap(self):
+        return self.quartile_means['Q4'] - self.quartile_means['Q1']
+
+    def summary_table(self):
+        """Headline results (empirical_validation_results.csv)."""
+        m = self.main
+        sig = m.stars()
+        if m.beta > 0 and m.pvalue < 0.001:
+            formatted = 'Complementarity (β>0)***'
+        elif m.beta < 0 and m.pvalue < 0.001:
+            formatted = 'Displacement (β<0)***'
+        else:
+            formatted = 'No significant effect'
+        return pd.DataFrame({
+            'Metric': [
+                'Sample size (occupations)',
+                'Mean wage growth 2022-2024',
+                'β (AI exposure)',
+                'SE (AI exposure)',
+                't-statistic',
+                'p-value',
+                'Significance',
+                'R-squared',
+                'Interpretation'
+            ],
+            'Value': [
+                m.nobs,
+                m.outcome_mean,
+                m.beta,
+                m.se,
+                m.tstat,
+                m.pvalue,
+                sig,
+                m.rsquared,
+                'Complementarity (β>0)' if m.beta > 0 else 'Displacement (β<0)'
+            ],
+            'Formatted': [
+                f"{m.nobs:,}",
+                f"{m.outcome_mean*100:.2f}%",
+                f"{m.beta:.6f}",
+                f"{m.se:.6f}",
+                f"{m.tstat:.3f}",
+                f"{m.pvalue:.6f}",
+                sig,
+                f"{m.rsquared:.4f}",
+                formatted
+            ]
+        })
+
+    def coefficient_table(self):
+        """Every coefficient of every specification (empirical_validation_coefficients.csv)."""
+        frames = [
+            pd.DataFrame({
+                'Specification': model.name,
+                'Term': model.params.index,
+                'Estimate': model.params.to_numpy(),
+                'SE': model.fit.bse.to_numpy(),
+                'P_value': model.fit.pvalues.to_numpy(),
+            })
+            for model in (self.main, self.no_controls, self.weighted, self.post_llm)
+        ]
+        return pd.concat(frames, ignore_index=True)
+
+    def timing_table(self):
+        """Main period vs post-LLM-only comparison (timing_comparison.csv)."""
+        return pd.DataFrame({
+            'Period': ['2022-2024 (includes pre-LLM)', '2023-2024 (post-LLM only)'],
+            'Beta': [self.main.beta, self.post_llm.beta],
+            'SE': [self.main.se, self.post_llm.se],
+            'P_value': [self.main.pvalue, self.post_llm.pvalue],
+            'Significance': [self.main.stars(), self.post_llm.stars('(n.s.)')],
+            'N': [self.main.nobs, self.post_llm.nobs]
+        })
+
+
+@dataclass(frozen=True, eq=False)
+class DiDResult:
+    """Pre/post difference-in-differences estimates for high vs low exposure."""
+
+    panel_data: pd.DataFrame      # One row per occupation (treatment, pre/post growth)
+    panel_long: pd.DataFrame      # Occupation × period stacked panel
+    median_exposure: float
+    group_means: dict             # {('high'|'low', 'pre'|'post'): mean Δln(w)}
+    binary: RegressionResult      # β₃ on HighExposure × Post, SOC-clustered
+    continuous: RegressionResult  # β₃ on Exposure × Post, SOC-clustered
+    quartile_table: pd.DataFrame  # Q1/Q4 means by period
+
+    @property
+    def pre_diff(self):
+        return self.group_means['high', 'pre'] - self.group_means['low', 'pre']
+
+    @property
+    def post_diff(self):
+        return self.group_means['high', 'post'] - self.group_means['low', 'post']
+
+    @property
+    def did_simple(self):
+        return self.post_diff - self.pre_diff
+
+    @property
+    def quartile_did(self):
+        gap = self.quartile_table['Difference (Q4 - Q1)']
+        return gap.iloc[1] - gap.iloc[0]
+
+    def summary_table(self):
+        """All DiD estimates (did_results_summary.csv)."""
+        return pd.DataFrame({
+            'Specification': [
+                'Simple DiD (Binary)',
+                'Regression DiD (Binary)',
+                'Regression DiD (Continuous)',
+                'Quartile DiD (Q4 vs Q1)'
+            ],
+            'Estimate': [self.did_simple, self.binary.beta, self.continuous.beta, self.quartile_did],
+            'SE': [np.nan, self.binary.se, self.continuous.se, np.nan],
+            'P_value': [np.nan, self.binary.pvalue, self.continuous.pvalue, np.nan],
+            'Interpretation': [
+                f"{self.did_simple*100:.2f}% additional change in high-exposure group",
+                f"{self.binary.beta*100:.2f}% additional change in high-exposure group",
+                f"{self.continuous.beta*0.1*100:.2f}% per 10pp exposure increase",
+                f"{self.quartile_did*100:.2f}% Q4 vs Q1 difference"
+            ]
+        })
+
+
+@dataclass(frozen=True, eq=False)
+class PlaceboResult:
+    """Placebo distributions of each exposure coefficient under permuted ai_exposure."""
+
+    tests: dict                   # {specification: ResamplingResult (randomization)}
+    within: str                   # Key of PLACEBO_SCHEMES
+
+    def summary_table(self):
+        """Observed β against its placebo distribution (placebo_summary.csv)."""
+        rows = []
+        for name, test in self.tests.items():
+            lower, upper = np.quantile(test.draws, [0.025, 0.975])
+            rows.append({
+                'Specification': name,
+                'Term': test.term,
+                'Estimate': test.estimate,
+                'Placebo_mean': test.draws.mean(),
+                'Placebo_sd': test.draws.std(ddof=1),
+                'Placebo_p2_5': lower,
+                'Placebo_p97_5': upper,
+                'P_value_placebo': test.pvalue,
+                'Reps': test.reps,
+                'Permutation': PLACEBO_SCHEMES[self.within],
+            })
+        return pd.DataFrame(rows)
+
+    def distribution_table(self):
+        """One row per placebo replicate, one column per specification (placebo_distribution.csv)."""
+        draws = pd.DataFrame({name: test.draws for name, test in self.tests.items()})
+        return draws.rename_axis('replicate').reset_index()
+
+
+@dataclass(frozen=True, eq=False)
+class ValidationResults:
+    """Both validation designs, estimated on one shared panel."""
+
+    panel: ValidationPanel
+    cross_section: CrossSectionResult
+    did: DiDResult
+
+
+# =============================================================================
+# DATA
+# =============================================================================
+
+def load_wage_panel(path=WAGE_PANEL_FILE):
+    """Long OES wage panel (one row per SOC × year)."""
+    return pd.read_csv(path)
+
+
+def load_exposure(crosswalk_path=CROSSWALK_FILE):
+    """Importance-weighted AI exposure per O*NET-SOC occupation."""
+    return calculate_importance_weighted_exposure(pd.read_csv(crosswalk_path))
+
+
+def wage_wide(wage_panel, years=YEARS):
+    """
+    One row per SOC with {wage_annual_mean, employment, occ_title}_{year} columns.
+
+    Keeps SOCs with a positive mean wage in every one of the given years.
+    """
+    wide = wage_panel.pivot_table(
+        index='soc_code',
+        columns='year',
+        values=['wage_annual_mean', 'employment', 'occ_title'],
+        aggfunc='first'
+    ).reset_index()
+    wide.columns = ['_'.join(map(str, col)).strip('_') if col[1] != '' else col[0]
+                    for col in wide.columns]
+
+    wages = wide[year_columns('wage_annual_mean', years)].to_numpy(dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        complete = (wages > 0).all(axis=1)
+    return wide[complete].copy()
+
+
+def wage_long(wage_panel, years=None):
+    """
+    Balanced occupation × year panel for fixed-effects estimation.
+
+    Returns soc_code, year, occ_title, ln_wage, ln_employment (NaN where
+    employment is missing or zero), entity_id and time_id, for SOCs with a
+    positive mean wage in every year (default: all years in the panel).
+    BLS aggregate rows are kept; filter with SOCHierarchy.is_leaf if needed.
+    """
+    if years is None:
+        years = sorted(wage_panel['year'].unique())
+    wide = wage_wide(wage_panel, years)
+    employment = wide[year_columns('employment', years)].to_numpy(dtype=np.float64)
+    wide[year_columns('employment', years)] = np.where(employment > 0, employment, np.nan)
+    return wide_to_long(
+        wide, 'soc_code',
+        columns={
+            'occ_title': year_columns('occ_title', years),
+            'ln_wage': year_columns('wage_annual_mean', years),
+            'ln_employment': year_columns('employment', years),
+        },
+        periods=list(years),
+        log=['ln_wage', 'ln_employment'],
+        period_col='year',
+    )
+
+
+def wage_changes(wage_panel, years=YEARS, primary=PRIMARY_PERIOD):
+    """
+    Wide wage table with log wage changes between the given years.
+
+    Keeps SOCs with a positive mean wage in every year. For consecutive
+    years and for first → last year, adds delta_ln_wage_{a}_{b} and
+    wage_growth_pct_{a}_{b}; delta_ln_wage / wage_growth_pct alias the
+    primary period. ln_employment_{first year} is the baseline size control.
+    """
+    wide = wage_wide(wage_panel, years)
+
+    for year in years:
+        wide[f'ln_wage_{year}'] = np.log(wide[f'wage_annual_mean_{year}'])
+
+    periods = list(zip(years[:-1], years[1:]))
+    if len(years) > 2:
+        periods.append((years[0], years[-1]))
+    for start, end in periods:
+        label = period_label((start, end))
+        wide[f'delta_ln_wage_{label}'] = wide[f'ln_wage_{end}'] - wide[f'ln_wage_{start}']
+        wide[f'wage_growth_pct_{label}'] = (wide[f'wage_annual_mean_{end}'] /
+                                            wide[f'wage_annual_mean_{start}'] - 1) * 100
+
+    wide['delta_ln_wage'] = wide[f'delta_ln_wage_{period_label(primary)}']
+    wide['wage_growth_pct'] = wide[f'wage_growth_pct_{period_label(primary)}']
+    wide[f'ln_employment_{years[0]}'] = np.log(wide[f'employment_{years[0]}'].clip(lower=1))
+    return wide
+
+
+def load_validation_panel(wage_panel_path=WAGE_PANEL_FILE, crosswalk_path=CROSSWALK_FILE, years=YEARS):
+    """Load the wage panel and exposure once, for any number of specifications."""
+    wage_panel = load_wage_panel(wage_panel_path)
+    return ValidationPanel(
+        wage_panel=wage_panel,
+        wage_changes=wage_changes(wage_panel, years),
+        occ_exposure=load_exposure(crosswalk_path),
+    )
+
+
+def merge_exposure(wages, occ_exposure, means=('ai_exposure', 'A_MEAN'), sums=('TOT_EMP',), fallback=True):
+    """
+    Attach O*NET exposure to BLS occupations; returns matched rows only.
+
+    With fallback (cross-section), BLS aggregate rows are dropped (only
+    leaf codes kept, so no occupation enters twice; leaves include broad
+    codes BLS publishes in place of detailed ones, e.g. 13-1020) and codes
+    without an exact detailed match take their broad occupation's average
+    (soc_match_level records which). Without fallback (DiD), exposure is
+    averaged to detailed SOC and merged on the exact 6-digit code.
+    """
+    means, sums = list(means), list(sums)
+    if fallback:
+        hierarchy = SOCHierarchy(np.concatenate([
+            occ_exposure['onet_soc_code'].to_numpy(dtype=str), wages['soc_code'].to_numpy(dtype=str)
+        ]))
+        leaves = wages[SOCHierarchy(wages['soc_code']).is_leaf(wages['soc_code'])]
+        merged = hierarchical_join(
+            leaves, occ_exposure, 'soc_code', 'onet_soc_code',
+            means=means, sums=sums, levels=('detailed', 'broad'), hierarchy=hierarchy,
+        )
+    else:
+        detailed = SOCHierarchy(occ_exposure['onet_soc_code']).rollup_frame(
+            occ_exposure, 'onet_soc_code', 'detailed', means=means, sums=sums
+        )
+        merged = wages.merge(detailed, on='soc_code', how='left')
+    return merged[merged['ai_exposure'].notna()].copy()
+
+
+# =============================================================================
+# ESTIMATION
+# =============================================================================
+
+def fit_ols(name, data, outcome, regressors, term, cov_type='HC3', groups=None, weights=None, **fit_kwargs):
+    """OLS (WLS if weights given) of outcome on a constant and regressors; HC3 or SOC-clustered covariance."""
+    X = sm.add_constant(data[regressors])
+    y = data[outcome]
+    if cov_type == 'cluster':
+        fit_kwargs['cov_kwds'] = {'groups': data[groups]}
+    model = OLS(y, X) if weights is None else WLS(y, X, weights=weights)
+    fit = model.fit(cov_type=cov_type, **fit_kwargs)
+    return RegressionResult(
+        name=name,
+        term=term,
+        beta=fit.params[term],
+        se=fit.bse[term],
+        pvalue=fit.pvalues[term],
+        rsquared=fit.rsquared,
+        nobs=int(fit.nobs),
+        outcome_mean=y.mean(),
+        params=fit.params,
+        fit=fit,
+    )
+
+
+def run_cross_section(panel):
+    """
+    Δln(w_i) = β₀ + β₁ × ai_exposure_i + β₂ × ln(employment_2022) + ε_i, with robustness checks.
+
+    Main specification uses delta_ln_wage (the primary period); post_llm
+    uses 2023-2024 explicitly; weighted passes 2022 employment as weights.
+    """
+    data = merge_exposure(panel.wage_changes, panel.occ_exposure)
+    n_candidates = int(SOCHierarchy(panel.wage_changes['soc_code']).is_leaf(panel.wage_changes['soc_code']).sum())
+
+    controls = ['ai_exposure', 'ln_employment_2022']
+    sample = data[['delta_ln_wage'] + controls].dropna()
+    main = fit_ols('main', sample, 'delta_ln_wage', controls, 'ai_exposure')
+    no_controls = fit_ols('no_controls', sample, 'delta_ln_wage', ['ai_exposure'], 'ai_exposure')
+    weighted = fit_ols('weighted', sample, 'delta_ln_wage', controls, 'ai_exposure',
+                       weights=data.loc[sample.index, 'employment_2022'])
+
+    post_sample = data[['delta_ln_wage_2023_2024'] + controls].dropna()
+    post_sample = post_sample.rename(columns={'delta_ln_wage_2023_2024': 'delta_ln_wage'})
+    post_llm = fit_ols('post_llm', post_sample, 'delta_ln_wage', controls, 'ai_exposure')
+
+    sample = sample.assign(exposure_quartile=pd.qcut(sample['ai_exposure'], q=4, labels=QUARTILES))
+    quartile_means = sample.groupby('exposure_quartile', observed=False)['delta_ln_wage'].mean()
+
+    return CrossSectionResult(
+        data=data,
+        sample=sample,
+        n_candidates=n_candidates,
+        main=main,
+        no_controls=no_controls,
+        weighted=weighted,
+        post_llm=post_llm,
+        quartile_means=quartile_means,
+    )
+
+
+def did_panel(panel, pre=PRE_PERIOD, post=POST_PERIOD):
+    """
+    One row per occupation with exposure, treatment groups and pre/post wage growth.
+
+    high_exposure is above-median exposure; exposure_quartile splits at quartiles.
+    """
+    wages = panel.wage_changes.assign(
+        delta_ln_wage_pre=panel.wage_changes[f'delta_ln_wage_{period_label(pre)}'],
+        delta_ln_wage_post=panel.wage_changes[f'delta_ln_wage_{period_label(post)}'],
+    )
+    panel_data = merge_exposure(wages, panel.occ_exposure, means=['ai_exposure'], fallback=False)
+    median_exposure = panel_data['ai_exposure'].median()
+    panel_data['high_exposure'] = (panel_data['ai_exposure'] > median_exposure).astype(int)
+    panel_data['exposure_quartile'] = pd.qcut(panel_data['ai_exposure'], q=4, labels=QUARTILES)
+    return panel_data
+
+
+def did_group_means(panel_data):
+    """Mean Δln(w) by {(high|low, pre|post)}."""
+    high = panel_data['high_exposure'] == 1
+    return {
+        (group, period): panel_data.loc[mask, f'delta_ln_wage_{period}'].mean()
+        for group, mask in (('high', high), ('low', ~high))
+        for period in ('pre', 'post')
+    }
+
+
+def stack_periods(panel_data, pre=PRE_PERIOD, post=POST_PERIOD):
+    """Stack pre/post observations (occupation × period) for the regression DiD."""
+    periods = [pre, post]
+    panel_long = wide_to_long(
+        panel_data, 'soc_code',
+        columns={
+            'occ_title': [f'occ_title_{start}' for start, _ in periods],
+            'delta_ln_wage': ['delta_ln_wage_pre', 'delta_ln_wage_post'],
+            'ln_employment': [f'employment_{start}' for start, _ in periods],
+        },
+        periods=[period_label(period) for period in periods],
+        constants=['high_exposure', 'ai_exposure'],
+        log=['ln_employment'],
+    )
+    panel_long['post'] = panel_long['time_id']
+    return panel_long[['soc_code', 'occ_title', 'delta_ln_wage', 'post', 'high_exposure', 'ai_exposure',
+                       'ln_employment', 'period', 'entity_id', 'time_id']]
+
+
+def run_did(panel, pre=PRE_PERIOD, post=POST_PERIOD):
+    """
+    Δln(wage_it) = β₀ + β₁·Treat_i + β₂·Post_t + β₃·(Treat_i × Post_t) + β₄·ln(emp) + ε_it
+
+    Treat is the above-median indicator (binary) or exposure itself
+    (continuous); SEs are clustered by SOC.
+    """
+    panel_data = did_panel(panel, pre, post)
+    group_means = did_group_means(panel_data)
+
+    panel_long = stack_periods(panel_data, pre, post)
+    panel_long['high_x_post'] = panel_long['high_exposure'] * panel_long['post']
+    panel_long['exposure_x_post'] = panel_long['ai_exposure'] * panel_long['post']
+    binary = fit_ols('did_binary', panel_long, 'delta_ln_wage',
+                     ['high_exposure', 'post', 'high_x_post', 'ln_employment'], 'high_x_post',
+                     cov_type='cluster', groups='soc_code')
+    continuous = fit_ols('did_continuous', panel_long, 'delta_ln_wage',
+                         ['ai_exposure', 'post', 'exposure_x_post', 'ln_employment'], 'exposure_x_post',
+                         cov_type='cluster', groups='soc_code')
+
+    quartile_rows = []
+    for label, period, col in [('Pre', pre, 'delta_ln_wage_pre'), ('Post', post, 'delta_ln_wage_post')]:
+        q1_mean = panel_data.loc[panel_data['exposure_quartile'] == 'Q1', col].mean()
+        q4_mean = panel_data.loc[panel_data['exposure_quartile'] == 'Q4', col].mean()
+        quartile_rows.append({
+            'Period': f"{label} ({period[0]}-{period[1]})",
+            'Q1 (Low Exposure)': q1_mean,
+            'Q4 (High Exposure)': q4_mean,
+            'Difference (Q4 - Q1)': q4_mean - q1_mean
+        })
+
+    panel_data['individual_did'] = panel_data['delta_ln_wage_post'] - panel_data['delta_ln_wage_pre']
+    return DiDResult(
+        panel_data=panel_data,
+        panel_long=panel_long,
+        median_exposure=panel_data['ai_exposure'].median(),
+        group_means=group_means,
+        binary=binary,
+        continuous=continuous,
+        quartile_table=pd.DataFrame(quartile_rows),
+    )
+
+
+def exposure_permutation(spec, treatment, entity_codes, multipliers, exposure_terms, term_index=0,
+                         strata=None, reps=DEFAULT_REPS, seed=SEED, workers=None):
+    """
+    Randomization inference for a fitted specification with its exposure regressors permuted.
+
+    The regressors in exposure_terms are rebuilt from the permuted
+    entity-level treatment (treatment[entity_codes] × multipliers); the
+    other columns of the fitted design are held fixed and partialled out
+    once. Model weights (WLS) are applied by √w scaling.
+
+    Parameters
+    ----------
+    spec : RegressionResult
+    treatment : array-like (n_entities,)
+    entity_codes : array-like (n,)
+        Row of the design → entity position in treatment
+    multipliers : array-like (n, q)
+        Exposure columns are treatment × each multiplier (in exposure_terms order)
+    exposure_terms : list of str
+        The q design columns replaced by the permuted treatment
+    term_index : int
+        Position of spec.term in exposure_terms
+    """
+    model = spec.fit.model
+    X = pd.DataFrame(model.exog, columns=model.exog_names)
+    scale = np.sqrt(np.broadcast_to(model.weights, len(X)))
+    multipliers = np.asarray(multipliers, dtype=np.float64).reshape(len(X), -1)
+    return randomization_inference(
+        model.endog * scale, X.drop(columns=exposure_terms).to_numpy() * scale[:, None],
+        treatment, entity_codes, multipliers * scale[:, None], term_index,
+        reps=reps, strata=strata, seed=seed, workers=workers, term=spec.term,
+    )
+
+
+def did_inference(result, reps=DEFAULT_REPS, weights='rademacher', seed=SEED, workers=None):
+    """
+    Resampling p-values for both DiD interactions (binary and continuous β₃).
+
+    Wild cluster bootstrap: restricted (β₃ = 0), SOC-level weights.
+    Randomization inference: the SOC's treatment (high_exposure or
+    ai_exposure) is permuted across occupations, moving its main effect and
+    interaction together.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per specification with the analytic (SOC-clustered) and
+        resampling p-values
+    """
+    panel_long = result.panel_long
+    entity = panel_long.drop_duplicates('entity_id').sort_values('entity_id')
+    rows = []
+    for spec, treatment in [(result.binary, 'high_exposure'), (result.continuous, 'ai_exposure')]:
+        X = pd.DataFrame(spec.fit.model.exog, columns=spec.fit.model.exog_names)
+        bootstrap = wild_cluster_bootstrap(panel_long['delta_ln_wage'], X, panel_long['soc_code'], spec.term,
+                                           reps=reps, weights=weights, seed=seed, workers=workers)
+        permutation = exposure_permutation(
+            spec, entity[treatment], panel_long['entity_id'],
+            np.column_stack([np.ones(len(panel_long)), panel_long['post']]), [treatment, spec.term],
+            term_index=1, reps=reps, seed=seed, workers=workers,
+        )
+        rows.append({
+            'Specification': spec.name,
+            'Term': spec.term,
+            'Estimate': spec.beta,
+            'SE': spec.se,
+            'P_value_clustered': spec.pvalue,
+            'P_value_wild_bootstrap': bootstrap.pvalue,
+            'P_value_randomization': permutation.pvalue,
+            'Reps': reps,
+            'Bootstrap_weights': weights,
+        })
+    return pd.DataFrame(rows)
+
+
+def run_placebo(cross_section, did, reps=DEFAULT_REPS, within='all', seed=SEED, workers=None):
+    """
+    Placebo distributions for every exposure coefficient, permuting ai_exposure across occupations.
+
+    Each replicate reassigns the occupations' exposure (across all
+    occupations, or only within SOC major groups) and refits every
+    cross-sectional and DiD specification; all replicates of a
+    specification are one stacked solve, since only the exposure columns
+    of the design change. The binary DiD uses the same permutations (same
+    seed), so its placebo treatment is the above-median split of the
+    permuted exposure.
+
+    Returns
+    -------
+    PlaceboResult
+    """
+    if within not in PLACEBO_SCHEMES:
+        raise ValueError(f"within must be one of {list(PLACEBO_SCHEMES)}, got '{within}'")
+
+    def major(codes):
+        return truncate(codes, 'major') if within == 'major' else None
+
+    options = dict(reps=reps, seed=seed, workers=workers)
+    tests = {}
+    for spec in (cross_section.main, cross_section.no_controls, cross_section.weighted, cross_section.post_llm):
+        rows = cross_section.data.loc[spec.fit.model.data.row_labels]
+        tests[spec.name] = exposure_permutation(
+            spec, rows['ai_exposure'], np.arange(len(rows)), np.ones(len(rows)), ['ai_exposure'],
+            strata=major(rows['soc_code']), **options,
+        )
+
+    panel_long = did.panel_long
+    entity = panel_long.drop_duplicates('entity_id').sort_values('entity_id')
+    multipliers = np.column_stack([np.ones(len(panel_long)), panel_long['post']])
+    for spec, treatment in [(did.binary, 'high_exposure'), (did.continuous, 'ai_exposure')]:
+        tests[spec.name] = exposure_permutation(
+            spec, entity[treatment], panel_long['entity_id'], multipliers, [treatment, spec.term],
+            term_index=1, strata=major(entity['soc_code']), **options,
+        )
+    return PlaceboResult(tests=tests, within=within)
+
+
+def run_validation(panel=None):
+    """Cross-sectional and DiD validation on one shared panel (loaded if not given)."""
+    if panel is None:
+        panel = load_validation_panel()
+    return ValidationResults(panel=panel, cross_section=run_cross_section(panel), did=run_did(panel))
+
+
+# =============================================================================
+# FIGURES
+# =============================================================================
+
+def render_cross_section_figure(data, coefficients, path, dpi=300):
+    """
+    Scatter with fit, growth distribution, quartile means and residuals (2×2).
+
+    Drawn from the saved tables (empirical_validation_data.csv and
+    CrossSectionResult.coefficient_table()), so it can run after the fact.
+    """
+    import matplotlib.pyplot as plt
+
+    controls = ['ai_exposure', 'ln_employment_2022']
+    sample = data[['delta_ln_wage'] + controls].dropna()
+    main = coefficients[coefficients['Specification'] == 'main'].set_index('Term')
+    params = main['Estimate']
+    fitted = params['const'] + sample[controls] @ params[controls]
+    resid = sample['delta_ln_wage'] - fitted
+    quartile_means = sample.groupby(pd.qcut(sample['ai_exposure'], q=4, labels=QUARTILES),
+                                    observed=False)['delta_ln_wage'].mean()
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+
+    # 1. Scatter plot: AI exposure vs wage growth, with the fitted line at mean ln(emp)
+    ax1 = axes[0, 0]
+    ax1.scatter(sample['ai_exposure'], sample['delta_ln_wage'], alpha=0.5, s=50)
+    X_plot = np.linspace(sample['ai_exposure'].min(), sample['ai_exposure'].max(), 100)
+    y_plot = params['const'] + params['ai_exposure'] * X_plot + \
+             params['ln_employment_2022'] * sample['ln_employment_2022'].mean()
+    beta_label = f"β={params['ai_exposure']:.4f}{significance(main.loc['ai_exposure', 'P_value'])}"
+    ax1.plot(X_plot, y_plot, 'r-', linewidth=2, label=beta_label)
+    ax1.set_xlabel('AI Exposure (Importance-Weighted)')
+    ax1.set_ylabel('Δln(Wage) 2022→2024')
+    ax1.set_title('AI Exposure → Wage Growth')
+    ax1.legend()
+    ax1.grid(alpha=0.3)
+
+    # 2. Distribution of wage growth
+    ax2 = axes[0, 1]
+    ax2.hist(sample['delta_ln_wage'], bins=30, alpha=0.7, edgecolor='black')
+    ax2.axvline(sample['delta_ln_wage'].mean(), color='r', linestyle='--',
+                label=f'Mean: {sample["delta_ln_wage"].mean():.4f}')
+    ax2.set_xlabel('Δln(Wage) 2022→2024')
+    ax2.set_ylabel('Frequency')
+    ax2.set_title('Distribution of Wage Growth')
+    ax2.legend()
+    ax2.grid(alpha=0.3)
+
+    # 3. Quartile comparison
+    ax3 = axes[1, 0]
+    quartile_means.plot(kind='bar', ax=ax3, color=['#d62728', '#ff7f0e', '#2ca02c', '#1f77b4'])
+    ax3.set_xlabel('AI Exposure Quartile')
+    ax3.set_ylabel('Mean Δln(Wage)')
+    ax3.set_title('Wage Growth by AI Exposure Quartile')
+    ax3.set_xticklabels(ax3.get_xticklabels(), rotation=0)
+    ax3.grid(alpha=0.3, axis='y')
+
+    # 4. Residual plot
+    ax4 = axes[1, 1]
+    ax4.scatter(fitted, resid, alpha=0.5, s=50)
+    ax4.axhline(0, color='r', linestyle='--', linewidth=2)
+    ax4.set_xlabel('Fitted Values')
+    ax4.set_ylabel('Residuals')
+    ax4.set_title('Residual Plot')
+    ax4.grid(alpha=0.3)
+
+    plt.tight_layout()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return Path(path)
+
+
+def render_did_figure(panel_data, path, dpi=300):
+    """
+    Parallel trends, period bars, exposure distribution and per-SOC DiD (2×2).
+
+    Drawn from the saved per-occupation table (did_panel_data.csv).
+    """
+    import matplotlib.pyplot as plt
+
+    means = did_group_means(panel_data)
+    median_exposure = panel_data['ai_exposure'].median()
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+
+    # 1. Parallel trends plot
+    ax1 = axes[0, 0]
+    periods = ['2022-2023', '2023-2024']
+    ax1.plot(periods, [means['high', 'pre'], means['high', 'post']], 'o-', linewidth=2, markersize=8,
+             label='High Exposure', color='#d62728')
+    ax1.plot(periods, [means['low', 'pre'], means['low', 'post']], 'o-', linewidth=2, markersize=8,
+             label='Low Exposure', color='#2ca02c')
+    ax1.axvline(0.5, color='gray', linestyle='--', alpha=0.5, label='LLM Release (Mar 2023)')
+    ax1.set_xlabel('Period')
+    ax1.set_ylabel('Mean Δln(Wage)')
+    ax1.set_title('Parallel Trends: High vs Low Exposure')
+    ax1.legend()
+    ax1.grid(alpha=0.3)
+
+    # 2. Diff-in-diff bar chart
+    ax2 = axes[0, 1]
+    x = np.arange(2)
+    width = 0.35
+    ax2.bar(x - width/2, [means['high', 'pre'], means['high', 'post']], width,
+            label='High Exposure', color='#d62728')
+    ax2.bar(x + width/2, [means['low', 'pre'], means['low', 'post']], width,
+            label='Low Exposure', color='#2ca02c')
+    ax2.set_ylabel('Mean Δln(Wage)')
+    ax2.set_title('Wage Growth by Period and Exposure')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(['Pre (2022-23)', 'Post (2023-24)'])
+    ax2.legend()
+    ax2.grid(alpha=0.3, axis='y')
+
+    # 3. Exposure distribution
+    ax3 = axes[1, 0]
+    ax3.hist(panel_data['ai_exposure'], bins=30, alpha=0.7, edgecolor='black')
+    ax3.axvline(median_exposure, color='r', linestyle='--', linewidth=2,
+                label=f'Median: {median_exposure:.3f}')
+    ax3.set_xlabel('AI Exposure')
+    ax3.set_ylabel('Frequency')
+    ax3.set_title('Distribution of AI Exposure')
+    ax3.legend()
+    ax3.grid(alpha=0.3)
+
+    # 4. Scatterplot: Exposure vs individual DiD, with a linear fit
+    ax4 = axes[1, 1]
+    ax4.scatter(panel_data['ai_exposure'], panel_data['individual_did'], alpha=0.5, s=50)
+    ax4.axhline(0, color='r', linestyle='--', linewidth=2)
+    fit_line = np.poly1d(np.polyfit(panel_data['ai_exposure'], panel_data['individual_did'], 1))
+    x_plot = np.linspace(panel_data['ai_exposure'].min(), panel_data['ai_exposure'].max(), 100)
+    ax4.plot(x_plot, fit_line(x_plot), 'r-', linewidth=2)
+    ax4.set_xlabel('AI Exposure')
+    ax4.set_ylabel('Individual DiD (Post - Pre)')
+    ax4.set_title('Exposure vs Change in Wage Growth')
+    ax4.grid(alpha=0.3)
+
+    plt.tight_layout()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return Path(path)
+
+
+def render_placebo_figure(result, path, dpi=300):
+    """Placebo distribution of each coefficient with the observed estimate marked."""
+    import matplotlib.pyplot as plt
+
+    n_tests = len(result.tests)
+    n_cols = 3
+    n_rows = -(-n_tests // n_cols)
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(15, 4.5 * n_rows), squeeze=False)
+    for ax, (name, test) in zip(axes.flat, result.tests.items()):
+        ax.hist(test.draws, bins=50, alpha=0.7, edgecolor='black')
+        ax.axvline(test.estimate, color='r', linewidth=2, label=f'Observed β={test.estimate:.4f}')
+        ax.set_xlabel(f'Placebo β ({test.term})')
+        ax.set_ylabel('Frequency')
+        ax.set_title(f'{name} (p={test.pvalue:.4f})')
+        ax.legend()
+        ax.grid(alpha=0.3)
+    for ax in axes.flat[n_tests:]:
+        ax.set_visible(False)
+    fig.suptitle(f'Placebo: ai_exposure permuted {PLACEBO_SCHEMES[result.within]} '
+                 f'({next(iter(result.tests.values())).reps:,} replicates)')
+
+    plt.tight_layout()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return Path(path)
@@ -0,0 +1,295 @@
+"""
+Dynamic AI Adoption Simulator
+=============================
+
+estimate_models.py treats the AI shock as a one-off comparative-statics
+experiment. Here occupation exposure phases in over time along logistic
+adoption curves parameterized per O*NET job zone:
+
+    adoption_z(t) = ceiling_z / (1 + exp(-steepness_z × (t - midpoint_z)))
+    exposure_i(t) = ai_exposure_i × adoption_{zone(i)}(t)
+
+and the wage share, capacity utilization and output evolve under the
+Kaleckian and Bhaduri-Marglin closures with quantity adjustment to excess
+demand (speed λ per year):
+
+    Kaleckian:       dy/dt = λ × [c(ω_t)×y + a - y],  c(ω) = c_w×ω + c_π×(1-ω),
+                     a = 1 - c(ω₀) so y = 1 before adoption
+    Bhaduri-Marglin: du/dt = λ × [g₀ + g_u×u + g_π×π_t - σ(π_t)×u]
+
+The Bhaduri-Marglin steady state at full adoption is u* from
+bhaduri_marglin_batch; the Kaleckian one matches kaleckian_batch to first
+order in Δω.
+
+Thousands of scenario trajectories are integrated at once: adoption
+parameters (and optionally behavioral parameters) are drawn per scenario,
+exposure is built as a (scenario × time × occupation) array in scenario
+chunks bounded by max_bytes, and the closures are stepped forward in time
+vectorized across scenarios.
+
+Usage:
+    python adoption_dynamics.py --scenarios 5000 --horizon 15 --seed 20260115
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from estimate_models import (
+    DEFAULT_CONFIG,
+    OUTPUT_DIR,
+    calculate_occupation_exposure_equal,
+    load_crosswalk,
+)
+from monte_carlo import DEFAULT_PRIORS, draw_parameters
+
+# --- CONFIGURATION ---
+START_YEAR = 2025
+HORIZON_YEARS = 15
+DT = 0.25                 # Quarterly steps (years)
+ADJUSTMENT_SPEED = 2.0    # λ: quantity adjustment to excess demand, per year
+MAX_CHUNK_BYTES = 256 * 2**20   # Bound on each (scenario × time × occupation) block
+
+# Logistic adoption priors per job zone (years from START_YEAR). Higher job
+# zones hold more of the cognitive tasks LLMs touch, so adoption is assumed
+# to start earlier there; the ceilings leave room for partial displacement.
+DEFAULT_ADOPTION_PRIORS = {
+    1: {'midpoint': ('uniform', 6.0, 12.0), 'steepness': ('uniform', 0.3, 0.8), 'ceiling': ('uniform', 0.3, 0.8)},
+    2: {'midpoint': ('uniform', 5.0, 11.0), 'steepness': ('uniform', 0.3, 0.9), 'ceiling': ('uniform', 0.4, 0.9)},
+    3: {'midpoint': ('uniform', 4.0, 10.0), 'steepness': ('uniform', 0.4, 1.0), 'ceiling': ('uniform', 0.5, 1.0)},
+    4: {'midpoint': ('uniform', 3.0, 9.0), 'steepness': ('uniform', 0.4, 1.2), 'ceiling': ('uniform', 0.5, 1.0)},
+    5: {'midpoint': ('uniform', 3.0, 9.0), 'steepness': ('uniform', 0.4, 1.2), 'ceiling': ('uniform', 0.5, 1.0)},
+}
+ADOPTION_PARAMETERS = ('midpoint', 'steepness', 'ceiling')
+
+PATH_METRICS = [
+    ('wage_fraction_at_risk', 'Wage fraction at risk'),
+    ('emp_share_at_risk', 'Employment share at risk'),
+    ('wage_share', 'Wage share'),
+    ('kalecki_output', 'Kaleckian output (baseline = 1)'),
+    ('utilization', 'B-M capacity utilization'),
+    ('bm_output', 'B-M output (baseline = 1)'),
+]
+DEFAULT_QUANTILES = (0.05, 0.50, 0.95)
+
+
+def time_grid(horizon=HORIZON_YEARS, dt=DT):
+    """Simulation times in years from START_YEAR (inclusive of both ends)."""
+    return np.arange(0.0, horizon + dt / 2, dt)
+
+
+def draw_adoption(priors, zones, n_scenarios, rng):
+    """
+    Draw logistic adoption parameters per scenario and job zone.
+
+    Returns dict parameter -> array of shape (n_scenarios, len(zones)).
+    """
+    flat = {f'{name}_{zone}': priors[zone][name] for zone in zones for name in ADOPTION_PARAMETERS}
+    draws = draw_parameters(flat, n_scenarios, rng)
+    return {name: np.column_stack([draws[f'{name}_{zone}'] for zone in zones])
+            for name in ADOPTION_PARAMETERS}
+
+
+def adoption_curves(t, midpoint, steepness, ceiling):
+    """Logistic adoption, shape (scenario, time, zone), from (scenario, zone) parameters."""
+    return ceiling[:, None, :] / (1 + np.exp(-steepness[:, None, :] * (t[None, :, None] - midpoint[:, None, :])))
+
+
+def exposure_paths(ai_exposure, zone_index, wage_share, emp_share, adoption):
+    """
+    Occupation exposure paths for one scenario chunk and their aggregates.
+
+    Builds exposure[s, t, i] = ai_exposure_i × adoption[s, t, zone(i)] and
+    reduces it to wage- and employment-weighted shares at risk.
+
+    Returns (wage_fraction_at_risk, emp_share_at_risk, exposure summed over
+    scenarios with shape (time, occupation)).
+    """
+    exposure = adoption[:, :, zone_index]
+    exposure *= ai_exposure
+    return exposure @ wage_share, exposure @ emp_share, exposure.sum(axis=0)
+
+
+def simulate_closures(wage_fraction_at_risk, config, dt=DT, speed=ADJUSTMENT_SPEED):
+    """
+    Step the Kaleckian and Bhaduri-Marglin closures forward in time.
+
+    Parameters
+    ----------
+    wage_fraction_at_risk : np.ndarray, shape (scenario, time)
+    config : ModelConfig
+        Scalar fields, or arrays of shape (scenario, 1) for per-scenario draws
+
+    Returns dict of (scenario, time) arrays.
+    """
+    n_scenarios, n_steps = wage_fraction_at_risk.shape
+    omega_0 = config.wage_share_baseline
+    wage_share = omega_0 * (1 - wage_fraction_at_risk)
+    profit_share = 1 - wage_share
+
+    def column(value):
+        return np.broadcast_to(value, (n_scenarios, 1))[:, 0]
+
+    c_w, c_pi = column(config.c_w), column(config.c_pi)
+    g_u, g_pi, g_0 = column(config.g_u), column(config.g_pi), column(config.g_0)
+    u_baseline = column(config.u_baseline)
+    autonomous = 1 - (c_w * omega_0 + c_pi * (1 - omega_0))
+    saving_rate = config.saving_rate(profit_share)
+    saving_rate = np.broadcast_to(saving_rate, (n_scenarios, n_steps))
+
+    y = np.empty((n_scenarios, n_steps))
+    u = np.empty((n_scenarios, n_steps))
+    y[:, 0] = 1.0
+    u[:, 0] = u_baseline
+    for k in range(1, n_steps):
+        # Distribution in step k-1 drives demand over [t_{k-1}, t_k]
+        mpc = c_w * wage_share[:, k - 1] + c_pi * (1 - wage_share[:, k - 1])
+        y[:, k] = y[:, k - 1] + dt * speed * (mpc * y[:, k - 1] + autonomous - y[:, k - 1])
+
+        excess = g_0 + g_u * u[:, k - 1] + g_pi * profit_share[:, k - 1] - saving_rate[:, k - 1] * u[:, k - 1]
+        stable = saving_rate[:, k - 1] - g_u > 0
+        u[:, k] = np.where(stable, u[:, k - 1] + dt * speed * excess, u[:, k - 1])
+
+    return {
+        'wage_share': wage_share,
+        'kalecki_output': y,
+        'utilization': u,
+        'bm_output': u / u_baseline[:, None],
+    }
+
+
+def simulate_adoption(occ, n_scenarios=1000, seed=None, config=DEFAULT_CONFIG,
+                      adoption_priors=None, behavioral_priors=None,
+                      horizon=HORIZON_YEARS, dt=DT, speed=ADJUSTMENT_SPEED,
+                      max_bytes=MAX_CHUNK_BYTES):
+    """
+    Simulate adoption trajectories for many scenarios.
+
+    Parameters
+    ----------
+    occ : pd.DataFrame
+        Occupation-level exposure frame with TOT_EMP, A_MEAN, ai_exposure, job_zone
+    n_scenarios : int
+        Number of scenario trajectories
+    seed : int, optional
+        Seed for adoption (and behavioral) draws
+    config : ModelConfig
+        Behavioral calibration (parameters without a behavioral prior)
+    adoption_priors : dict, optional
+        job_zone -> {'midpoint', 'steepness', 'ceiling'} prior specs
+        (monte_carlo.draw_parameters format). Defaults to DEFAULT_ADOPTION_PRIORS.
+    behavioral_priors : dict or True, optional
+        Also draw behavioral parameters per scenario; True uses
+        monte_carlo.DEFAULT_PRIORS
+    max_bytes : int
+        Memory bound for each (scenario × time × occupation) chunk
+
+    Returns
+    -------
+    dict
+        't' (years), (scenario, time) arrays for each PATH_METRICS key, the
+        drawn adoption parameters, and 'occupation_mean_exposure' (time, occupation)
+    """
+    adoption_priors = adoption_priors or DEFAULT_ADOPTION_PRIORS
+    rng = np.random.default_rng(seed)
+    t = time_grid(horizon, dt)
+
+    occ = occ[occ['job_zone'].notna()]
+    zones = sorted(int(z) for z in occ['job_zone'].unique())
+    zone_index = pd.Index(zones).get_indexer(occ['job_zone'].astype(int))
+
+    emp = occ['TOT_EMP'].to_numpy(dtype=np.float64)
+    wage_bill = emp * occ['A_MEAN'].to_numpy(dtype=np.float64)
+    wage_share = wage_bill / wage_bill.sum()
+    emp_share = emp / emp.sum()
+    ai_exposure = occ['ai_exposure'].to_numpy(dtype=np.float64)
+
+    adoption_params = draw_adoption(adoption_priors, zones, n_scenarios, rng)
+    if behavioral_priors:
+        priors = DEFAULT_PRIORS if behavioral_priors is True else behavioral_priors
+        draws = draw_parameters(priors, n_scenarios, rng)
+        config = config.replace(**{name: values[:, None] for name, values in draws.items()})
+
+    chunk = max(1, max_bytes // (len(t) * len(occ) * 8))
+    wfr = np.empty((n_scenarios, len(t)))
+    emp_at_risk = np.empty((n_scenarios, len(t)))
+    exposure_total = np.zeros((len(t), len(occ)))
+    for start in range(0, n_scenarios, chunk):
+        rows = slice(start, min(start + chunk, n_scenarios))
+        adoption = adoption_curves(t, *(adoption_params[name][rows] for name in ADOPTION_PARAMETERS))
+        wfr[rows], emp_at_risk[rows], exposure_sum = exposure_paths(
+            ai_exposure, zone_index, wage_share, emp_share, adoption
+        )
+        exposure_total += exposure_sum
+
+    paths = simulate_closures(wfr, config, dt, speed)
+    return {
+        't': t,
+        'wage_fraction_at_risk': wfr,
+        'emp_share_at_risk': emp_at_risk,
+        **paths,
+        'adoption_parameters': adoption_params,
+        'zones': zones,
+        'occupation_codes': occ['onet_soc_code'].to_numpy(),
+        'occupation_mean_exposure': exposure_total / n_scenarios,
+    }
+
+
+def summarize_paths(result, quantiles=DEFAULT_QUANTILES):
+    """
+    Reduce scenario trajectories to mean and quantile bands per year and metric.
+
+    Returns long DataFrame [Year, Metric, Mean, Q05, Q50, Q95].
+    """
+    t = result['t']
+    years = START_YEAR + t
+    rows = []
+    for key, label in PATH_METRICS:
+        values = result[key]
+        bands = np.quantile(values, quantiles, axis=0)
+        frame = pd.DataFrame({'Year': years, 'Metric': label, 'Mean': values.mean(axis=0)})
+        for q, band in zip(quantiles, bands):
+            frame[f'Q{int(round(q * 100)):02d}'] = band
+        rows.append(frame)
+    summary = pd.concat(rows, ignore_index=True)
+    # Report whole years only
+    return summary[np.isclose(summary['Year'], np.round(summary['Year']))].reset_index(drop=True)
+
+
+def main(n_scenarios=5000, horizon=HORIZON_YEARS, seed=None, behavioral=False):
+    """Simulate adoption paths for the equal-split specification and save the fan-chart summary."""
+    print("Loading crosswalk data...")
+    df = load_crosswalk()
+    occ = calculate_occupation_exposure_equal(df)
+
+    print(f"\n=== Adoption dynamics: {n_scenarios:,} scenarios over {horizon} years ===")
+    start = time.perf_counter()
+    result = simulate_adoption(occ, n_scenarios=n_scenarios, seed=seed, horizon=horizon,
+                               behavioral_priors=behavioral)
+    elapsed = time.perf_counter() - start
+    print(f"  - Completed in {elapsed:.2f}s ({len(result['t'])} steps, {len(result['occupation_codes'])} occupations)")
+
+    summary = summarize_paths(result)
+    final = summary[summary['Year'] == summary['Year'].max()]
+    print(f"\nEnd-of-horizon distribution ({START_YEAR + horizon}):")
+    print(final.drop(columns='Year').to_string(index=False))
+
+    summary.to_csv(OUTPUT_DIR / "adoption_paths_summary.csv", index=False)
+    print(f"\nResults saved to {OUTPUT_DIR}/adoption_paths_summary.csv")
+    return result, summary
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--scenarios', type=int, default=5000, help='Number of scenario trajectories')
+    parser.add_argument('--horizon', type=int, default=HORIZON_YEARS, help='Years simulated')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for scenario draws')
+    parser.add_argument('--behavioral', action='store_true',
+                        help='Also draw behavioral parameters (monte_carlo.DEFAULT_PRIORS)')
+    args = parser.parse_args()
+    main(n_scenarios=args.scenarios, horizon=args.horizon, seed=args.seed, behavioral=args.behavioral)
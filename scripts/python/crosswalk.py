@@ -0,0 +1,308 @@
+"""
+Crosswalk Command-Line Interface
+================================
+
+Single entry point for the pipeline stages:
+
+    build        Build the Anthropic → O*NET → BLS crosswalk (build_crosswalk.py)
+    importance   Importance-weighted occupation exposure (models/utils/exposure_calculation.py)
+    estimate     Estimate A-R, Kaleckian, B-M and GE models (estimate_models.py)
+    validate     Cross-sectional wage-growth validation (models/acemoglu_restrepo/empirical_validation.py)
+    did          Difference-in-differences validation (models/acemoglu_restrepo/empirical_validation_did.py)
+    event-study  Exposure × year leads/lags with absorbed FEs (models/acemoglu_restrepo/empirical_validation_event_study.py)
+    placebo      Permuted-exposure placebo distributions (models/acemoglu_restrepo/empirical_validation_placebo.py)
+    spec-curve   All 48 exposure × period × control × weight × treatment specifications (models/utils/spec_curve.py)
+    synthetic-control  Donor-weighted wage paths with placebo-in-space inference (models/utils/synthetic_control.py)
+    oring        Usage-wage O-ring regressions (models/oring_automation/estimate_usage_wage_regressions.py)
+    figures      Render validation figures from saved tables, skipping unchanged ones (models/utils/figure_stage.py)
+    runs         List or compare recorded runs (models/utils/run_store.py)
+    import-time  Report cold import cost of each dependency and which subcommands need it
+
+This module imports only the standard library at top level. Each subcommand
+imports its own dependencies when it runs, so `--help` and the numeric
+subcommands never pay for statsmodels, matplotlib or seaborn. validate and
+did call the validation scripts' main() (models/utils/wage_validation.py
+does the work; matplotlib is only imported when figures are drawn).
+
+Usage:
+    python crosswalk.py --help
+    python crosswalk.py estimate --param sigma=2.0 --param c_w=0.75
+    python crosswalk.py importance --output occupation_exposure_importance.csv
+    python crosswalk.py validate --no-figures
+    python crosswalk.py figures --workers 2          # draw them later, only if their tables changed
+    python crosswalk.py runs --source estimate_models --metric ar.wage_effect --last 5
+    python crosswalk.py import-time
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import argparse
+import runpy
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# --- CONFIGURATION ---
+SCRIPT_DIR = Path(__file__).parent
+ROOT_DIR = SCRIPT_DIR.parent.parent  # anthropic-onet-crosswalk/
+MODELS_DIR = ROOT_DIR / "models"
+UTILS_DIR = MODELS_DIR / "utils"
+VALIDATION_DIR = MODELS_DIR / "acemoglu_restrepo"
+IMPORTANCE_CROSSWALK_FILE = ROOT_DIR / "data" / "processed" / "master_task_crosswalk_with_importance.csv"
+IMPORTANCE_OUTPUT_FILE = ROOT_DIR / "data" / "analysis" / "occupation_exposure_importance.csv"
+
+# Validation entry points (module name in models/acemoglu_restrepo/)
+VALIDATION_MODULES = {
+    'validate': 'empirical_validation',
+    'did': 'empirical_validation_did',
+    'event-study': 'empirical_validation_event_study',
+    'placebo': 'empirical_validation_placebo',
+    'spec-curve': 'empirical_validation_spec_curve',
+    'synthetic-control': 'empirical_validation_synthetic_control',
+}
+
+# Scripts that run their analysis at module level; executed only by their subcommand
+SCRIPTS = {
+    'oring': MODELS_DIR / "oring_automation" / "estimate_usage_wage_regressions.py",
+}
+
+# Third-party dependencies per subcommand (for the import-time report)
+SUBCOMMAND_IMPORTS = {
+    'build': ['pandas', 'rapidfuzz'],
+    'importance': ['numpy', 'pandas', 'openpyxl'],
+    'estimate': ['numpy', 'pandas', 'estimate_models'],
+    'validate': ['numpy', 'pandas', 'statsmodels.api', 'wage_validation', 'matplotlib.pyplot'],
+    'did': ['numpy', 'pandas', 'statsmodels.api', 'wage_validation', 'matplotlib.pyplot'],
+    'event-study': ['numpy', 'pandas', 'scipy.sparse', 'event_study', 'wage_validation', 'matplotlib.pyplot'],
+    'placebo': ['numpy', 'pandas', 'statsmodels.api', 'wage_validation', 'matplotlib.pyplot'],
+    'spec-curve': ['numpy', 'pandas', 'statsmodels.api', 'spec_curve', 'matplotlib.pyplot'],
+    'synthetic-control': ['numpy', 'pandas', 'synthetic_control', 'wage_validation', 'matplotlib.pyplot'],
+    'oring': ['numpy', 'pandas', 'statsmodels.api', 'matplotlib.pyplot', 'seaborn'],
+    'figures': ['pandas', 'figure_stage', 'wage_validation', 'matplotlib.pyplot'],
+    'runs': ['pandas', 'run_store'],
+}
+
+
+def _add_paths():
+    """Make scripts/python and models/utils importable (as the scripts themselves do)."""
+    for path in (str(SCRIPT_DIR), str(UTILS_DIR)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def _parse_params(pairs):
+    """Parse repeated NAME=VALUE options into ModelConfig overrides."""
+    changes = {}
+    for pair in pairs or []:
+        name, sep, value = pair.partition('=')
+        if not sep:
+            raise SystemExit(f"--param expects NAME=VALUE, got '{pair}'")
+        try:
+            changes[name.strip()] = float(value)
+        except ValueError:
+            raise SystemExit(f"--param {name}: '{value}' is not a number")
+    return changes
+
+
+# =============================================================================
+# SUBCOMMANDS
+# =============================================================================
+
+def cmd_build(args):
+    _add_paths()
+    import build_crosswalk
+    build_crosswalk.main()
+
+
+def cmd_importance(args):
+    _add_paths()
+    import pandas as pd
+    from exposure_calculation import calculate_importance_weighted_exposure
+
+    print("Loading crosswalk with task importance...")
+    crosswalk = pd.read_csv(args.crosswalk)
+    print(f"  - {len(crosswalk):,} rows")
+    occ = calculate_importance_weighted_exposure(crosswalk)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    occ.to_csv(args.output, index=False)
+    print(f"\nSaved: {args.output}")
+
+
+def cmd_estimate(args):
+    _add_paths()
+    import estimate_models as em
+
+    changes = _parse_params(args.param)
+    try:
+        config = em.DEFAULT_CONFIG.replace(**changes)
+    except (TypeError, ValueError) as e:
+        raise SystemExit(f"Invalid --param: {e}")
+    em.main(config)
+
+
+def cmd_validate(args):
+    _add_paths()
+    if str(VALIDATION_DIR) not in sys.path:
+        sys.path.insert(0, str(VALIDATION_DIR))
+    import importlib
+    module = importlib.import_module(VALIDATION_MODULES[args.command])
+    options = {name: getattr(args, name) for name in ('reps', 'within', 'workers', 'wage_panel_path', 'unit')
+               if getattr(args, name, None) is not None}
+    module.main(figures=not args.no_figures, **options)
+
+
+def cmd_script(args):
+    script = SCRIPTS[args.command]
+    _add_paths()
+    sys.argv = [str(script)]
+    runpy.run_path(str(script), run_name='__main__')
+
+
+def cmd_figures(args):
+    _add_paths()
+    from figure_stage import print_figures, render_figures
+    try:
+        table = render_figures(args.output_dir, args.names or None, workers=args.workers, force=args.force)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print_figures(table)
+
+
+def cmd_runs(args):
+    _add_paths()
+    import pandas as pd
+    from run_store import compact_runs, compare_runs, list_runs, query_runs
+
+    if args.compact:
+        for source, n_files in compact_runs(args.source).items():
+            print(f"Compacted {n_files} files in source={source}")
+    runs = list_runs(source=args.source).head(args.last)
+    if runs.empty:
+        print("No recorded runs.")
+        return
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        if not args.metric:
+            print(runs.to_string(index=False))
+            return
+        frame = query_runs(source=args.source, metrics=args.metric, run_ids=runs['run_id'].tolist())
+        print(compare_runs(frame).to_string())
+
+
+def cmd_import_time(args):
+    """Time each dependency's import in a fresh interpreter (cold, no shared module cache)."""
+    modules = sorted({m for mods in SUBCOMMAND_IMPORTS.values() for m in mods})
+    path_setup = f"import sys; sys.path[:0] = [{str(SCRIPT_DIR)!r}, {str(UTILS_DIR)!r}]; "
+
+    def timed(code):
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        if out.returncode != 0:
+            return None
+        return float(out.stdout.strip().splitlines()[-1])
+
+    print("=" * 60)
+    print("COLD IMPORT TIMES (fresh interpreter per module)")
+    print("=" * 60)
+    seconds = {}
+    for module in modules:
+        seconds[module] = timed(
+            path_setup + f"import time; t = time.perf_counter(); import {module}; "
+                         f"print(time.perf_counter() - t)"
+        )
+        label = 'not installed' if seconds[module] is None else f"{seconds[module]:.3f}s"
+        print(f"  {module:<22} {label:>14}")
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, __file__, '--help'], capture_output=True)
+    help_seconds = time.perf_counter() - start
+
+    print("\n" + "-" * 60)
+    print("STARTUP COST BY SUBCOMMAND (all of its imports, one fresh interpreter)")
+    print("-" * 60)
+    print(f"  {'--help':<14} {help_seconds:>8.3f}s  (wall time, incl. interpreter start)")
+    for command, mods in SUBCOMMAND_IMPORTS.items():
+        total = timed(
+            path_setup + f"import time; t = time.perf_counter(); import {', '.join(mods)}; "
+                         f"print(time.perf_counter() - t)"
+        )
+        label = 'not installed' if total is None else f"{total:.3f}s"
+        print(f"  {command:<14} {label:>9}  {', '.join(mods)}")
+
+
+# =============================================================================
+# ENTRY POINT
+# =============================================================================
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='crosswalk', description=__doc__.split('\n')[1])
+    sub = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+
+    p = sub.add_parser('build', help='Build the task crosswalk')
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser('importance', help='Importance-weighted occupation exposure')
+    p.add_argument('--crosswalk', type=Path, default=IMPORTANCE_CROSSWALK_FILE, help='Crosswalk with O*NET task IDs')
+    p.add_argument('--output', type=Path, default=IMPORTANCE_OUTPUT_FILE, help='Output CSV')
+    p.set_defaults(func=cmd_importance)
+
+    p = sub.add_parser('estimate', help='Estimate the theoretical models')
+    p.add_argument('--param', action='append', metavar='NAME=VALUE',
+                   help='Override a ModelConfig field (repeatable), e.g. sigma=2.0')
+    p.set_defaults(func=cmd_estimate)
+
+    for command, help_text in [('validate', 'Cross-sectional wage-growth validation'),
+                               ('did', 'Difference-in-differences validation'),
+                               ('event-study', 'Event study with multi-year leads and lags'),
+                               ('placebo', 'Placebo distributions under permuted exposure'),
+                               ('spec-curve', 'Specification curve over the validation choices'),
+                               ('synthetic-control', 'Synthetic control for high-exposure occupations')]:
+        p = sub.add_parser(command, help=help_text)
+        p.add_argument('--no-figures', action='store_true', help='Skip the 2x2 diagnostic figure')
+        if command in ('did', 'placebo'):
+            p.add_argument('--reps', type=int, default=None,
+                           help='Wild bootstrap / randomization replicates (0 to skip)')
+        if command == 'placebo':
+            p.add_argument('--within', choices=['all', 'major'], default=None,
+                           help='Permute across all occupations or within SOC major groups')
+        if command == 'spec-curve':
+            p.add_argument('--workers', type=int, default=None,
+                           help='Processes for the spec groups (default 1: serial)')
+        if command == 'synthetic-control':
+            p.add_argument('--wage-panel', dest='wage_panel_path', type=Path, default=None,
+                           help='Long OES panel with at least two pre-event years')
+            p.add_argument('--unit', choices=['soc', 'quartile'], default=None,
+                           help='High-exposure SOCs or exposure-quartile aggregates')
+            p.add_argument('--workers', type=int, default=None, help='Threads for the weight solves')
+        p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser('oring', help='Usage-wage O-ring regressions')
+    p.set_defaults(func=cmd_script)
+
+    p = sub.add_parser('figures', help='Render validation figures from the saved result tables')
+    p.add_argument('names', nargs='*', help='Figures to render (default: all whose tables exist)')
+    p.add_argument('--output-dir', type=Path, default=VALIDATION_DIR / "output", help='Directory with the tables')
+    p.add_argument('--workers', type=int, default=1, help='Render in this many processes')
+    p.add_argument('--force', action='store_true', help='Redraw figures whose inputs are unchanged')
+    p.set_defaults(func=cmd_figures)
+
+    p = sub.add_parser('runs', help='List or compare recorded runs')
+    p.add_argument('--source', default=None, help='Producing script, e.g. estimate_models')
+    p.add_argument('--metric', action='append', help='Compare these metrics across runs (repeatable)')
+    p.add_argument('--last', type=int, default=20, help='Most recent N runs')
+    p.add_argument('--compact', action='store_true', help='Merge run files first (faster queries)')
+    p.set_defaults(func=cmd_runs)
+
+    p = sub.add_parser('import-time', help='Report dependency import times per subcommand')
+    p.set_defaults(func=cmd_import_time)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
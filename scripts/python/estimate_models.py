@@ -25,9 +25,13 @@ Author: Ilan Strauss | AI Disclosures Project
 Date: January 2026
 """
 
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
-from pathlib import Path
 
 # --- CONFIGURATION ---
 ROOT_DIR = Path(__file__).parent.parent.parent  # anthropic-onet-crosswalk/
@@ -36,38 +40,36 @@ CROSSWALK_FILE = DATA_DIR / "processed" / "master_task_crosswalk_with_wages.csv"
 OUTPUT_DIR = DATA_DIR / "analysis"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-# Kaleckian parameters (from literature: Stockhammer 2011, Onaran & Galanis 2014)
-C_W = 0.80   # Marginal propensity to consume out of wages
-C_PI = 0.40  # Marginal propensity to consume out of profits
-# NOTE: Multiplier is now derived from class MPCs and distribution (see kaleckian_model)
-
-# Acemoglu-Restrepo parameters
-SIGMA = 1.5  # Elasticity of substitution between tasks
-# NOTE: Higher σ means tasks are MORE substitutable (easier to replace labor with capital)
-# At σ=1 (Cobb-Douglas), task displacement has zero wage effect
-# As σ→∞, wage effect approaches -exposure_share
-ALPHA = 1.0  # Displacement rate: fraction of exposed wage bill actually displaced (0-1)
-             # α=1.0 is pessimistic "full displacement" assumption
-             # Claude usage may represent complementarity, not displacement
-PHI = 0.0    # Productivity effect: offsetting productivity gains in remaining tasks
-             # A-R framework includes both displacement (-) and productivity (+) effects
-             # We set φ=0 as pessimistic case (no offsetting productivity gains)
-
-# Bhaduri-Marglin parameters (from literature: Stockhammer 2017, Onaran & Galanis 2014)
-# CORRECTED: Now includes worker saving (s_w) for genuine regime determination
-S_W = 0.08   # Propensity to save out of wages (s_w) - Onaran & Galanis (2014): 0.05-0.15
-S_PI = 0.45  # Propensity to save out of profits (s_π)
-G_U = 0.10   # Investment sensitivity to capacity utilization (g_u)
-G_PI = 0.05  # Investment sensitivity to profit share (g_π)
-U_BASELINE = 0.80  # Baseline capacity utilization (80%)
-WAGE_SHARE_BASELINE = 0.55  # US wage share (for profit share calculation)
-
-# CALIBRATED: g_0 set to hit U_BASELINE at baseline profit share
-# u* = (g_0 + g_π×π) / (σ(π) - g_u) where σ(π) = s_w×(1-π) + s_π×π
-# Solving: g_0 = u_baseline × (σ(π_0) - g_u) - g_π × π_0
-_PI_BASELINE = 1 - WAGE_SHARE_BASELINE  # 0.45
-_SIGMA_BASELINE = S_W * WAGE_SHARE_BASELINE + S_PI * _PI_BASELINE  # Aggregate saving rate
-G_0 = U_BASELINE * (_SIGMA_BASELINE - G_U) - G_PI * _PI_BASELINE  # Calibrated to hit u*=0.80
+# Add models/utils to path for shared utilities
+sys.path.insert(0, str(ROOT_DIR / "models" / "utils"))
+from model_config import DEFAULT_CONFIG, ModelConfig  # noqa: E402
+from nested_ces import solve_equilibrium  # noqa: E402
+from run_store import record_run  # noqa: E402
+
+# Model parameters live in immutable ModelConfig objects (models/utils/model_config.py)
+# and are passed explicitly into every model function. DEFAULT_CONFIG is the
+# baseline calibration:
+#   A-R:       σ=1.5, α=1.0 (full displacement), φ=0 (no productivity offset)
+#   Kaleckian: c_w=0.80, c_π=0.40, multiplier derived from class MPCs
+#   B-M:       s_w=0.08, s_π=0.45, g_u=0.10, g_π=0.05, u_baseline=0.80,
+#              g₀ calibrated per config so u*(π₀) = u_baseline
+#   ω₀ = 0.55 (US wage share)
+
+# Bootstrap for exposure sampling uncertainty (one week of API traffic)
+N_BOOTSTRAP = 2000        # Replicates
+BOOTSTRAP_UNIT = 'task'   # 'task' (resample task strings) or 'conversation' (resample API calls)
+BOOTSTRAP_SEED = 20260115
+CI_LEVEL = 0.95           # Percentile interval reported in model_summary.csv
+
+# Regime codes used by the vectorized model closures
+REGIME_WAGE_LED = 0
+REGIME_PROFIT_LED = 1
+REGIME_UNSTABLE = 2
+REGIME_LABELS = {
+    REGIME_WAGE_LED: 'wage-led',
+    REGIME_PROFIT_LED: 'profit-led',
+    REGIME_UNSTABLE: 'unstable',
+}
 
 
 def load_crosswalk():
@@ -118,12 +120,13 @@ def calculate_occupation_exposure_equal(df):
     return occ[occ['A_MEAN'].notna()].copy()
 
 
-def calculate_occupation_exposure_empweighted(df):
+def reallocate_ambiguous_by_employment(df):
     """
-    Aggregate task-level data to occupation level using EMPLOYMENT-WEIGHTED splits.
-    This is the ROBUSTNESS specification.
+    Re-split usage of ambiguous tasks across candidate SOCs by employment.
 
-    For ambiguous tasks, re-weight based on occupation employment.
+    Returns a task-level copy of df with api_usage_count and split_weight
+    replaced by employment-weighted shares (equal split kept as fallback
+    when a group has no employment data).
     """
     df = df.copy()
 
@@ -152,6 +155,18 @@ def calculate_occupation_exposure_empweighted(df):
                         df.loc[idx, 'split_weight'] = emp_weight
                 # If no employment data, keep equal split (fallback)
 
+    return df
+
+
+def calculate_occupation_exposure_empweighted(df):
+    """
+    Aggregate task-level data to occupation level using EMPLOYMENT-WEIGHTED splits.
+    This is the ROBUSTNESS specification.
+
+    For ambiguous tasks, re-weight based on occupation employment.
+    """
+    df = reallocate_ambiguous_by_employment(df)
+
     total_usage = df['api_usage_count'].sum()
     df['task_usage_share'] = df['api_usage_count'] / total_usage
 
@@ -186,7 +201,7 @@ def calculate_occupation_exposure_empweighted(df):
     return occ[occ['A_MEAN'].notna()].copy()
 
 
-def acemoglu_restrepo_model(occ):
+def acemoglu_restrepo_model(occ, config=DEFAULT_CONFIG):
     """
     MAINSTREAM BENCHMARK: Acemoglu-Restrepo Inspired Task Model
 
@@ -209,6 +224,8 @@ def acemoglu_restrepo_model(occ):
     At σ=1 (Cobb-Douglas): displacement term vanishes (workers reallocate)
     As σ→∞: wage effect approaches -α × exposure_share
 
+    Parameters (σ, α, φ) are read from config (a ModelConfig).
+
     Returns dict with key estimates.
     """
     occ = occ.copy()
@@ -228,8 +245,8 @@ def acemoglu_restrepo_model(occ):
     # Wage effect: Productivity - Displacement (with α and φ parameters)
     # Displacement term: -[(σ-1)/σ] × α × exposure
     # Productivity term: +φ × exposure (set to 0 as pessimistic case)
-    displacement_effect = -((SIGMA - 1) / SIGMA) * ALPHA * exposure_share
-    productivity_effect = PHI * exposure_share
+    displacement_effect = -((config.sigma - 1) / config.sigma) * config.alpha * exposure_share
+    productivity_effect = config.phi * exposure_share
     wage_effect = productivity_effect + displacement_effect
 
     return {
@@ -239,14 +256,47 @@ def acemoglu_restrepo_model(occ):
         'wage_effect': wage_effect,
         'displacement_effect': displacement_effect,
         'productivity_effect': productivity_effect,
-        'sigma': SIGMA,
-        'alpha': ALPHA,
-        'phi': PHI,
+        'sigma': config.sigma,
+        'alpha': config.alpha,
+        'phi': config.phi,
         'total_wage_bill': total_wage_bill
     }, occ
 
 
-def kaleckian_model(occ, ar_results):
+def general_equilibrium_model(occ, config=DEFAULT_CONFIG):
+    """
+    STRUCTURAL BENCHMARK: Nested-CES task model in general equilibrium
+
+    Unlike the reduced-form proxy above, relative wages are endogenous:
+    tasks nest within occupations (elasticity σ) and occupations in
+    aggregate output (elasticity η). A share θ_i = α × ai_exposure_i of each
+    occupation's tasks moves to AI capital at cost automation_cost_ratio ×
+    baseline wage; occupation employment is held fixed. Solved by Newton
+    iteration over all occupations (models/utils/nested_ces.py).
+
+    Returns dict with aggregate effects, and occ with ge_dln_wage (Δln w_i).
+    """
+    occ = occ.copy()
+    solution = general_equilibrium_batch(occ['ai_exposure'].to_numpy(), occ, config)
+    occ['ge_dln_wage'] = solution['log_wage_change']
+
+    return {
+        'wage_bill_change': float(solution['wage_bill_change']),
+        'output_change': float(solution['output_change']),
+        'labor_share': float(solution['labor_share']),
+        'mean_dln_wage': occ['ge_dln_wage'].mean(),
+        'min_dln_wage': occ['ge_dln_wage'].min(),
+        'max_dln_wage': occ['ge_dln_wage'].max(),
+        'converged': bool(solution['converged']),
+        'iterations': solution['iterations'],
+        'sigma': config.sigma,
+        'eta': config.eta,
+        'alpha': config.alpha,
+        'automation_cost_ratio': config.automation_cost_ratio,
+    }, occ
+
+
+def kaleckian_model(occ, ar_results, config=DEFAULT_CONFIG):
     """
     HETERODOX MODEL: Kaleckian Wage Share / Aggregate Demand
 
@@ -266,6 +316,8 @@ def kaleckian_model(occ, ar_results):
     Under the standard Post-Keynesian assumption c_w > c_π, redistribution from
     wages to profits reduces consumption and aggregate demand.
 
+    Parameters (c_w, c_π, ω₀) are read from config (a ModelConfig).
+
     Returns dict with key estimates.
     """
     occ = occ.copy()
@@ -279,17 +331,17 @@ def kaleckian_model(occ, ar_results):
     # CORRECTED: Convert wage fraction to change in wage SHARE of income
     # Δω = -ω₀ × (wage_at_risk / W) = -ω₀ × wage_fraction_at_risk
     # (Negative because wages fall, profit share rises)
-    delta_omega = -WAGE_SHARE_BASELINE * wage_fraction_at_risk
+    delta_omega = -config.wage_share_baseline * wage_fraction_at_risk
 
     # CORRECTED: Derive multiplier from class MPCs and distribution
     # Aggregate MPC: c = c_w × ω + c_π × (1-ω)
-    aggregate_mpc = C_W * WAGE_SHARE_BASELINE + C_PI * (1 - WAGE_SHARE_BASELINE)
-    multiplier = 1 / (1 - aggregate_mpc)  # ~2.04 with baseline parameters
+    aggregate_mpc = config.aggregate_mpc
+    multiplier = config.multiplier  # ~2.04 with baseline parameters
 
     # Consumption effect: ΔC/Y = (c_w - c_π) × Δω
     # Note: since Δω is negative (wages fall), and (c_w - c_π) > 0,
     # consumption_effect is negative (contractionary)
-    consumption_effect = (C_W - C_PI) * delta_omega
+    consumption_effect = (config.c_w - config.c_pi) * delta_omega
 
     # Total AD effect with multiplier (ΔY/Y)
     # Negative value means contractionary
@@ -311,19 +363,19 @@ def kaleckian_model(occ, ar_results):
         'ad_effect': ad_effect,  # Now negative for contractionary
         'emp_at_risk': emp_at_risk,
         'emp_share_at_risk': emp_at_risk / total_emp,
-        'c_w': C_W,
-        'c_pi': C_PI,
-        'omega_baseline': WAGE_SHARE_BASELINE
+        'c_w': config.c_w,
+        'c_pi': config.c_pi,
+        'omega_baseline': config.wage_share_baseline
     }, occ
 
 
-def bhaduri_marglin_model(occ, ar_results):
+def bhaduri_marglin_model(occ, ar_results, config=DEFAULT_CONFIG):
     """
     HETERODOX MODEL: Bhaduri-Marglin Endogenous Regime Determination
 
     CORRECTED VERSION with three fixes per ChatGPT review:
     1. delta_profit_share now correctly converts wage fraction to income fraction
-    2. g_0 calibrated so model's baseline u* = U_BASELINE (consistency)
+    2. g_0 calibrated per config so model's baseline u* = u_baseline (consistency)
     3. Worker saving (s_w > 0) added so regime is genuinely endogenous
 
     Investment function: I = g₀ + g_u×u + g_π×π
@@ -346,41 +398,45 @@ def bhaduri_marglin_model(occ, ar_results):
         - Onaran & Galanis (2014) "Income distribution and growth"
         - Hein (2014) "Distribution and Growth after Keynes" Ch. 6
 
+    Parameters (s_w, s_π, g_u, g_π, u_baseline, ω₀) are read from config
+    (a ModelConfig); g₀ is config.g_0.
+
     Returns dict with key estimates.
     """
     total_wage_bill = ar_results['total_wage_bill']
 
+    s_w, s_pi, g_u, g_pi = config.s_w, config.s_pi, config.g_u, config.g_pi
+    u_baseline = config.u_baseline
+    g_0 = config.g_0
+
     # Baseline distribution
-    profit_share_baseline = 1 - WAGE_SHARE_BASELINE  # 0.45
+    profit_share_baseline = config.profit_share_baseline  # 0.45
 
     # CORRECTED: AI-induced change in profit share
     # wage_at_risk / wage_bill gives fraction of wages displaced
     # To get change in profit share (Π/Y), multiply by wage share (W/Y)
     # Because Δπ = Δ(Π/Y) = wage_at_risk/Y = (wage_at_risk/W) × (W/Y)
     wage_fraction_at_risk = occ['wage_at_risk'].sum() / total_wage_bill
-    delta_profit_share = wage_fraction_at_risk * WAGE_SHARE_BASELINE  # CORRECTED
+    delta_profit_share = wage_fraction_at_risk * config.wage_share_baseline  # CORRECTED
     profit_share_new = profit_share_baseline + delta_profit_share
 
     # Aggregate saving rate function: σ(π) = s_w×(1-π) + s_π×π
-    def sigma(pi):
-        return S_W * (1 - pi) + S_PI * pi
-
-    sigma_before = sigma(profit_share_baseline)
-    sigma_after = sigma(profit_share_new)
+    sigma_before = config.saving_rate(profit_share_baseline)
+    sigma_after = config.saving_rate(profit_share_new)
 
     # Equilibrium utilization BEFORE AI shock
-    denominator_before = sigma_before - G_U
+    denominator_before = sigma_before - g_u
     if denominator_before <= 0:
-        u_star_before = U_BASELINE  # Unstable/undefined
+        u_star_before = u_baseline  # Unstable/undefined
     else:
-        u_star_before = (G_0 + G_PI * profit_share_baseline) / denominator_before
+        u_star_before = (g_0 + g_pi * profit_share_baseline) / denominator_before
 
     # Equilibrium utilization AFTER AI shock
-    denominator_after = sigma_after - G_U
+    denominator_after = sigma_after - g_u
     if denominator_after <= 0:
-        u_star_after = U_BASELINE
+        u_star_after = u_baseline
     else:
-        u_star_after = (G_0 + G_PI * profit_share_new) / denominator_after
+        u_star_after = (g_0 + g_pi * profit_share_new) / denominator_after
 
     # Change in utilization
     delta_u = u_star_after - u_star_before
@@ -389,8 +445,8 @@ def bhaduri_marglin_model(occ, ar_results):
     # ∂u*/∂π = [g_π×(σ-g_u) - (g₀+g_π×π)×(s_π-s_w)] / (σ-g_u)²
     # The sign is now GENUINELY AMBIGUOUS (not mechanically wage-led)
     if denominator_before > 0:
-        numerator = (G_PI * denominator_before -
-                     (G_0 + G_PI * profit_share_baseline) * (S_PI - S_W))
+        numerator = (g_pi * denominator_before -
+                     (g_0 + g_pi * profit_share_baseline) * (s_pi - s_w))
         partial_u_partial_pi = numerator / (denominator_before ** 2)
     else:
         partial_u_partial_pi = 0
@@ -398,14 +454,14 @@ def bhaduri_marglin_model(occ, ar_results):
     regime = "profit-led" if partial_u_partial_pi > 0 else "wage-led"
 
     # Output effect (relative to baseline utilization)
-    output_effect = delta_u / U_BASELINE if U_BASELINE > 0 else 0
+    output_effect = delta_u / u_baseline if u_baseline > 0 else 0
 
     # Investment effect: ΔI = g_u×Δu + g_π×Δπ
-    investment_effect = G_U * delta_u + G_PI * delta_profit_share
+    investment_effect = g_u * delta_u + g_pi * delta_profit_share
 
     # Savings effect: ΔS ≈ σ×Δu + u×Δσ where Δσ = (s_π-s_w)×Δπ
-    delta_sigma = (S_PI - S_W) * delta_profit_share
-    savings_effect = sigma_before * delta_u + U_BASELINE * delta_sigma
+    delta_sigma = (s_pi - s_w) * delta_profit_share
+    savings_effect = sigma_before * delta_u + u_baseline * delta_sigma
 
     return {
         'profit_share_baseline': profit_share_baseline,
@@ -420,16 +476,122 @@ def bhaduri_marglin_model(occ, ar_results):
         'output_effect': output_effect,
         'investment_effect': investment_effect,
         'savings_effect': savings_effect,
-        's_w': S_W,
-        's_pi': S_PI,
-        'g_u': G_U,
-        'g_pi': G_PI,
-        'g_0': G_0,
+        's_w': s_w,
+        's_pi': s_pi,
+        'g_u': g_u,
+        'g_pi': g_pi,
+        'g_0': g_0,
         'sigma_baseline': sigma_before
     }
 
 
-def parameter_sensitivity_analysis(occ, ar_results):
+def acemoglu_restrepo_batch(exposure_share, config=DEFAULT_CONFIG):
+    """
+    Vectorized Acemoglu-Restrepo proxy.
+
+    exposure_share and any config field may be scalars or arrays (parameter
+    draws, bootstrap replicates); outputs are broadcast to their common
+    shape. Same equation as acemoglu_restrepo_model:
+        Δln(w) = φ × exposure - [(σ-1)/σ] × α × exposure
+    """
+    sigma = config.sigma
+    displacement_effect = -((sigma - 1) / sigma) * config.alpha * exposure_share
+    productivity_effect = config.phi * exposure_share
+    out = {
+        'displacement_effect': displacement_effect,
+        'productivity_effect': productivity_effect,
+        'wage_effect': productivity_effect + displacement_effect,
+    }
+    shape = np.broadcast_shapes(*(np.shape(v) for v in out.values()))
+    return {k: np.broadcast_to(v, shape) for k, v in out.items()}
+
+
+def general_equilibrium_batch(exposure, occ, config=DEFAULT_CONFIG):
+    """
+    Vectorized nested-CES equilibrium (same model as general_equilibrium_model).
+
+    exposure has shape (..., n_occupations) in the row order of occ; config
+    fields may be arrays broadcastable to the leading batch shape.
+    """
+    return solve_equilibrium(
+        exposure, occ['A_MEAN'].to_numpy(dtype=np.float64), occ['TOT_EMP'].to_numpy(dtype=np.float64),
+        sigma=config.sigma, eta=config.eta, alpha=config.alpha,
+        cost_ratio=config.automation_cost_ratio,
+    )
+
+
+def kaleckian_batch(wage_fraction_at_risk, config=DEFAULT_CONFIG):
+    """
+    Vectorized Kaleckian closure (same algebra as kaleckian_model).
+
+    Δω = -ω₀ × wage_fraction_at_risk, multiplier = config.multiplier.
+    """
+    delta_omega = -config.wage_share_baseline * wage_fraction_at_risk
+    multiplier = config.multiplier
+    consumption_effect = (config.c_w - config.c_pi) * delta_omega
+    out = {
+        'delta_omega': delta_omega,
+        'aggregate_mpc': config.aggregate_mpc,
+        'multiplier': multiplier,
+        'consumption_effect': consumption_effect,
+        'ad_effect': consumption_effect * multiplier,
+    }
+    shape = np.broadcast_shapes(*(np.shape(v) for v in out.values()))
+    return {k: np.broadcast_to(v, shape) for k, v in out.items()}
+
+
+def bhaduri_marglin_batch(wage_fraction_at_risk, config=DEFAULT_CONFIG):
+    """
+    Vectorized Bhaduri-Marglin closure (same algebra as bhaduri_marglin_model).
+
+    g₀ is config.g_0, calibrated per config so that u*(π₀) = u_baseline.
+    Points with σ(π₀) - g_u <= 0 have no stable equilibrium and are coded
+    REGIME_UNSTABLE, with utilization left at baseline.
+    """
+    s_w, s_pi, g_u, g_pi = config.s_w, config.s_pi, config.g_u, config.g_pi
+    u_baseline = config.u_baseline
+    g_0 = config.g_0
+
+    profit_share_baseline = config.profit_share_baseline
+    delta_profit_share = wage_fraction_at_risk * config.wage_share_baseline
+    profit_share_new = profit_share_baseline + delta_profit_share
+
+    denom_before = config.saving_rate_baseline - g_u
+    denom_after = config.saving_rate(profit_share_new) - g_u
+
+    stable_before = denom_before > 0
+    stable_after = denom_after > 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u_star_after = np.where(
+            stable_after,
+            (g_0 + g_pi * profit_share_new) / denom_after,
+            u_baseline
+        )
+        numerator = g_pi * denom_before - (g_0 + g_pi * profit_share_baseline) * (s_pi - s_w)
+        partial_u_partial_pi = np.where(stable_before, numerator / denom_before ** 2, 0.0)
+
+    delta_u = u_star_after - u_baseline
+    regime = np.where(
+        stable_before,
+        np.where(partial_u_partial_pi > 0, REGIME_PROFIT_LED, REGIME_WAGE_LED),
+        REGIME_UNSTABLE
+    ).astype(np.int8)
+
+    out = {
+        'g_0': g_0,
+        'delta_profit_share': delta_profit_share,
+        'u_star_after': u_star_after,
+        'delta_utilization': delta_u,
+        'output_effect': delta_u / u_baseline,
+        'partial_u_partial_pi': partial_u_partial_pi,
+        'regime': regime,
+    }
+    shape = np.broadcast_shapes(*(np.shape(v) for v in out.values()))
+    return {k: np.broadcast_to(v, shape) for k, v in out.items()}
+
+
+def parameter_sensitivity_analysis(occ, ar_results, config=DEFAULT_CONFIG):
     """
     Run models across different parameter scenarios.
 
@@ -439,16 +601,14 @@ def parameter_sensitivity_analysis(occ, ar_results):
     - g_π: AI investment may be more/less responsive to profits
     - s_π: Tech firms may save more of profits
 
+    Each scenario is `config` with the listed parameters replaced, evaluated
+    with the same closures as the Monte Carlo and bootstrap.
+
     Returns DataFrame with results across scenarios.
     """
     results = []
-    total_wage_bill = ar_results['total_wage_bill']
-    task_displacement = ar_results['task_displacement_share']
-
-    # Baseline values
-    wage_share_baseline = 0.55
-    profit_share_baseline = 1 - wage_share_baseline
-    delta_profit_share = (occ['wage_at_risk'].sum() / total_wage_bill)
+    exposure_share = ar_results['exposure_share']
+    wage_fraction_at_risk = occ['wage_at_risk'].sum() / ar_results['total_wage_bill']
 
     # =========================================================================
     # ACEMOGLU-RESTREPO: Vary σ (elasticity of substitution)
@@ -462,12 +622,12 @@ def parameter_sensitivity_analysis(occ, ar_results):
     ]
 
     for sigma, desc in sigma_scenarios:
-        wage_effect = -((sigma - 1) / sigma) * task_displacement
+        ar = acemoglu_restrepo_batch(exposure_share, config.replace(sigma=sigma))
         results.append({
             'Model': 'Acemoglu-Restrepo',
             'Scenario': desc,
             'Parameter_Changed': f'σ = {sigma}',
-            'Wage_Effect': wage_effect,
+            'Wage_Effect': float(ar['displacement_effect']),
             'AD_Effect': None,
             'Output_Effect': None,
             'Regime': 'N/A (full employment)'
@@ -475,11 +635,8 @@ def parameter_sensitivity_analysis(occ, ar_results):
 
     # =========================================================================
     # KALECKIAN: Vary MPCs
-    # CORRECTED: Use proper delta_omega and derived multiplier
+    # Δω = -ω₀ × wage_fraction_at_risk, multiplier derived from class MPCs
     # =========================================================================
-    # CORRECTED delta_omega = -ω₀ × wage_fraction_at_risk
-    delta_omega = -wage_share_baseline * delta_profit_share  # Now negative (wages fall)
-
     kalecki_scenarios = [
         (0.80, 0.40, "Baseline (c_w=0.80, c_π=0.40)"),
         (0.80, 0.30, "AI concentrates profits in low-spending tech firms"),
@@ -489,31 +646,21 @@ def parameter_sensitivity_analysis(occ, ar_results):
     ]
 
     for c_w, c_pi, desc in kalecki_scenarios:
-        # Derived multiplier from class MPCs: c = c_w×ω + c_π×(1-ω)
-        aggregate_mpc = wage_share_baseline * c_w + (1 - wage_share_baseline) * c_pi
-        multiplier = 1 / (1 - aggregate_mpc)
-
-        # Consumption effect with correct delta_omega (negative)
-        consumption_effect = (c_w - c_pi) * delta_omega
-        ad_effect = consumption_effect * multiplier  # Now negative (contractionary)
-
+        kalecki = kaleckian_batch(wage_fraction_at_risk, config.replace(c_w=c_w, c_pi=c_pi))
         results.append({
             'Model': 'Kaleckian',
             'Scenario': desc,
             'Parameter_Changed': f'c_w={c_w}, c_π={c_pi}',
             'Wage_Effect': None,
-            'AD_Effect': ad_effect,
+            'AD_Effect': float(kalecki['ad_effect']),
             'Output_Effect': None,
             'Regime': 'wage-led' if c_w > c_pi else 'profit-led'
         })
 
     # =========================================================================
     # BHADURI-MARGLIN: Vary investment/saving parameters
-    # CORRECTED: Now with worker saving (s_w) for genuine regime determination
+    # g₀ is recalibrated per scenario so that u*(π₀) = u_baseline
     # =========================================================================
-    # CORRECTED: delta_profit_share = wage_fraction × wage_share
-    delta_profit_share_corrected = delta_profit_share * WAGE_SHARE_BASELINE
-
     bm_scenarios = [
         # (s_w, s_π, g_u, g_π, description)
         (0.08, 0.45, 0.10, 0.05, "Baseline (with worker saving)"),
@@ -530,57 +677,60 @@ def parameter_sensitivity_analysis(occ, ar_results):
     ]
 
     for s_w, s_pi, g_u, g_pi, desc in bm_scenarios:
-        # Aggregate saving rate: σ(π) = s_w×(1-π) + s_π×π
-        def sigma(pi):
-            return s_w * (1 - pi) + s_pi * pi
-
-        sigma_before = sigma(profit_share_baseline)
-        sigma_after = sigma(profit_share_baseline + delta_profit_share_corrected)
-
-        # Calibrate g_0 to hit U_BASELINE at baseline
-        g_0_cal = U_BASELINE * (sigma_before - g_u) - g_pi * profit_share_baseline
-
-        # Equilibrium utilization BEFORE
-        denom_before = sigma_before - g_u
-        if denom_before <= 0:
-            u_before = U_BASELINE
-        else:
-            u_before = (g_0_cal + g_pi * profit_share_baseline) / denom_before
-
-        # Equilibrium utilization AFTER
-        denom_after = sigma_after - g_u
-        profit_share_new = profit_share_baseline + delta_profit_share_corrected
-        if denom_after <= 0:
-            u_after = U_BASELINE
-        else:
-            u_after = (g_0_cal + g_pi * profit_share_new) / denom_after
-
-        delta_u = u_after - u_before
-        output_effect = delta_u / U_BASELINE
-
-        # CORRECTED Regime determination with worker saving:
-        # ∂u*/∂π = [g_π×(σ-g_u) - (g₀+g_π×π)×(s_π-s_w)] / (σ-g_u)²
-        if denom_before > 0:
-            numerator = (g_pi * denom_before -
-                        (g_0_cal + g_pi * profit_share_baseline) * (s_pi - s_w))
-            partial = numerator / (denom_before ** 2)
-            regime = "profit-led" if partial > 0 else "wage-led"
-        else:
-            regime = "unstable"
-
+        scenario = config.replace(s_w=s_w, s_pi=s_pi, g_u=g_u, g_pi=g_pi)
+        bm = bhaduri_marglin_batch(wage_fraction_at_risk, scenario)
         results.append({
             'Model': 'Bhaduri-Marglin',
             'Scenario': desc,
             'Parameter_Changed': f's_w={s_w}, s_π={s_pi}, g_u={g_u}, g_π={g_pi}',
             'Wage_Effect': None,
             'AD_Effect': None,
-            'Output_Effect': output_effect,
-            'Regime': regime
+            'Output_Effect': float(bm['output_effect']),
+            'Regime': REGIME_LABELS[int(bm['regime'])]
         })
 
     return pd.DataFrame(results)
 
 
+def _scenario_metrics(args):
+    """Pool worker: evaluate the three models for one config."""
+    occ, config = args
+    ar_results, occ = acemoglu_restrepo_model(occ, config)
+    kalecki_results, occ = kaleckian_model(occ, ar_results, config)
+    bm_results = bhaduri_marglin_model(occ, ar_results, config)
+    ge_results, _ = general_equilibrium_model(occ, config)
+    return {
+        **config.as_dict(),
+        'g_0': config.g_0,
+        'wage_effect': ar_results['wage_effect'],
+        'multiplier': kalecki_results['multiplier'],
+        'ad_effect': kalecki_results['ad_effect'],
+        'delta_utilization': bm_results['delta_utilization'],
+        'output_effect': bm_results['output_effect'],
+        'regime': bm_results['regime'],
+        'ge_wage_bill_change': ge_results['wage_bill_change'],
+        'ge_labor_share': ge_results['labor_share'],
+    }
+
+
+def run_scenarios(occ, configs, max_workers=None, use_processes=False):
+    """
+    Evaluate the three models under many configs concurrently.
+
+    Configs are immutable and the models read no module state, so the
+    scenarios can share one occupation frame across a thread pool, or be
+    shipped to a process pool (use_processes=True) for large grids.
+
+    Returns DataFrame with one row per config: its parameters, calibrated g₀
+    and the headline model outputs.
+    """
+    tasks = [(occ, config) for config in configs]
+    executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor(max_workers=max_workers) as pool:
+        rows = list(pool.map(_scenario_metrics, tasks))
+    return pd.DataFrame(rows)
+
+
 def routine_analysis(occ):
     """
     Test whether AI follows traditional automation pattern.
@@ -629,9 +779,150 @@ def distributional_analysis(occ):
     return occ.groupby('wage_quintile', observed=True).agg(agg_cols).reset_index()
 
 
+def task_allocation_matrix(task_df, soc_codes):
+    """
+    Build the Anthropic task × SOC allocation matrix used for resampling.
+
+    Parameters
+    ----------
+    task_df : pd.DataFrame
+        Task-level crosswalk after the specification's split rule (equal split,
+        or reallocate_ambiguous_by_employment for the robustness spec)
+    soc_codes : array-like
+        Occupation codes in the order of the occupation frame
+
+    Returns
+    -------
+    task_usage : np.ndarray, shape (T,)
+        API usage of each unique Anthropic task (summed over its split rows)
+    allocation : np.ndarray, shape (T, S + 1)
+        Share of each task's usage allocated to each SOC. The last column
+        collects SOCs outside soc_codes (no BLS wages), which still count in
+        the total-usage denominator as in calculate_occupation_exposure_*.
+    """
+    task_idx, tasks = pd.factorize(task_df['anthropic_task_description'])
+    usage = task_df['api_usage_count'].to_numpy(dtype=float)
+    task_usage = np.bincount(task_idx, weights=usage, minlength=len(tasks))
+
+    soc_pos = pd.Index(soc_codes).get_indexer(task_df['onet_soc_code'])
+    soc_pos = np.where(soc_pos < 0, len(soc_codes), soc_pos)
+
+    allocation = np.zeros((len(tasks), len(soc_codes) + 1))
+    np.add.at(allocation, (task_idx, soc_pos), usage / task_usage[task_idx])
+    return task_usage, allocation
+
+
+def bootstrap_weights(task_usage, n_replicates, rng, unit=BOOTSTRAP_UNIT):
+    """
+    Draw a multinomial resampling matrix of replicate task usage.
+
+    unit='task': resample the T Anthropic task strings with replacement;
+        replicate usage = multinomial(T, 1/T) counts × task usage.
+    unit='conversation': resample the N = Σ usage API conversations with
+        probability proportional to task usage; replicate usage = counts.
+
+    Returns np.ndarray of shape (n_replicates, T).
+    """
+    n_tasks = len(task_usage)
+    if unit == 'task':
+        counts = rng.multinomial(n_tasks, np.full(n_tasks, 1 / n_tasks), size=n_replicates)
+        return counts * task_usage
+    if unit == 'conversation':
+        n_conversations = int(round(task_usage.sum()))
+        return rng.multinomial(n_conversations, task_usage / task_usage.sum(),
+                               size=n_replicates).astype(float)
+    raise ValueError(f"Unknown bootstrap unit '{unit}' (expected 'task' or 'conversation')")
+
+
+def bootstrap_model_metrics(task_df, occ, n_replicates=N_BOOTSTRAP, unit=BOOTSTRAP_UNIT,
+                            seed=BOOTSTRAP_SEED, config=DEFAULT_CONFIG, chunk_size=500):
+    """
+    Bootstrap occupation exposure and every downstream model metric.
+
+    Occupation exposure for a block of replicates is one matrix product
+    (weights @ allocation); the model closures are then evaluated on the
+    resulting aggregate vectors. Wage and employment shares are held fixed:
+    only the exposure sampling is resampled.
+
+    Parameters
+    ----------
+    task_df : pd.DataFrame
+        Task-level crosswalk under the specification's split rule
+    occ : pd.DataFrame
+        Occupation frame for the same specification (onet_soc_code, TOT_EMP, A_MEAN)
+    n_replicates : int
+        Number of bootstrap replicates
+    unit : {'task', 'conversation'}
+        Resampling unit (see bootstrap_weights)
+    seed : int, optional
+        Seed for the replicate weights
+    config : ModelConfig
+        Behavioral parameters
+    chunk_size : int
+        Replicates per matrix product, to bound memory
+
+    Returns
+    -------
+    dict
+        Metric name -> array of shape (n_replicates,)
+    """
+    rng = np.random.default_rng(seed)
+    task_usage, allocation = task_allocation_matrix(task_df, occ['onet_soc_code'].to_numpy())
+
+    wage_bill = (occ['TOT_EMP'] * occ['A_MEAN']).to_numpy()
+    wage_share = wage_bill / wage_bill.sum()
+    emp_share = (occ['TOT_EMP'] / occ['TOT_EMP'].sum()).to_numpy()
+
+    exposure_share = []
+    emp_weighted = []
+    ge_wage_bill = []
+    for start in range(0, n_replicates, chunk_size):
+        weights = bootstrap_weights(task_usage, min(chunk_size, n_replicates - start), rng, unit)
+        soc_usage = weights @ allocation
+        exposure = soc_usage[:, :-1] / soc_usage.sum(axis=1, keepdims=True)
+        exposure_share.append(exposure @ wage_share)
+        emp_weighted.append(exposure @ emp_share)
+        ge_wage_bill.append(general_equilibrium_batch(exposure, occ, config)['wage_bill_change'])
+    exposure_share = np.concatenate(exposure_share)
+    emp_weighted = np.concatenate(emp_weighted)
+
+    ar = acemoglu_restrepo_batch(exposure_share, config)
+    kalecki = kaleckian_batch(exposure_share, config)
+    bm = bhaduri_marglin_batch(exposure_share, config)
+
+    return {
+        'task_displacement_share': exposure_share,
+        'wage_effect': ar['wage_effect'],
+        'wage_share_effect': exposure_share,
+        'ad_effect': kalecki['ad_effect'],
+        'emp_share_at_risk': emp_weighted,
+        'delta_profit_share': bm['delta_profit_share'],
+        'delta_utilization': bm['delta_utilization'],
+        'output_effect': bm['output_effect'],
+        'regime': bm['regime'],
+        'ge_wage_bill_change': np.concatenate(ge_wage_bill),
+    }
+
+
+def bootstrap_percentile_ci(replicates, level=CI_LEVEL):
+    """Percentile confidence intervals (low, high) for each numeric bootstrap metric."""
+    tail = (1 - level) / 2
+    return {
+        metric: tuple(np.quantile(values, [tail, 1 - tail]))
+        for metric, values in replicates.items()
+        if metric != 'regime'
+    }
+
+
 def save_results(occ_equal, occ_emp, ar_equal, ar_emp, kalecki_equal, kalecki_emp,
-                 bm_equal, bm_emp, routine_equal, routine_emp):
-    """Save occupation-level data and model summary for both specifications."""
+                 bm_equal, bm_emp, routine_equal, routine_emp, ci_equal=None, ci_emp=None,
+                 config=DEFAULT_CONFIG):
+    """
+    Save occupation-level data and model summary for both specifications.
+
+    ci_equal / ci_emp are optional bootstrap percentile intervals
+    (see bootstrap_percentile_ci), written as *_CI_Low / *_CI_High columns.
+    """
 
     # Occupation-level files
     occ_equal.to_csv(OUTPUT_DIR / "occupation_ai_exposure_equal.csv", index=False)
@@ -646,7 +937,7 @@ def save_results(occ_equal, occ_emp, ar_equal, ar_emp, kalecki_equal, kalecki_em
         ],
         'Metric': [
             'Wage-weighted task displacement',
-            f'Predicted wage effect (σ={SIGMA})',
+            f'Predicted wage effect (σ={config.sigma})',
             'Wage share reduction',
             'AD effect (wage-led, with multiplier)',
             'Employment share at risk',
@@ -700,6 +991,19 @@ def save_results(occ_equal, occ_emp, ar_equal, ar_emp, kalecki_equal, kalecki_em
             f"{bm_emp['output_effect']*100:.2f}%"
         ]
     })
+
+    # Bootstrap percentile intervals (exposure sampling uncertainty)
+    summary_keys = [
+        'task_displacement_share', 'wage_effect',
+        'wage_share_effect', 'ad_effect', 'emp_share_at_risk',
+        'delta_profit_share', 'delta_utilization', 'regime', 'output_effect'
+    ]
+    for prefix, ci in [('Equal_Split', ci_equal), ('EmpWeighted', ci_emp)]:
+        if ci is None:
+            continue
+        summary[f'{prefix}_CI_Low'] = [ci.get(key, (np.nan, np.nan))[0] for key in summary_keys]
+        summary[f'{prefix}_CI_High'] = [ci.get(key, (np.nan, np.nan))[1] for key in summary_keys]
+
     summary.to_csv(OUTPUT_DIR / "model_summary.csv", index=False)
 
     # Sensitivity comparison
@@ -738,19 +1042,45 @@ def save_results(occ_equal, occ_emp, ar_equal, ar_emp, kalecki_equal, kalecki_em
     print(f"  - sensitivity_equal_vs_empweighted.csv")
 
 
-def main():
-    """Run all model estimations for both exposure specifications."""
+def run_metrics(results):
+    """
+    Flatten main()'s results into {spec: {metric: value}} for the run store.
+
+    Metric names are '<model>.<key>' (ar, kalecki, bm, ge) and
+    'ci.<key>.low' / 'ci.<key>.high' for bootstrap intervals.
+    """
+    metrics = {}
+    for spec in ('equal', 'empweighted'):
+        models = dict(results[spec], ge=results['general_equilibrium'][spec])
+        flat = {
+            f"{model}.{key}": value
+            for model in ('ar', 'kalecki', 'bm', 'ge')
+            for key, value in models[model].items()
+            if np.isscalar(value) or value is None
+        }
+        for key, (low, high) in (results['bootstrap_ci'][spec] or {}).items():
+            flat[f"ci.{key}.low"] = low
+            flat[f"ci.{key}.high"] = high
+        metrics[spec] = flat
+    return metrics
+
+
+def main(config=DEFAULT_CONFIG):
+    """Run all model estimations for both exposure specifications under one config."""
+    start = time.perf_counter()
+    timings = {}
     print("Loading crosswalk data...")
     df = load_crosswalk()
+    timings['load'] = time.perf_counter() - start
 
     # --- MAIN SPECIFICATION: Equal split ---
     print("\n=== MAIN SPECIFICATION: Equal-split allocation ===")
     occ_equal = calculate_occupation_exposure_equal(df)
     print(f"  - {len(occ_equal)} occupations with wage data")
 
-    ar_equal, occ_equal = acemoglu_restrepo_model(occ_equal)
-    kalecki_equal, occ_equal = kaleckian_model(occ_equal, ar_equal)
-    bm_equal = bhaduri_marglin_model(occ_equal, ar_equal)
+    ar_equal, occ_equal = acemoglu_restrepo_model(occ_equal, config)
+    kalecki_equal, occ_equal = kaleckian_model(occ_equal, ar_equal, config)
+    bm_equal = bhaduri_marglin_model(occ_equal, ar_equal, config)
     routine_equal = routine_analysis(occ_equal)
 
     print(f"  - Task displacement: {ar_equal['task_displacement_share']*100:.2f}%")
@@ -761,9 +1091,9 @@ def main():
     occ_emp = calculate_occupation_exposure_empweighted(df)
     print(f"  - {len(occ_emp)} occupations with wage data")
 
-    ar_emp, occ_emp = acemoglu_restrepo_model(occ_emp)
-    kalecki_emp, occ_emp = kaleckian_model(occ_emp, ar_emp)
-    bm_emp = bhaduri_marglin_model(occ_emp, ar_emp)
+    ar_emp, occ_emp = acemoglu_restrepo_model(occ_emp, config)
+    kalecki_emp, occ_emp = kaleckian_model(occ_emp, ar_emp, config)
+    bm_emp = bhaduri_marglin_model(occ_emp, ar_emp, config)
     routine_emp = routine_analysis(occ_emp)
 
     print(f"  - Task displacement: {ar_emp['task_displacement_share']*100:.2f}%")
@@ -774,15 +1104,40 @@ def main():
     disp_diff = 100 * (ar_emp['task_displacement_share'] - ar_equal['task_displacement_share']) / ar_equal['task_displacement_share'] if ar_equal['task_displacement_share'] != 0 else 0
     print(f"  - Task displacement difference: {disp_diff:+.1f}%")
 
+    # --- Structural benchmark: nested-CES general equilibrium ---
+    print(f"\n=== Nested-CES general equilibrium (σ={config.sigma}, η={config.eta}) ===")
+    ge_equal, occ_equal = general_equilibrium_model(occ_equal, config)
+    ge_emp, occ_emp = general_equilibrium_model(occ_emp, config)
+    for label, ge in [('equal split', ge_equal), ('emp-weighted', ge_emp)]:
+        print(f"  - Wage bill change ({label}): {ge['wage_bill_change']*100:.3f}% "
+              f"(labor share {ge['labor_share']:.4f}, {ge['iterations']} Newton steps)")
+
+    timings['models'] = time.perf_counter() - start - timings['load']
+
+    # --- Bootstrap: exposure sampling uncertainty ---
+    stage = time.perf_counter()
+    print(f"\n=== Bootstrap: {N_BOOTSTRAP:,} {BOOTSTRAP_UNIT} resamples ===")
+    ci_equal = bootstrap_percentile_ci(bootstrap_model_metrics(df, occ_equal, config=config))
+    ci_emp = bootstrap_percentile_ci(
+        bootstrap_model_metrics(reallocate_ambiguous_by_employment(df), occ_emp, config=config)
+    )
+    low, high = ci_equal['wage_effect']
+    print(f"  - Wage effect {CI_LEVEL:.0%} CI (equal split): [{low*100:.2f}%, {high*100:.2f}%]")
+    low, high = ci_equal['ad_effect']
+    print(f"  - AD effect {CI_LEVEL:.0%} CI (equal split): [{low*100:.2f}%, {high*100:.2f}%]")
+    timings['bootstrap'] = time.perf_counter() - stage
+
     # Save all results
     save_results(occ_equal, occ_emp, ar_equal, ar_emp, kalecki_equal, kalecki_emp,
-                 bm_equal, bm_emp, routine_equal, routine_emp)
+                 bm_equal, bm_emp, routine_equal, routine_emp, ci_equal, ci_emp, config)
 
     # --- PARAMETER SENSITIVITY ANALYSIS ---
     print("\n=== Parameter Sensitivity Analysis ===")
-    param_sensitivity = parameter_sensitivity_analysis(occ_equal, ar_equal)
+    stage = time.perf_counter()
+    param_sensitivity = parameter_sensitivity_analysis(occ_equal, ar_equal, config)
     param_sensitivity.to_csv(OUTPUT_DIR / "parameter_sensitivity.csv", index=False)
     print(f"  - Saved: parameter_sensitivity.csv")
+    timings['sensitivity'] = time.perf_counter() - stage
 
     # Print summary of regime shifts
     bm_scenarios = param_sensitivity[param_sensitivity['Model'] == 'Bhaduri-Marglin']
@@ -800,12 +1155,23 @@ def main():
     bm_output = bm_scenarios['Output_Effect'].dropna()
     print(f"  - B-M output range: {bm_output.min()*100:.2f}% to {bm_output.max()*100:.2f}%")
 
-    return {
+    results = {
         'equal': {'ar': ar_equal, 'kalecki': kalecki_equal, 'bm': bm_equal, 'routine': routine_equal},
         'empweighted': {'ar': ar_emp, 'kalecki': kalecki_emp, 'bm': bm_emp, 'routine': routine_emp},
+        'general_equilibrium': {'equal': ge_equal, 'empweighted': ge_emp},
+        'bootstrap_ci': {'equal': ci_equal, 'empweighted': ci_emp},
         'param_sensitivity': param_sensitivity
     }
 
+    # Append this run to the run history (data/runs/)
+    timings['total'] = time.perf_counter() - start
+    run_id = record_run('estimate_models', run_metrics(results), config=config,
+                        inputs=[CROSSWALK_FILE], timings=timings)
+    if run_id is not None:
+        print(f"  - Recorded run {run_id} ({timings['total']:.1f}s)")
+
+    return results
+
 
 if __name__ == '__main__':
     main()
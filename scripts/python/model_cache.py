@@ -0,0 +1,309 @@
+"""
+Memoized Model Evaluation
+=========================
+
+Exploratory notebooks call acemoglu_restrepo_model, kaleckian_model and
+bhaduri_marglin_model repeatedly on the same occupation frame with slightly
+different ModelConfig calibrations. This module fingerprints the inputs the models
+actually read and caches both the occupation-level intermediates and the
+final model outputs, so repeated what-if queries return instantly. A new
+calibration on a known frame reuses the cached intermediates and only runs
+the parameter-dependent closures (estimate_models.*_batch).
+
+Cache keys:
+- Occupation fingerprint: BLAKE2b digest of the TOT_EMP, A_MEAN and
+  ai_exposure arrays (the only occupation columns the models use)
+- Parameter fingerprint: digest of the ModelConfig fields plus its derived
+  g₀, so every distinct calibration gets its own key
+
+Tiers:
+- In-memory LRU bounded by maxsize entries
+- Optional on-disk tier (one pickle per key) shared across sessions
+
+Usage:
+    import estimate_models as em
+    from model_cache import ModelCache, evaluate_models
+
+    cache = ModelCache(maxsize=512, cache_dir=em.DATA_DIR / "cache" / "models")
+    results = evaluate_models(occ, cache=cache)
+    results = evaluate_models(occ, config=em.DEFAULT_CONFIG.replace(sigma=2.0),
+                              cache=cache)   # new key, recomputed once
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+import estimate_models as em
+
+# Occupation columns read by the three models
+FINGERPRINT_COLUMNS = ['TOT_EMP', 'A_MEAN', 'ai_exposure']
+
+DEFAULT_MAXSIZE = 256
+
+
+def fingerprint_occupations(occ):
+    """Digest of the occupation arrays the models depend on (order-sensitive)."""
+    h = hashlib.blake2b(digest_size=16)
+    for col in FINGERPRINT_COLUMNS:
+        h.update(col.encode())
+        h.update(np.ascontiguousarray(occ[col].to_numpy(dtype=np.float64)).tobytes())
+    return h.hexdigest()
+
+
+def _parameter_value(value):
+    """Hashable form of a config field: float for scalars, (shape, values) for arrays."""
+    if value is None:
+        return None
+    if np.ndim(value) == 0:
+        return float(value)
+    array = np.asarray(value, dtype=np.float64)
+    return array.shape, tuple(array.ravel().tolist())
+
+
+def config_parameters(config):
+    """Parameter mapping of a ModelConfig, including the calibrated g₀ (array fields kept whole)."""
+    params = {name: _parameter_value(value) for name, value in config.as_dict().items()}
+    params['g_0'] = _parameter_value(config.g_0)
+    return params
+
+
+def fingerprint_parameters(params):
+    """Digest of a parameter mapping (insensitive to key order)."""
+    payload = repr(sorted(params.items())).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class ModelCache:
+    """
+    Two-tier memo store: bounded in-memory LRU plus optional pickle directory.
+
+    Safe to share between threads (e.g. the scenario server's request handlers).
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries kept in memory (least recently used evicted)
+    cache_dir : Path, optional
+        Directory for the on-disk tier. Disk hits are promoted to memory.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, cache_dir=None):
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _disk_path(self, key):
+        name = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{name}.pkl"
+
+    def get(self, key):
+        """Return the cached value or None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+            if self.cache_dir is not None:
+                path = self._disk_path(key)
+                if path.exists():
+                    with open(path, 'rb') as f:
+                        value = pickle.load(f)
+                    self._store_memory(key, value)
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """Store value in memory (and on disk when a cache_dir is configured)."""
+        with self._lock:
+            self._store_memory(key, value)
+        if self.cache_dir is not None:
+            path = self._disk_path(key)
+            tmp = path.with_suffix(f'.{threading.get_ident()}.tmp')
+            with open(tmp, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(path)
+
+    def _store_memory(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def clear(self, disk=False):
+        """Drop in-memory entries (and the on-disk tier if disk=True)."""
+        with self._lock:
+            self._memory.clear()
+        if disk and self.cache_dir is not None:
+            for path in self.cache_dir.glob("*.pkl"):
+                path.unlink()
+
+    def stats(self):
+        """Hit/miss counters and current memory size."""
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'size': len(self._memory),
+            'maxsize': self.maxsize,
+        }
+
+    def __len__(self):
+        return len(self._memory)
+
+
+DEFAULT_CACHE = ModelCache()
+
+
+def occupation_intermediates(occ, cache=None):
+    """
+    Parameter-free occupation quantities shared by all three models.
+
+    Cached by occupation fingerprint only, so they are computed once per
+    exposure frame regardless of how many parameter sets are explored.
+
+    Returns dict with wage_bill / wage_share / emp_share arrays and the
+    total_wage_bill, total_emp, wage_at_risk, emp_at_risk, exposure_share
+    and emp_weighted_exposure totals.
+    """
+    cache = cache if cache is not None else DEFAULT_CACHE
+    key = ('intermediates', fingerprint_occupations(occ))
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    emp = occ['TOT_EMP'].to_numpy(dtype=np.float64)
+    wage = occ['A_MEAN'].to_numpy(dtype=np.float64)
+    exposure = occ['ai_exposure'].to_numpy(dtype=np.float64)
+
+    wage_bill = emp * wage
+    total_wage_bill = wage_bill.sum()
+    total_emp = emp.sum()
+    wage_share = wage_bill / total_wage_bill
+    emp_share = emp / total_emp
+
+    intermediates = {
+        'wage_bill': wage_bill,
+        'wage_share': wage_share,
+        'emp_share': emp_share,
+        'total_wage_bill': total_wage_bill,
+        'total_emp': total_emp,
+        'wage_at_risk': (wage_bill * exposure).sum(),
+        'emp_at_risk': (emp * exposure).sum(),
+        'exposure_share': (wage_share * exposure).sum(),
+        'emp_weighted_exposure': (emp_share * exposure).sum(),
+    }
+    for value in intermediates.values():
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+    cache.put(key, intermediates)
+    return intermediates
+
+
+def models_from_intermediates(intermediates, config=em.DEFAULT_CONFIG):
+    """
+    The three model result dicts from cached occupation intermediates.
+
+    Same outputs as acemoglu_restrepo_model → kaleckian_model →
+    bhaduri_marglin_model, but only the parameter-dependent closures
+    (em.*_batch) run; the occupation frame is never copied or re-aggregated.
+    """
+    exposure_share = intermediates['exposure_share']
+    wage_fraction_at_risk = intermediates['wage_at_risk'] / intermediates['total_wage_bill']
+
+    ar = {k: float(v) for k, v in em.acemoglu_restrepo_batch(exposure_share, config).items()}
+    ar_results = {
+        'exposure_share': exposure_share,
+        'task_displacement_share': exposure_share,
+        'emp_weighted_exposure': intermediates['emp_weighted_exposure'],
+        'wage_effect': ar['wage_effect'],
+        'displacement_effect': ar['displacement_effect'],
+        'productivity_effect': ar['productivity_effect'],
+        'sigma': config.sigma,
+        'alpha': config.alpha,
+        'phi': config.phi,
+        'total_wage_bill': intermediates['total_wage_bill'],
+    }
+
+    kalecki = {k: float(v) for k, v in em.kaleckian_batch(wage_fraction_at_risk, config).items()}
+    kalecki_results = {
+        'wage_at_risk': intermediates['wage_at_risk'],
+        'wage_fraction_at_risk': wage_fraction_at_risk,
+        'wage_share_effect': wage_fraction_at_risk,
+        'delta_omega': kalecki['delta_omega'],
+        'consumption_effect': kalecki['consumption_effect'],
+        'multiplier': kalecki['multiplier'],
+        'aggregate_mpc': kalecki['aggregate_mpc'],
+        'ad_effect': kalecki['ad_effect'],
+        'emp_at_risk': intermediates['emp_at_risk'],
+        'emp_share_at_risk': intermediates['emp_at_risk'] / intermediates['total_emp'],
+        'c_w': config.c_w,
+        'c_pi': config.c_pi,
+        'omega_baseline': config.wage_share_baseline,
+    }
+
+    bm = {k: v[()] for k, v in em.bhaduri_marglin_batch(wage_fraction_at_risk, config).items()}
+    delta_u = float(bm['delta_utilization'])
+    delta_profit_share = float(bm['delta_profit_share'])
+    partial_u_partial_pi = float(bm['partial_u_partial_pi'])
+    sigma_before = config.saving_rate_baseline
+    bm_results = {
+        'profit_share_baseline': config.profit_share_baseline,
+        'profit_share_new': config.profit_share_baseline + delta_profit_share,
+        'delta_profit_share': delta_profit_share,
+        'wage_fraction_at_risk': wage_fraction_at_risk,
+        'u_star_before': config.u_baseline,     # g₀ is calibrated so that u*(π₀) = u_baseline
+        'u_star_after': float(bm['u_star_after']),
+        'delta_utilization': delta_u,
+        'partial_u_partial_pi': partial_u_partial_pi,
+        'regime': "profit-led" if partial_u_partial_pi > 0 else "wage-led",
+        'output_effect': float(bm['output_effect']),
+        'investment_effect': config.g_u * delta_u + config.g_pi * delta_profit_share,
+        'savings_effect': sigma_before * delta_u + config.u_baseline * (config.s_pi - config.s_w) * delta_profit_share,
+        's_w': config.s_w,
+        's_pi': config.s_pi,
+        'g_u': config.g_u,
+        'g_pi': config.g_pi,
+        'g_0': config.g_0,
+        'sigma_baseline': sigma_before,
+    }
+    return {'ar': ar_results, 'kalecki': kalecki_results, 'bm': bm_results}
+
+
+def evaluate_models(occ, config=em.DEFAULT_CONFIG, cache=None):
+    """
+    Memoized evaluation of all three models on one occupation frame.
+
+    On a miss the occupation intermediates are fetched (computed once per
+    exposure frame) and only the parameter-dependent closures run; on a hit
+    the stored result dicts are returned as fresh copies.
+
+    Returns
+    -------
+    dict
+        {'ar': ..., 'kalecki': ..., 'bm': ...} result dicts
+    """
+    cache = cache if cache is not None else DEFAULT_CACHE
+    key = ('models', fingerprint_occupations(occ), fingerprint_parameters(config_parameters(config)))
+    cached = cache.get(key)
+    if cached is None:
+        cached = models_from_intermediates(occupation_intermediates(occ, cache), config)
+        cache.put(key, cached)
+    return {name: dict(results) for name, results in cached.items()}
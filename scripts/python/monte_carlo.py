@@ -0,0 +1,251 @@
+"""
+Monte Carlo Uncertainty Propagation for the Macro Models
+========================================================
+
+estimate_models.py reports point estimates at one calibration of the
+behavioral parameters. This script draws those parameters from priors
+spanning the literature ranges (Stockhammer 2011/2017, Onaran & Galanis 2014,
+Acemoglu & Restrepo 2018) and propagates every draw through the
+Acemoglu-Restrepo, Kaleckian and Bhaduri-Marglin closures.
+
+All three models depend on the occupation frame only through two aggregates:
+- exposure_share = Σ wage_share_i × ai_exposure_i  (= wage fraction at risk)
+- emp_share_at_risk = Σ emp_share_i × ai_exposure_i
+
+so each draw is pure scalar algebra and the models are evaluated with the
+vectorized closures in estimate_models over whole batches of draws. Batches
+are split across a process pool, each with an independent numpy SeedSequence
+stream, and reduced to quantiles and regime probabilities.
+
+Usage:
+    python monte_carlo.py --draws 1000000 --workers 8 --seed 20260115
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from estimate_models import (
+    DEFAULT_CONFIG,
+    OUTPUT_DIR,
+    REGIME_LABELS,
+    acemoglu_restrepo_batch,
+    acemoglu_restrepo_model,
+    bhaduri_marglin_batch,
+    calculate_occupation_exposure_empweighted,
+    calculate_occupation_exposure_equal,
+    kaleckian_batch,
+    kaleckian_model,
+    load_crosswalk,
+)
+
+# --- PRIORS ---
+# (distribution, *args). Ranges follow the literature comments and the
+# scenario grid in estimate_models.parameter_sensitivity_analysis.
+#   uniform:    (low, high)
+#   triangular: (low, mode, high)
+#   normal:     (mean, sd, low, high)  -- truncated by clipping to [low, high]
+#   fixed:      (value,)
+DEFAULT_PRIORS = {
+    # Acemoglu-Restrepo
+    'sigma': ('uniform', 1.0, 2.5),       # Elasticity of substitution between tasks
+    'alpha': ('uniform', 0.5, 1.0),       # Displacement rate
+    'phi': ('fixed', 0.0),                # Productivity effect (pessimistic case)
+    # Kaleckian
+    'c_w': ('uniform', 0.70, 0.85),       # MPC out of wages
+    'c_pi': ('uniform', 0.30, 0.50),      # MPC out of profits
+    # Bhaduri-Marglin
+    's_w': ('uniform', 0.05, 0.15),       # Onaran & Galanis (2014): 0.05-0.15
+    's_pi': ('uniform', 0.35, 0.55),      # Propensity to save out of profits
+    'g_u': ('uniform', 0.05, 0.15),       # Accelerator
+    'g_pi': ('uniform', 0.03, 0.15),      # Profitability effect on investment
+}
+
+DEFAULT_QUANTILES = (0.05, 0.25, 0.50, 0.75, 0.95)
+DEFAULT_CHUNK_SIZE = 250_000
+
+# Outputs kept per draw (everything else is reduced away inside the workers)
+OUTPUT_METRICS = [
+    ('Acemoglu-Restrepo', 'wage_effect', 'Predicted wage effect'),
+    ('Kaleckian', 'multiplier', 'Multiplier (derived from class MPCs)'),
+    ('Kaleckian', 'ad_effect', 'AD effect (wage-led, with multiplier)'),
+    ('Bhaduri-Marglin', 'delta_utilization', 'Change in capacity utilization'),
+    ('Bhaduri-Marglin', 'output_effect', 'Output effect'),
+    ('Bhaduri-Marglin', 'partial_u_partial_pi', '∂u*/∂π (regime indicator)'),
+]
+
+
+def draw_parameters(priors, n_draws, rng):
+    """
+    Draw n_draws parameter vectors from the priors.
+
+    Returns dict of parameter name -> array of shape (n_draws,).
+    """
+    draws = {}
+    for name, spec in priors.items():
+        dist, args = spec[0], spec[1:]
+        if dist == 'uniform':
+            draws[name] = rng.uniform(args[0], args[1], n_draws)
+        elif dist == 'triangular':
+            draws[name] = rng.triangular(args[0], args[1], args[2], n_draws)
+        elif dist == 'normal':
+            draws[name] = np.clip(rng.normal(args[0], args[1], n_draws), args[2], args[3])
+        elif dist == 'fixed':
+            draws[name] = np.full(n_draws, float(args[0]))
+        else:
+            raise ValueError(f"Unknown prior distribution '{dist}' for parameter '{name}'")
+    return draws
+
+
+def simulate_batch(aggregates, config):
+    """
+    Evaluate all three models for one batch of parameter draws.
+
+    config is a ModelConfig whose fields hold the draw arrays.
+    """
+    out = {}
+    out.update(acemoglu_restrepo_batch(aggregates['exposure_share'], config))
+    out.update(kaleckian_batch(aggregates['wage_fraction_at_risk'], config))
+    out.update(bhaduri_marglin_batch(aggregates['wage_fraction_at_risk'], config))
+    return out
+
+
+def _simulate_chunk(args):
+    """Process-pool worker: draw and simulate one chunk from its own seed stream."""
+    aggregates, base_config, priors, n_draws, seed_seq = args
+    rng = np.random.default_rng(seed_seq)
+    config = base_config.replace(**draw_parameters(priors, n_draws, rng))
+    out = simulate_batch(aggregates, config)
+    kept = {key: np.ascontiguousarray(out[key]) for _, key, _ in OUTPUT_METRICS}
+    kept['regime'] = out['regime']
+    return kept
+
+
+def model_aggregates(occ, config=DEFAULT_CONFIG):
+    """
+    Reduce an occupation frame to the scalar aggregates the models depend on.
+
+    Runs the point-estimate models once so the Monte Carlo shares their exact
+    wage-bill and exposure accounting.
+    """
+    ar_results, occ = acemoglu_restrepo_model(occ, config)
+    kalecki_results, _ = kaleckian_model(occ, ar_results, config)
+    return {
+        'exposure_share': ar_results['exposure_share'],
+        'wage_fraction_at_risk': kalecki_results['wage_fraction_at_risk'],
+        'emp_share_at_risk': kalecki_results['emp_share_at_risk'],
+    }
+
+
+def run_monte_carlo(occ, priors=None, n_draws=100_000, seed=None, n_workers=None,
+                    chunk_size=DEFAULT_CHUNK_SIZE, config=DEFAULT_CONFIG):
+    """
+    Propagate parameter uncertainty through all three models.
+
+    Parameters
+    ----------
+    occ : pd.DataFrame
+        Occupation-level exposure frame (output of calculate_occupation_exposure_*)
+    priors : dict, optional
+        Parameter name -> prior spec. Missing parameters fall back to DEFAULT_PRIORS.
+    n_draws : int
+        Total number of parameter draws
+    seed : int, optional
+        Root entropy for the SeedSequence; each chunk gets an independent child stream
+    n_workers : int, optional
+        Process pool size. Defaults to os.cpu_count(); 1 runs in-process.
+    chunk_size : int
+        Draws per task submitted to the pool
+    config : ModelConfig
+        Calibration for every parameter without a prior (e.g. u_baseline,
+        wage_share_baseline); drawn parameters replace its fields
+
+    Returns
+    -------
+    dict
+        Arrays of per-draw outputs keyed by metric, plus 'regime' codes
+    """
+    priors = {**DEFAULT_PRIORS, **(priors or {})}
+    aggregates = model_aggregates(occ, config)
+
+    n_chunks = max(1, -(-n_draws // chunk_size))
+    sizes = [chunk_size] * (n_chunks - 1) + [n_draws - chunk_size * (n_chunks - 1)]
+    streams = np.random.SeedSequence(seed).spawn(n_chunks)
+    tasks = [(aggregates, config, priors, size, stream) for size, stream in zip(sizes, streams)]
+
+    n_workers = min(n_workers or os.cpu_count() or 1, n_chunks)
+    if n_workers == 1:
+        chunks = [_simulate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            chunks = list(pool.map(_simulate_chunk, tasks))
+
+    return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+
+
+def summarize_draws(draws, quantiles=DEFAULT_QUANTILES):
+    """
+    Reduce per-draw outputs to means, quantiles and regime probabilities.
+
+    Returns DataFrame with one row per metric.
+    """
+    rows = []
+    for model, key, label in OUTPUT_METRICS:
+        values = draws[key]
+        row = {'Model': model, 'Metric': label, 'Mean': values.mean(), 'SD': values.std()}
+        for q, value in zip(quantiles, np.quantile(values, quantiles)):
+            row[f'Q{int(round(q * 100)):02d}'] = value
+        rows.append(row)
+
+    regime_counts = np.bincount(draws['regime'], minlength=len(REGIME_LABELS))
+    for code, label in REGIME_LABELS.items():
+        rows.append({
+            'Model': 'Bhaduri-Marglin',
+            'Metric': f'P(regime = {label})',
+            'Mean': regime_counts[code] / len(draws['regime']),
+        })
+
+    return pd.DataFrame(rows)
+
+
+def main(n_draws=1_000_000, n_workers=None, seed=None):
+    """Run the Monte Carlo for both exposure specifications and save the summary."""
+    print("Loading crosswalk data...")
+    df = load_crosswalk()
+
+    summaries = []
+    for spec, builder in [('equal_split', calculate_occupation_exposure_equal),
+                          ('employment_weighted', calculate_occupation_exposure_empweighted)]:
+        print(f"\n=== Monte Carlo: {spec} ({n_draws:,} draws) ===")
+        occ = builder(df)
+        start = time.perf_counter()
+        draws = run_monte_carlo(occ, n_draws=n_draws, seed=seed, n_workers=n_workers)
+        elapsed = time.perf_counter() - start
+
+        summary = summarize_draws(draws)
+        summary.insert(0, 'Specification', spec)
+        summaries.append(summary)
+
+        print(f"  - Completed in {elapsed:.2f}s")
+        print(summary.drop(columns='Specification').to_string(index=False))
+
+    summary = pd.concat(summaries, ignore_index=True)
+    summary.to_csv(OUTPUT_DIR / "monte_carlo_summary.csv", index=False)
+    print(f"\nResults saved to {OUTPUT_DIR}/monte_carlo_summary.csv")
+    return summary
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--draws', type=int, default=1_000_000, help='Number of parameter draws')
+    parser.add_argument('--workers', type=int, default=None, help='Process pool size')
+    parser.add_argument('--seed', type=int, default=None, help='Root seed for SeedSequence')
+    args = parser.parse_args()
+    main(n_draws=args.draws, n_workers=args.workers, seed=args.seed)
@@ -0,0 +1,317 @@
+"""
+Bhaduri-Marglin Regime Maps
+===========================
+
+bhaduri_marglin_model classifies a single calibration as wage-led or
+profit-led from the sign of ∂u*/∂π. This script evaluates the same closure
+over dense 2D/3D parameter grids (e.g. g_π × s_π × s_w) and records, at
+every grid point:
+- u*: equilibrium utilization after the AI shock
+- Δu: change in utilization caused by the shock
+- ∂u*/∂π: regime indicator at the baseline profit share
+- regime: wage-led / profit-led / unstable (σ(π₀) - g_u <= 0)
+
+Grids are evaluated by broadcasting ModelConfig fields over chunks of the
+first axis, so memory stays bounded for grids like 1000³. Each chunk is
+written as a compressed .npz file (float32 maps, int8 regime codes), and the
+wage-led/profit-led boundary surface is extracted on the fly by linear
+interpolation of ∂u*/∂π between neighbouring grid points of opposite sign.
+A saved map can be reopened with RegimeMap.load and queried without
+recomputing.
+
+Usage:
+    python regime_map.py --resolution 201
+    python regime_map.py --axes g_pi s_pi --resolution 1001
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from estimate_models import (
+    DEFAULT_CONFIG,
+    OUTPUT_DIR,
+    REGIME_LABELS,
+    REGIME_UNSTABLE,
+    bhaduri_marglin_batch,
+    calculate_occupation_exposure_equal,
+    load_crosswalk,
+)
+from monte_carlo import model_aggregates
+
+# --- CONFIGURATION ---
+# Literature ranges (Stockhammer 2017, Onaran & Galanis 2014), widened so the
+# maps reach the profit-led region (and, with g_u on an axis, the unstable one)
+AXIS_RANGES = {
+    'g_pi': (0.00, 0.30),   # Investment sensitivity to profit share
+    's_pi': (0.30, 0.70),   # Propensity to save out of profits
+    's_w': (0.00, 0.20),    # Propensity to save out of wages
+    'g_u': (0.02, 0.25),    # Investment sensitivity to utilization
+}
+DEFAULT_AXES = ('g_pi', 's_pi', 's_w')
+DEFAULT_RESOLUTION = 201
+MAX_CELLS_PER_CHUNK = 1_000_000   # Grid points evaluated per broadcast
+
+MAP_FIELDS = ('u_star_after', 'delta_utilization', 'partial_u_partial_pi')
+MAP_DIR = OUTPUT_DIR / "regime_map"
+
+
+def make_axes(names=DEFAULT_AXES, resolution=DEFAULT_RESOLUTION):
+    """Evenly spaced grid axes over AXIS_RANGES for the named parameters."""
+    return {name: np.linspace(*AXIS_RANGES[name], resolution) for name in names}
+
+
+def _grid_config(config, axes, rows):
+    """Config whose axis fields are broadcastable arrays for grid rows `rows` of axis 0."""
+    names = list(axes)
+    ndim = len(names)
+    fields = {}
+    for d, name in enumerate(names):
+        values = axes[name][rows] if d == 0 else axes[name]
+        shape = [1] * ndim
+        shape[d] = len(values)
+        fields[name] = values.reshape(shape)
+    return config.replace(**fields)
+
+
+def _crossings(values, partial, regime, axis):
+    """
+    Boundary crossings between adjacent stable points of opposite regime along one axis.
+
+    Returns (index, coordinate) where index is the grid index of the lower
+    point and coordinate the interpolated root of ∂u*/∂π on that axis.
+    """
+    lo = [slice(None)] * partial.ndim
+    hi = [slice(None)] * partial.ndim
+    lo[axis] = slice(None, -1)
+    hi[axis] = slice(1, None)
+    lo, hi = tuple(lo), tuple(hi)
+
+    mask = ((regime[lo] != regime[hi])
+            & (regime[lo] != REGIME_UNSTABLE) & (regime[hi] != REGIME_UNSTABLE))
+    index = np.nonzero(mask)
+    p_lo, p_hi = partial[lo][index], partial[hi][index]
+    k = index[axis]
+    t = p_lo / (p_lo - p_hi)
+    coordinate = values[k] + t * (values[k + 1] - values[k])
+    return index, coordinate
+
+
+def _boundary_points(axes, partial, regime, row_offset, dims=None):
+    """
+    Interpolated boundary points (n, ndim) inside one chunk.
+
+    partial/regime cover rows row_offset: of axis 0; dims restricts the axes
+    searched for crossings (default all).
+    """
+    names = list(axes)
+    points = []
+    for d, name in enumerate(names):
+        if (dims is not None and d not in dims) or partial.shape[d] < 2:
+            continue
+        values = axes[name][row_offset:row_offset + partial.shape[0]] if d == 0 else axes[name]
+        index, coordinate = _crossings(values, partial, regime, d)
+        coords = np.empty((len(coordinate), len(names)))
+        for j, other in enumerate(names):
+            if j == d:
+                coords[:, j] = coordinate
+            elif j == 0:
+                coords[:, j] = axes[other][index[j] + row_offset]
+            else:
+                coords[:, j] = axes[other][index[j]]
+        points.append(coords)
+    return np.concatenate(points) if points else np.empty((0, len(names)))
+
+
+class RegimeMap:
+    """
+    Chunked regime map over a parameter grid.
+
+    Chunks are kept in memory, or read lazily from a directory written by
+    build_regime_map(out_dir=...). Fields are MAP_FIELDS plus 'regime'.
+    """
+
+    def __init__(self, axes, row_bounds, boundary, meta, chunks=None, directory=None):
+        self.axes = axes
+        self.row_bounds = row_bounds
+        self.boundary = boundary
+        self.meta = meta
+        self._chunks = chunks
+        self.directory = Path(directory) if directory is not None else None
+
+    @property
+    def shape(self):
+        """Grid shape, one entry per axis."""
+        return tuple(len(values) for values in self.axes.values())
+
+    @classmethod
+    def load(cls, directory):
+        """Open a saved map; chunk arrays are read on demand."""
+        directory = Path(directory)
+        with np.load(directory / "axes.npz") as f:
+            names = json.loads(str(f['names']))
+            axes = {name: f[name] for name in names}
+            row_bounds = f['row_bounds']
+        with np.load(directory / "boundary.npz") as f:
+            boundary = f['points']
+        meta = json.loads((directory / "meta.json").read_text())
+        return cls(axes, row_bounds, boundary, meta, directory=directory)
+
+    def chunk(self, k):
+        """Arrays for chunk k (rows row_bounds[k]:row_bounds[k+1] of axis 0)."""
+        if self._chunks is not None:
+            return self._chunks[k]
+        with np.load(self.directory / f"chunk_{k:05d}.npz") as f:
+            return {name: f[name] for name in f.files}
+
+    def field(self, name):
+        """Full array of one field (materializes the whole grid)."""
+        return np.concatenate([self.chunk(k)[name] for k in range(len(self.row_bounds) - 1)])
+
+    def index_of(self, **coords):
+        """Nearest grid index for parameter values given by axis name."""
+        return tuple(int(np.abs(values - coords[name]).argmin())
+                     for name, values in self.axes.items())
+
+    def value(self, name, **coords):
+        """Field value at the grid point nearest to coords (reads one chunk)."""
+        index = self.index_of(**coords)
+        k = int(np.searchsorted(self.row_bounds, index[0], side='right') - 1)
+        local = (index[0] - self.row_bounds[k],) + index[1:]
+        return self.chunk(k)[name][local]
+
+    def regime_at(self, **coords):
+        """Regime label at the grid point nearest to coords."""
+        return REGIME_LABELS[int(self.value('regime', **coords))]
+
+    def regime_shares(self):
+        """Share of grid points in each regime."""
+        counts = np.zeros(len(REGIME_LABELS), dtype=np.int64)
+        for k in range(len(self.row_bounds) - 1):
+            counts += np.bincount(self.chunk(k)['regime'].ravel(), minlength=len(REGIME_LABELS))
+        return {label: counts[code] / counts.sum() for code, label in REGIME_LABELS.items()}
+
+    def frontier(self):
+        """Wage-led/profit-led boundary points as a DataFrame with one column per axis."""
+        return pd.DataFrame(self.boundary, columns=list(self.axes))
+
+
+def build_regime_map(wage_fraction_at_risk, axes, config=DEFAULT_CONFIG, out_dir=None,
+                     max_cells=MAX_CELLS_PER_CHUNK, dtype=np.float32):
+    """
+    Evaluate the Bhaduri-Marglin closure over the Cartesian grid of `axes`.
+
+    Parameters
+    ----------
+    wage_fraction_at_risk : float
+        AI shock (wage fraction at risk) from the exposure specification
+    axes : dict
+        Parameter name -> 1D array of grid values (ModelConfig field names);
+        1 to 3 axes are typical, any number is supported
+    config : ModelConfig
+        Values of every parameter not on a grid axis
+    out_dir : Path, optional
+        Directory for compressed chunk files; None keeps the map in memory
+    max_cells : int
+        Grid points per broadcast chunk (chunks split axis 0)
+    dtype : numpy dtype
+        Storage precision of the float maps (boundary uses float64)
+
+    Returns
+    -------
+    RegimeMap
+    """
+    axes = {name: np.asarray(values, dtype=np.float64) for name, values in axes.items()}
+    shape = tuple(len(values) for values in axes.values())
+    rows_per_chunk = max(1, max_cells // max(1, int(np.prod(shape[1:]))))
+    row_bounds = np.append(np.arange(0, shape[0], rows_per_chunk), shape[0])
+
+    if out_dir is not None:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for stale in out_dir.glob("chunk_*.npz"):
+            stale.unlink()
+
+    chunks = [] if out_dir is None else None
+    boundary = []
+    previous = None   # Last axis-0 slice of the previous chunk (for cross-chunk crossings)
+    for k, (start, stop) in enumerate(zip(row_bounds[:-1], row_bounds[1:])):
+        bm = bhaduri_marglin_batch(wage_fraction_at_risk, _grid_config(config, axes, slice(start, stop)))
+        partial = np.broadcast_to(bm['partial_u_partial_pi'], (stop - start,) + shape[1:])
+        regime = np.broadcast_to(bm['regime'], partial.shape)
+
+        if previous is not None:
+            # Crossings between the last row of the previous chunk and the first row of this one
+            boundary.append(_boundary_points(
+                axes, np.concatenate([previous[0], partial[:1]]),
+                np.concatenate([previous[1], regime[:1]]), start - 1, dims=(0,)
+            ))
+        boundary.append(_boundary_points(axes, partial, regime, start))
+        previous = (partial[-1:].copy(), regime[-1:].copy())
+
+        arrays = {name: np.broadcast_to(bm[name], partial.shape).astype(dtype) for name in MAP_FIELDS}
+        arrays['regime'] = np.ascontiguousarray(regime, dtype=np.int8)
+        if out_dir is None:
+            chunks.append(arrays)
+        else:
+            np.savez_compressed(out_dir / f"chunk_{k:05d}.npz", **arrays)
+
+    boundary = np.concatenate(boundary) if boundary else np.empty((0, len(axes)))
+    meta = {
+        'wage_fraction_at_risk': float(wage_fraction_at_risk),
+        'config': {name: value for name, value in config.as_dict().items() if name not in axes},
+        'regime_codes': {label: code for code, label in REGIME_LABELS.items()},
+    }
+
+    if out_dir is not None:
+        np.savez_compressed(out_dir / "axes.npz", names=json.dumps(list(axes)),
+                            row_bounds=row_bounds, **axes)
+        np.savez_compressed(out_dir / "boundary.npz", points=boundary)
+        (out_dir / "meta.json").write_text(json.dumps(meta, indent=2))
+
+    return RegimeMap(axes, row_bounds, boundary, meta, chunks=chunks, directory=out_dir)
+
+
+def main(axis_names=DEFAULT_AXES, resolution=DEFAULT_RESOLUTION, out_dir=MAP_DIR):
+    """Build and save the regime map for the equal-split exposure specification."""
+    print("Loading crosswalk data...")
+    df = load_crosswalk()
+    occ = calculate_occupation_exposure_equal(df)
+    wfr = model_aggregates(occ)['wage_fraction_at_risk']
+
+    axes = make_axes(axis_names, resolution)
+    n_cells = int(np.prod([len(v) for v in axes.values()]))
+    print(f"\n=== Regime map: {' × '.join(axes)} at {resolution} points per axis ({n_cells:,} cells) ===")
+
+    start = time.perf_counter()
+    regime_map = build_regime_map(wfr, axes, out_dir=out_dir)
+    elapsed = time.perf_counter() - start
+    print(f"  - Completed in {elapsed:.2f}s ({len(regime_map.row_bounds) - 1} chunks)")
+
+    for label, share in regime_map.regime_shares().items():
+        print(f"  - {label}: {share*100:.1f}% of grid")
+    print(f"  - Boundary points: {len(regime_map.boundary):,}")
+
+    baseline = {name: getattr(DEFAULT_CONFIG, name) for name in axes}
+    print(f"  - Baseline calibration {baseline}: {regime_map.regime_at(**baseline)}")
+
+    print(f"\nMaps saved to {out_dir}/")
+    return regime_map
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--axes', nargs='+', default=list(DEFAULT_AXES), choices=list(AXIS_RANGES),
+                        help='Parameters spanned by the grid')
+    parser.add_argument('--resolution', type=int, default=DEFAULT_RESOLUTION,
+                        help='Grid points per axis')
+    parser.add_argument('--out-dir', type=Path, default=MAP_DIR, help='Output directory')
+    args = parser.parse_args()
+    main(tuple(args.axes), args.resolution, args.out_dir)
@@ -0,0 +1,301 @@
+"""
+Local Scenario Server
+=====================
+
+Long-running local service for model queries. estimate_models.main re-reads
+the crosswalk and recomputes both exposure specifications on every run;
+this server loads the crosswalk, both occupation tables and the wage panel
+once, keeps them in memory, and answers queries from a shared warm cache
+(model_cache.ModelCache), so repeated questions return in milliseconds.
+
+Requests are served concurrently (one thread per connection) over HTTP on
+localhost, or over a Unix domain socket with --socket.
+
+Endpoints (GET, JSON responses; model parameters are ModelConfig field
+names passed as query parameters, e.g. ?sigma=2.0&c_w=0.75):
+    /health                       Liveness and load time
+    /models?spec=equal&...        A-R, Kaleckian, B-M and nested-CES GE results
+    /sensitivity?spec=equal&...   parameter_sensitivity_analysis table
+    /distribution?spec=equal      Wage-quintile and routine-task analysis
+    /occupation?soc=15-1252       Exposure rows and wage-panel history for one SOC
+    /cache                        Cache statistics
+
+spec is 'equal' (main specification) or 'empweighted' (robustness).
+
+Usage:
+    python scenario_server.py --port 8765
+    python scenario_server.py --socket /tmp/crosswalk.sock
+    curl 'http://127.0.0.1:8765/models?spec=equal&sigma=2.0'
+    curl --unix-socket /tmp/crosswalk.sock 'http://localhost/cache'
+
+Author: Ilan Strauss | AI Disclosures Project
+Date: January 2026
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import socketserver
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+import estimate_models as em
+from model_cache import ModelCache, config_parameters, evaluate_models, fingerprint_occupations, \
+    fingerprint_parameters
+
+# --- CONFIGURATION ---
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+CACHE_SIZE = 1024
+WAGE_PANEL_FILE = em.DATA_DIR / "processed" / "wage_panel_2022_2024.csv"
+
+SPECIFICATIONS = ('equal', 'empweighted')
+CONFIG_FIELDS = {field.name for field in dataclasses.fields(em.ModelConfig)}
+
+
+class QueryError(ValueError):
+    """Bad request parameters (returned to the client as HTTP 400)."""
+
+
+def to_json(value):
+    """Convert model outputs (numpy scalars/arrays, DataFrames) to JSON-serializable types."""
+    if isinstance(value, dict):
+        return {str(k): to_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json(v) for v in value]
+    if isinstance(value, pd.DataFrame):
+        return to_json(value.to_dict(orient='records'))
+    if isinstance(value, np.ndarray):
+        return to_json(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+class ScenarioService:
+    """
+    In-memory data and warm result cache shared by all request handlers.
+
+    Data frames are built once at start-up and treated as read-only;
+    results are memoized in a thread-safe ModelCache keyed by occupation and
+    config fingerprints.
+    """
+
+    def __init__(self, cache_size=CACHE_SIZE):
+        start = time.perf_counter()
+        self.crosswalk = em.load_crosswalk()
+        self.occupations = {
+            'equal': em.calculate_occupation_exposure_equal(self.crosswalk),
+            'empweighted': em.calculate_occupation_exposure_empweighted(self.crosswalk),
+        }
+        self.fingerprints = {spec: fingerprint_occupations(occ) for spec, occ in self.occupations.items()}
+        self.wage_panel = pd.read_csv(WAGE_PANEL_FILE) if WAGE_PANEL_FILE.exists() else None
+        self.cache = ModelCache(maxsize=cache_size)
+        self.load_seconds = time.perf_counter() - start
+        self.started = time.time()
+
+    # --- request parsing ---
+
+    def _spec(self, params):
+        spec = params.pop('spec', 'equal')
+        if spec not in SPECIFICATIONS:
+            raise QueryError(f"spec must be one of {SPECIFICATIONS}, got '{spec}'")
+        return spec
+
+    def _config(self, params):
+        unknown = set(params) - CONFIG_FIELDS
+        if unknown:
+            raise QueryError(f"Unknown parameter(s): {', '.join(sorted(unknown))}")
+        try:
+            changes = {name: float(value) for name, value in params.items()}
+            return em.DEFAULT_CONFIG.replace(**changes)
+        except ValueError as e:
+            raise QueryError(str(e))
+
+    def _memoized(self, kind, spec, config, compute):
+        key = (kind, self.fingerprints[spec],
+               fingerprint_parameters(config_parameters(config)) if config is not None else None)
+        cached = self.cache.get(key)
+        if cached is None:
+            cached = compute()
+            self.cache.put(key, cached)
+        return cached
+
+    # --- endpoints ---
+
+    def health(self, params):
+        return {
+            'status': 'ok',
+            'load_seconds': self.load_seconds,
+            'uptime_seconds': time.time() - self.started,
+            'occupations': {spec: len(occ) for spec, occ in self.occupations.items()},
+            'wage_panel_rows': 0 if self.wage_panel is None else len(self.wage_panel),
+        }
+
+    def models(self, params):
+        spec = self._spec(params)
+        config = self._config(params)
+        occ = self.occupations[spec]
+        results = evaluate_models(occ, config=config, cache=self.cache)
+        results['ge'] = self._memoized('ge', spec, config,
+                                       lambda: em.general_equilibrium_model(occ, config)[0])
+        return {'spec': spec, 'config': config.as_dict(), 'results': results}
+
+    def sensitivity(self, params):
+        spec = self._spec(params)
+        config = self._config(params)
+
+        def compute():
+            ar_results, occ = em.acemoglu_restrepo_model(self.occupations[spec], config)
+            _, occ = em.kaleckian_model(occ, ar_results, config)
+            return em.parameter_sensitivity_analysis(occ, ar_results, config)
+
+        return {'spec': spec, 'sensitivity': self._memoized('sensitivity', spec, config, compute)}
+
+    def distribution(self, params):
+        spec = self._spec(params)
+        if params:
+            raise QueryError(f"Unknown parameter(s): {', '.join(sorted(params))}")
+
+        def compute():
+            ar_results, occ = em.acemoglu_restrepo_model(self.occupations[spec], em.DEFAULT_CONFIG)
+            _, occ = em.kaleckian_model(occ, ar_results, em.DEFAULT_CONFIG)
+            return {
+                'wage_quintiles': em.distributional_analysis(occ),
+                'routine': em.routine_analysis(occ),
+            }
+
+        return {'spec': spec, **self._memoized('distribution', spec, None, compute)}
+
+    def occupation(self, params):
+        soc = params.pop('soc', None)
+        if not soc:
+            raise QueryError("Missing required parameter 'soc' (e.g. soc=15-1252)")
+        rows = {
+            spec: occ[occ['onet_soc_code'].str.startswith(soc)]
+            for spec, occ in self.occupations.items()
+        }
+        panel = None
+        if self.wage_panel is not None:
+            panel = self.wage_panel[self.wage_panel['soc_code'] == soc[:7]].sort_values('year')
+        return {'soc': soc, 'exposure': rows, 'wage_panel': panel}
+
+    def cache_stats(self, params):
+        return self.cache.stats()
+
+    def routes(self):
+        return {
+            '/health': self.health,
+            '/models': self.models,
+            '/sensitivity': self.sensitivity,
+            '/distribution': self.distribution,
+            '/occupation': self.occupation,
+            '/cache': self.cache_stats,
+        }
+
+
+def make_handler(service):
+    """Request handler class bound to one ScenarioService."""
+    routes = service.routes()
+
+    class ScenarioHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            endpoint = routes.get(url.path.rstrip('/') or '/health')
+            start = time.perf_counter()
+            if endpoint is None:
+                status, body = 404, {'error': f"Unknown endpoint '{url.path}'", 'endpoints': sorted(routes)}
+            else:
+                try:
+                    status, body = 200, to_json(endpoint(params))
+                except QueryError as e:
+                    status, body = 400, {'error': str(e)}
+                except Exception as e:
+                    # Answer anyway: the client is waiting on a keep-alive connection
+                    self.log_error("%s raised %s: %s", self.path, type(e).__name__, e)
+                    traceback.print_exc()
+                    status, body = 500, {'error': f"{type(e).__name__}: {e}"}
+            body = to_json(body)
+            if isinstance(body, dict):
+                body['elapsed_ms'] = (time.perf_counter() - start) * 1000
+
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def address_string(self):
+            # Unix socket peers have no (host, port) address
+            return self.client_address[0] if self.client_address else 'unix'
+
+        def log_message(self, format, *args):
+            if not self.server.quiet:
+                super().log_message(format, *args)
+
+        def log_error(self, format, *args):
+            # Errors are logged even when access logging is off
+            super().log_message(format, *args)
+
+    return ScenarioHandler
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server on a Unix domain socket."""
+    daemon_threads = True
+
+
+def make_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, quiet=False):
+    """Build (but do not start) a threaded HTTP server for the service."""
+    handler = make_handler(service)
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = UnixHTTPServer(str(socket_path), handler)
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+        server.daemon_threads = True
+    server.quiet = quiet
+    return server
+
+
+def main(host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, quiet=False):
+    """Load data once and serve queries until interrupted."""
+    print("Loading crosswalk, occupation tables and wage panel...")
+    service = ScenarioService()
+    print(f"  - Loaded in {service.load_seconds:.2f}s "
+          f"({', '.join(f'{s}: {len(o)} occupations' for s, o in service.occupations.items())})")
+
+    server = make_server(service, host, port, socket_path, quiet)
+    where = socket_path if socket_path is not None else f"http://{host}:{port}"
+    print(f"\nServing on {where} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down")
+    finally:
+        server.server_close()
+        if socket_path is not None and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--host', default=DEFAULT_HOST, help='Bind address (localhost only by default)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='TCP port')
+    parser.add_argument('--socket', default=None, help='Serve on this Unix socket path instead of TCP')
+    parser.add_argument('--quiet', action='store_true', help='Do not log each request')
+    args = parser.parse_args()
+    main(args.host, args.port, args.socket, args.quiet)